@@ -9,4 +9,7 @@ pip install -r requirements.txt
 # Collect static files
 python manage.py collectstatic --noinput --clear
 
+# Precompute the OpenAPI schema (hash-keyed gzip artifact)
+python manage.py build_schema
+
 echo "Build completed!"
\ No newline at end of file
@@ -1,7 +1,125 @@
 from django.contrib import admin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.forms.models import BaseInlineFormSet
+from django.utils.functional import cached_property
+
 from .import models as m
+from .services import search, webhooks
  
 
+# ───────────────────────────────
+#  Full-text admin search
+# ───────────────────────────────
+class FullTextSearchMixin:
+    """
+    Routes the changelist search box through the SearchDocument index.
+    `search_path` is the lookup to the indexed object ("pk" or an FK such as
+    "evaluation"); local `search_fields` (plain columns) are OR-ed in.
+    """
+    search_kind = None
+    search_path = "pk"
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        ids = search.matching(self.search_kind, search_term).values("object_id")
+        indexed = queryset.filter(**{f"{self.search_path}__in": ids})
+        if self.search_path == "pk":
+            return indexed, False
+        own, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        return own | indexed, may_have_duplicates
+
+
+# ───────────────────────────────
+#  Performance mode (large tables)
+# ───────────────────────────────
+class EstimatedCountPaginator(Paginator):
+    """
+    Unfiltered changelists on PostgreSQL take the row count from the planner
+    statistics (pg_class.reltuples) instead of a full-table COUNT(*); small
+    tables, filtered lists and other backends count exactly.
+    """
+    exact_below = 10_000
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        connection = connections[qs.db]
+        if connection.vendor == "postgresql" and not qs.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                               [qs.model._meta.db_table])
+                row = cursor.fetchone()
+            if row and row[0] >= self.exact_below:  # -1 = never analyzed
+                return row[0]
+        return super().count
+
+
+class CachedValuesFilter(admin.AllValuesFieldListFilter):
+    """`list_filter` over a plain column whose SELECT DISTINCT is cached."""
+    cache_seconds = 300
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        key = f"admin-filter:{model._meta.label_lower}:{field_path}"
+        choices = cache.get(key)
+        if choices is None:
+            choices = list(self.lookup_choices)
+            cache.set(key, choices, self.cache_seconds)
+        self.lookup_choices = choices
+
+
+class PerformanceModeMixin:
+    """
+    • estimated counts + no second "N total" COUNT(*) query;
+    • subclasses set `list_select_related` for every FK in `list_display`.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """Shows one page of the related rows; the page is `?<model>_page=`."""
+    per_page = 20
+    page_param = "page"
+    request = None
+
+    def get_queryset(self):
+        if not hasattr(self, "page"):
+            number = self.request.GET.get(self.page_param) if self.request is not None else None
+            self.page = Paginator(super().get_queryset(), self.per_page).get_page(number)
+            self._queryset = self.page.object_list
+        return self._queryset
+
+    def page_links(self):
+        self.get_queryset()  # sets self.page
+        paginator = self.page.paginator
+        if paginator.num_pages <= 1:
+            return []
+        params, links = self.request.GET.copy(), []
+        for number in paginator.get_elided_page_range(self.page.number, on_each_side=2, on_ends=1):
+            if number == paginator.ELLIPSIS:
+                links.append({"number": number})
+                continue
+            params[self.page_param] = number
+            links.append({"number": number, "url": f"?{params.urlencode()}", "current": number == self.page.number})
+        return links
+
+
+class PaginatedInlineMixin:
+    per_page = 20
+    formset = PaginatedInlineFormSet
+    template = "admin/edit_inline/paginated_tabular.html"
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.request, formset.per_page = request, self.per_page
+        formset.page_param = f"{self.model._meta.model_name}_page"
+        return formset
+
+
 # ───────────────────────────────
 #  Basic inline helpers
 # ───────────────────────────────
@@ -37,10 +155,12 @@ class CompanyAdmin(admin.ModelAdmin):
 #  Department
 # ───────────────────────────────
 @admin.register(m.Department)
-class DepartmentAdmin(admin.ModelAdmin):
+class DepartmentAdmin(PerformanceModeMixin, admin.ModelAdmin):
     list_display = ("name", "company", "manager", "employee_count")
+    list_select_related = ("company", "manager")
     search_fields = ("name", "company__name", "manager__name")
     autocomplete_fields = ["company", "manager"]
+    readonly_fields = ("employee_count",)  # maintained by signals
 
 
 
@@ -50,10 +170,12 @@ class DepartmentAdmin(admin.ModelAdmin):
 #  Employee
 # ───────────────────────────────
 @admin.register(m.Employee)
-class EmployeeAdmin(admin.ModelAdmin):
+class EmployeeAdmin(PerformanceModeMixin, FullTextSearchMixin, admin.ModelAdmin):
     list_display = ("user", "managerial_level", "status", "company", "join_date")
+    list_select_related = ("user", "company")
     list_filter  = ("managerial_level", "status", "company")
-    search_fields = ("user__name", "user__email")
+    search_fields = ("user__name", "user__email")  # served by the search index
+    search_kind = m.SearchKind.EMPLOYEE
     autocomplete_fields = ["user", "company"]
     inlines = [EmployeeDepartmentInline, EmployeeObjectiveInline, EmployeeCompetencyInline]
 
@@ -72,42 +194,139 @@ class WeightConfigAdmin(admin.ModelAdmin):
 # ───────────────────────────────
 #  Objective & Competency templates
 # ───────────────────────────────
+def _effective(field):
+    """Changelist column with the effective value of a template-backed row."""
+    @admin.display(description=field.replace("_", " "))
+    def column(self, obj):
+        return obj.effective(field)
+    return column
+
+
+@admin.register(m.ObjectiveTemplate)
+class ObjectiveTemplateAdmin(admin.ModelAdmin):
+    list_display = ("title", "company", "department", "managerial_level", "weight", "is_active")
+    list_select_related = ("company", "department")
+    list_filter = ("is_active", "managerial_level")
+    search_fields = ("title",)
+    autocomplete_fields = ["department"]
+
+
+@admin.register(m.CompetencyTemplate)
+class CompetencyTemplateAdmin(admin.ModelAdmin):
+    list_display = ("name", "company", "department", "managerial_level", "category",
+                    "required_level", "weight", "is_active")
+    list_select_related = ("company", "department")
+    list_filter = ("is_active", "category", "managerial_level")
+    search_fields = ("name",)
+    autocomplete_fields = ["department"]
+
+
 @admin.register(m.Objective)
-class ObjectiveAdmin(admin.ModelAdmin):
-    list_display = ("title", "evaluation", "weight", "status")
-    autocomplete_fields = ["evaluation"]
+class ObjectiveAdmin(PerformanceModeMixin, FullTextSearchMixin, admin.ModelAdmin):
+    list_display = ("effective_title", "evaluation", "effective_weight", "status")
+    list_select_related = ("evaluation", "template")
+    autocomplete_fields = ["evaluation", "template"]
     list_filter = ("status",)
-    search_fields = ("title", "evaluation__employee__user__name")
+    search_fields = ("title", "template__title")  # + evaluation's employee via the search index
+    search_kind, search_path = m.SearchKind.EVALUATION, "evaluation"
+
+    effective_title  = _effective("title")
+    effective_weight = _effective("weight")
 
 
 @admin.register(m.Competency)
-class CompetencyAdmin(admin.ModelAdmin):
-    list_display = ("name", "evaluation", "category", "weight",
-                    "required_level", "actual_level")
-    autocomplete_fields = ["evaluation"]
+class CompetencyAdmin(PerformanceModeMixin, FullTextSearchMixin, admin.ModelAdmin):
+    list_display = ("effective_name", "evaluation", "effective_category", "effective_weight",
+                    "effective_required_level", "actual_level")
+    list_select_related = ("evaluation", "template")
+    autocomplete_fields = ["evaluation", "template"]
     list_filter = ("category",)
-    search_fields = ("name", "evaluation__employee__user__name")
+    search_fields = ("name", "template__name")  # + evaluation's employee via the search index
+    search_kind, search_path = m.SearchKind.EVALUATION, "evaluation"
+
+    effective_name           = _effective("name")
+    effective_category       = _effective("category")
+    effective_weight         = _effective("weight")
+    effective_required_level = _effective("required_level")
 
 
 # ───────────────────────────────
 #  Evaluation
 # ───────────────────────────────
-class ObjectiveInline(admin.TabularInline):
+class ObjectiveInline(PaginatedInlineMixin, admin.TabularInline):
     model = m.Objective
     extra = 0
-    autocomplete_fields = ["evaluation"]
+    ordering = ("created_at",)
+    autocomplete_fields = ["evaluation", "template"]
 
 
-class CompetencyInline(admin.TabularInline):
+class CompetencyInline(PaginatedInlineMixin, admin.TabularInline):
     model = m.Competency
     extra = 0
-    autocomplete_fields = ["evaluation"]
+    ordering = ("created_at",)
+    autocomplete_fields = ["evaluation", "template"]
 
 
 @admin.register(m.Evaluation)
-class EvaluationAdmin(admin.ModelAdmin):
+class EvaluationAdmin(PerformanceModeMixin, FullTextSearchMixin, admin.ModelAdmin):
     list_display = ("employee", "period", "type", "status", "reviewer", "created_at")
-    list_filter  = ("type", "status", "period")
-    search_fields = ("employee__user__name", "reviewer__name", "period")
+    list_filter  = ("type", "status", ("period", CachedValuesFilter))
+    list_select_related = ("employee", "reviewer")
+    search_fields = ("employee__user__name", "reviewer__name", "period")  # served by the search index
+    search_kind = m.SearchKind.EVALUATION
     autocomplete_fields = ["employee", "reviewer"]
     inlines = [ObjectiveInline, CompetencyInline]
+
+
+@admin.register(m.ArchivedEvaluation)
+class ArchivedEvaluationAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    list_display = ("evaluation_id", "employee", "period", "type", "score", "archived_at")
+    list_filter  = ("type", ("period", CachedValuesFilter))
+    list_select_related = ("employee__user",)
+    readonly_fields = [f.name for f in m.ArchivedEvaluation._meta.fields]
+
+    def has_add_permission(self, request):
+        return False  # stubs are written by services/archive.py
+
+
+# ───────────────────────────────
+#  Outbound webhooks
+# ───────────────────────────────
+@admin.register(m.WebhookSubscription)
+class WebhookSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ("url", "company", "event_types", "is_active", "created_at")
+    list_filter  = ("is_active",)
+    list_select_related = ("company",)
+    readonly_fields = ("secret",)
+
+
+@admin.register(m.WebhookDeadLetter)
+class WebhookDeadLetterAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    list_display = ("event", "subscription", "attempts", "failed_at")
+    list_filter  = ("event",)
+    list_select_related = ("subscription",)
+    readonly_fields = [f.name for f in m.WebhookDeadLetter._meta.fields]
+    actions = ["requeue"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description="Requeue selected deliveries")
+    def requeue(self, request, queryset):
+        letters = list(queryset.select_related("subscription"))
+        webhooks.requeue(letters)
+        self.message_user(request, f"{len(letters)} deliveries requeued.")
+
+
+# ───────────────────────────────
+#  Background jobs
+# ───────────────────────────────
+@admin.register(m.Job)
+class JobAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    list_display = ("kind", "status", "progress", "attempts", "company", "created_by", "created_at", "finished_at")
+    list_filter  = ("status", ("kind", CachedValuesFilter))
+    list_select_related = ("company", "created_by")
+    readonly_fields = [f.name for f in m.Job._meta.fields]
+
+    def has_add_permission(self, request):
+        return False  # jobs are enqueued by the app (services/jobs.py)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EvaluationAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'evaluation_app'
+
+    def ready(self):
+        from evaluation_app import signals  # noqa: F401  (connect receivers)
+        from evaluation_app.services import tasks  # noqa: F401  (register job handlers)
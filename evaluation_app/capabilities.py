@@ -0,0 +1,156 @@
+# evaluation_app/capabilities.py
+"""
+Role → capability resolution.
+
+• `resolve(user)` returns the user's `CapabilitySet` (capabilities + the
+  employee/company ids permission code keeps asking for).  It is computed
+  once, kept on the user object for the request and in the shared default
+  cache (CACHE_URL) across requests, so every worker sees an invalidation.
+  A cached entry is discarded when the user's role or that role's
+  capabilities no longer match it, and signals drop it when the role or
+  the employee profile changes.
+• `CapabilityPermission` (permissions.py) checks a view's
+  `required_capabilities` against that set — no permission objects composed
+  per request.
+• `scope()` applies object-level access to a whole queryset as one SQL
+  filter (all / managed / self), so list responses never run per-object
+  checks.
+"""
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from evaluation_app.models import Employee, EmployeeDepartment
+from evaluation_app.services import hierarchy
+
+CACHE_TIMEOUT = 60 * 60
+
+
+class Cap:
+    EMPLOYEE_READ_ALL        = "employee.read_all"
+    EMPLOYEE_READ_MANAGED    = "employee.read_managed"
+    EMPLOYEE_READ_SELF       = "employee.read_self"
+    EMPLOYEE_UPDATE_ALL      = "employee.update_all"
+    EMPLOYEE_UPDATE_MANAGED  = "employee.update_managed"
+    EMPLOYEE_CREATE          = "employee.create"
+    EMPLOYEE_DELETE          = "employee.delete"
+    REPORTING_LINE_MANAGE    = "reporting_line.manage"
+
+    EVALUATION_READ_ALL       = "evaluation.read_all"
+    EVALUATION_READ_MANAGED   = "evaluation.read_managed"
+    EVALUATION_READ_SELF      = "evaluation.read_self"
+    EVALUATION_UPDATE_ALL     = "evaluation.update_all"
+    EVALUATION_UPDATE_MANAGED = "evaluation.update_managed"
+    EVALUATION_CREATE_ALL     = "evaluation.create_all"
+    EVALUATION_CREATE_MANAGED = "evaluation.create_managed"
+    EVALUATION_LAUNCH_CYCLE   = "evaluation.launch_cycle"
+    TEMPLATES_MANAGE          = "templates.manage"
+
+    DEPARTMENTS_READ   = "departments.read"
+    DEPARTMENTS_MANAGE = "departments.manage"
+
+    ANALYTICS_VIEW = "analytics.view"
+    JOBS_READ_ALL  = "jobs.read_all"
+    CHANGES_READ   = "changes.read"
+    WEBHOOKS_MANAGE = "webhooks.manage"
+    PROFILING       = "system.profiling"
+
+
+_EVERYONE = {Cap.EMPLOYEE_READ_SELF, Cap.EVALUATION_READ_SELF, Cap.DEPARTMENTS_READ}
+_MANAGERS = _EVERYONE | {
+    Cap.EMPLOYEE_READ_MANAGED, Cap.EMPLOYEE_UPDATE_MANAGED,
+    Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_UPDATE_MANAGED, Cap.EVALUATION_CREATE_MANAGED,
+}
+_ADMIN_HR = _MANAGERS | {
+    Cap.EMPLOYEE_READ_ALL, Cap.EMPLOYEE_UPDATE_ALL, Cap.EMPLOYEE_CREATE, Cap.EMPLOYEE_DELETE,
+    Cap.REPORTING_LINE_MANAGE,
+    Cap.EVALUATION_READ_ALL, Cap.EVALUATION_UPDATE_ALL, Cap.EVALUATION_CREATE_ALL,
+    Cap.EVALUATION_LAUNCH_CYCLE, Cap.TEMPLATES_MANAGE, Cap.DEPARTMENTS_MANAGE,
+    Cap.ANALYTICS_VIEW, Cap.JOBS_READ_ALL, Cap.CHANGES_READ, Cap.WEBHOOKS_MANAGE,
+}
+ROLE_CAPABILITIES = {
+    "ADMIN": frozenset(_ADMIN_HR | {Cap.PROFILING}),
+    "HR":    frozenset(_ADMIN_HR),
+    "HOD":   frozenset(_MANAGERS | {Cap.ANALYTICS_VIEW}),
+    "LM":    frozenset(_MANAGERS),
+    "EMP":   frozenset(_EVERYONE),
+}
+
+
+@dataclass(frozen=True)
+class CapabilitySet:
+    role: str
+    caps: frozenset
+    employee_id: object = None   # the user's Employee profile, if any
+    company_id: object = None
+
+    def __contains__(self, cap):
+        return cap in self.caps
+
+    def any(self, caps):
+        return not self.caps.isdisjoint(caps)
+
+
+ANONYMOUS = CapabilitySet(role="", caps=frozenset())
+
+
+def _key(user_pk):
+    return f"caps:{user_pk}"
+
+
+def resolve(user):
+    if not getattr(user, "is_authenticated", False):
+        return ANONYMOUS
+    resolved = getattr(user, "_capabilities", None)
+    if resolved is not None and resolved.role == user.role:
+        return resolved
+
+    role_caps = ROLE_CAPABILITIES.get(user.role, frozenset())
+    resolved = cache.get(_key(user.pk))
+    if resolved is None or resolved.role != user.role or resolved.caps != role_caps:  # stale entry
+        profile = Employee.objects.filter(user=user).values_list("pk", "company_id").first()
+        employee_id, company_id = profile or (None, None)
+        resolved = CapabilitySet(user.role, role_caps, employee_id, company_id)
+        cache.set(_key(user.pk), resolved, timeout=CACHE_TIMEOUT)
+    user._capabilities = resolved
+    return resolved
+
+
+def invalidate(user_pk):
+    cache.delete(_key(user_pk))
+
+
+# ── queryset-level object access ───────────────────────────────────────
+def managed_employees_q(user, field="pk"):
+    """Employees in departments `user` manages or in their reporting subtree."""
+    in_departments = EmployeeDepartment.objects.filter(department__manager=user).values("employee_id")
+    return Q(**{f"{field}__in": in_departments}) | Q(**{f"{field}__in": hierarchy.reports_of_user(user)})
+
+
+# resource → field holding the employee the row belongs to
+OWNER_FIELDS = {"employee": "pk", "evaluation": "employee_id"}
+
+
+def scope(user, queryset, resource, verb="read", field=None):
+    """
+    Narrow `queryset` to the rows `user` may `verb`:
+    `<resource>.<verb>_all` → everything, else the union of `_managed`
+    and `_self` as one WHERE clause (subqueries, no joins → no DISTINCT).
+    `field` overrides OWNER_FIELDS for querysets of related rows, e.g.
+    objectives scoped by "evaluation__employee_id".
+    """
+    caps = resolve(user)
+    if f"{resource}.{verb}_all" in caps:
+        return queryset
+    field, q = field or OWNER_FIELDS[resource], Q(pk__in=[])
+    if f"{resource}.{verb}_managed" in caps:
+        q |= managed_employees_q(user, field)
+    if f"{resource}.{verb}_self" in caps and caps.employee_id is not None:
+        q |= Q(**{field: caps.employee_id})
+    return queryset.filter(q)
+
+
+def manages(user, employee_id):
+    """Single EXISTS: is `employee_id` within the employees `user` manages?"""
+    return Employee.objects.filter(managed_employees_q(user), pk=employee_id).exists()
@@ -0,0 +1,75 @@
+# evaluation_app/filters.py
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from evaluation_app.services import periods, search
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    `?search=` backed by the SearchDocument index instead of SearchFilter's
+    `ILIKE '%x%'` joins.  Views set `search_kind` (a SearchKind value).
+    """
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        ids = search.matching(view.search_kind, query).values("object_id")
+        return queryset.filter(pk__in=ids)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            "name": self.search_param,
+            "required": False,
+            "in": "query",
+            "description": "Full-text prefix search (all terms must match).",
+            "schema": {"type": "string"},
+        }]
+
+
+def period_bound(params, name, end=False):
+    """Query parameter `name` as a range bound (see services.periods.bound), or None."""
+    value = params.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        return periods.bound(value, end=end)
+    except ValueError:
+        raise ValidationError({name: "Use a period (2025, 2025-Q1, 2025-H1, 2025-03) or a YYYY-MM-DD date."})
+
+
+class PeriodRangeFilter(BaseFilterBackend):
+    """
+    `?period_from=` / `?period_to=` (a period like 2025, 2025-Q1 or an ISO
+    date) select evaluations whose parsed period lies inside the range, as
+    an index range scan on `period_start`.  `?period_year=` / `?period_quarter=`
+    match the parsed columns exactly.
+    """
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        start = period_bound(params, "period_from")
+        end = period_bound(params, "period_to", end=True)
+        if start is not None or end is not None:
+            queryset = queryset.filter(periods.within(start, end))
+        for field in ("period_year", "period_quarter"):
+            if params.get(field):
+                if not params[field].isdigit():
+                    raise ValidationError({field: "Must be an integer."})
+                queryset = queryset.filter(**{field: int(params[field])})
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        described = {
+            "period_from": ("string", "Earliest period or date (inclusive), e.g. 2025-Q1."),
+            "period_to": ("string", "Latest period or date (inclusive), e.g. 2025-Q4."),
+            "period_year": ("integer", "Parsed period year."),
+            "period_quarter": ("integer", "Parsed period quarter (1-4)."),
+        }
+        return [
+            {"name": name, "required": False, "in": "query", "description": text, "schema": {"type": kind}}
+            for name, (kind, text) in described.items()
+        ]
+
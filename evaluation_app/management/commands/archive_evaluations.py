@@ -0,0 +1,27 @@
+# evaluation_app/management/commands/archive_evaluations.py
+from django.core.management.base import BaseCommand
+
+from evaluation_app.services import archive
+
+
+class Command(BaseCommand):
+    help = """
+    Move COMPLETED evaluations older than the N most recent periods (per
+    company) into compressed archive segments under ARCHIVE_DIR, leaving
+    ArchivedEvaluation stubs.  Archived evaluations stay readable through
+    the API.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep", type=int, default=4, help="Most recent periods to keep hot.")
+        parser.add_argument("--company", help="Only this company id.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived.")
+
+    def handle(self, *args, **opts):
+        count = archive.archive(
+            max(1, opts["keep"]), company_id=opts["company"], batch_size=opts["batch_size"],
+            dry_run=opts["dry_run"], progress=lambda done: self.stdout.write(f"… {done} archived"),
+        )
+        verb = "would be archived" if opts["dry_run"] else "archived"
+        self.stdout.write(self.style.SUCCESS(f"✅  {count} evaluations {verb}."))
@@ -0,0 +1,88 @@
+# evaluation_app/management/commands/bench_db_connections.py
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark connection setup under concurrent load against PostgreSQL
+    (point DATABASE_URL or --dsn at a local instance, e.g. docker postgres:16).
+    Compares a fresh connection per request (no pool) with a psycopg_pool
+    pool sized like the DB_POOL_* settings.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dsn", help="libpq conninfo/URL; defaults to the 'default' database.")
+        parser.add_argument("--requests", type=int, default=500, help="Total simulated requests per mode.")
+        parser.add_argument("--concurrency", type=int, default=20, help="Concurrent worker threads.")
+        parser.add_argument("--pool-min", type=int, default=2)
+        parser.add_argument("--pool-max", type=int, default=10)
+
+    def handle(self, *args, **opts):
+        try:
+            import psycopg
+            from psycopg_pool import ConnectionPool
+        except ImportError as exc:
+            raise CommandError("psycopg and psycopg_pool are required (pip install -r requirements.txt).") from exc
+
+        if opts["dsn"]:
+            conninfo, kwargs = opts["dsn"], {}
+        elif connection.vendor == "postgresql":
+            conninfo, kwargs = "", connection.get_connection_params()
+        else:
+            raise CommandError("The default database is not PostgreSQL; pass --dsn.")
+        kwargs["autocommit"] = True
+
+        # ─── mode 1: new connection per request ─────────
+        def direct():
+            t0 = time.perf_counter()
+            conn = psycopg.connect(conninfo, **kwargs)
+            acquired = time.perf_counter()
+            conn.execute("SELECT 1")
+            conn.close()
+            return acquired - t0, time.perf_counter() - t0
+
+        self._report("no pool", self._run(direct, opts))
+
+        # ─── mode 2: health-checked pool ────────────────
+        pool = ConnectionPool(
+            conninfo, kwargs=kwargs, min_size=opts["pool_min"], max_size=opts["pool_max"],
+            check=ConnectionPool.check_connection, open=True,
+        )
+        pool.wait()  # warm: min_size connections established before timing
+
+        def pooled():
+            t0 = time.perf_counter()
+            with pool.connection() as conn:
+                acquired = time.perf_counter()
+                conn.execute("SELECT 1")
+            return acquired - t0, time.perf_counter() - t0
+
+        try:
+            self._report(f"pool {opts['pool_min']}..{opts['pool_max']}", self._run(pooled, opts))
+        finally:
+            pool.close()
+
+    def _run(self, fn, opts):
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=opts["concurrency"]) as ex:
+            samples = list(ex.map(lambda _: fn(), range(opts["requests"])))
+        return samples, time.perf_counter() - t0
+
+    def _report(self, label, result):
+        samples, wall = result
+        acquire = sorted(s[0] * 1000 for s in samples)
+        total = sorted(s[1] * 1000 for s in samples)
+        self.stdout.write(
+            f"{label:>12}: acquire mean {statistics.mean(acquire):7.2f} ms  "
+            f"p50 {statistics.median(acquire):7.2f}  p95 {self._p95(acquire):7.2f}  |  "
+            f"request p95 {self._p95(total):7.2f} ms  |  {len(samples) / wall:8.1f} req/s"
+        )
+
+    @staticmethod
+    def _p95(xs):
+        return xs[max(int(len(xs) * 0.95) - 1, 0)]
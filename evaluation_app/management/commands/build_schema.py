@@ -0,0 +1,33 @@
+# evaluation_app/management/commands/build_schema.py
+import gzip
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hr_evaluation import schema
+
+
+class Command(BaseCommand):
+    help = "Render the OpenAPI schema once into a hash-keyed gzip artifact served by /api/schema/."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true",
+                            help="Only verify an artifact exists for the current sources (CI).")
+
+    def handle(self, *args, **opts):
+        schema_hash = schema.source_hash()
+        path = schema.artifact_path(schema_hash)
+
+        if opts["check"]:
+            if not path.exists():
+                raise CommandError(f"Schema artifact is stale: {path.name} missing, run build_schema.")
+            self.stdout.write(self.style.SUCCESS(f"✅  {path.name} is up to date."))
+            return
+
+        path = schema.build_artifact()
+        gz = path.read_bytes()
+        raw = gzip.decompress(gz)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅  Wrote {path} ({len(json.loads(raw)['paths'])} paths, "
+            f"{len(raw) // 1024} KiB → {len(gz) // 1024} KiB gzip)."
+        ))
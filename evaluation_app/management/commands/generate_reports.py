@@ -0,0 +1,34 @@
+# evaluation_app/management/commands/generate_reports.py
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluation_app.models import Evaluation
+from evaluation_app.services import reports
+
+
+class Command(BaseCommand):
+    help = """
+    Write a zip of per-employee evaluation reports (services/reports.py),
+    rendered in REPORT_WORKERS processes.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Path of the zip file to write.")
+        parser.add_argument("--period", help="Only this period, e.g. 2025-Q1.")
+        parser.add_argument("--type", help="Only this evaluation type.")
+        parser.add_argument("--company", help="Only this company id.")
+        parser.add_argument("--format", default="html", choices=reports.FORMATS)
+
+    def handle(self, *args, **opts):
+        qs = Evaluation.objects.for_tenant(opts["company"])
+        if opts["period"]:
+            qs = qs.filter(period=opts["period"])
+        if opts["type"]:
+            qs = qs.filter(type=opts["type"])
+        ids = list(qs.order_by("period", "employee__user__name", "pk").values_list("pk", flat=True))
+        if not ids:
+            raise CommandError("No evaluations match.")
+
+        with open(opts["output"], "wb") as fh:
+            for chunk in reports.zip_stream(ids, opts["format"]):
+                fh.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"✅  {len(ids)} reports written to {opts['output']}."))
@@ -0,0 +1,115 @@
+# evaluation_app/management/commands/profile_startup.py
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Runs in a fresh interpreter (under -X importtime) so nothing is pre-imported:
+# import the WSGI app exactly like Vercel does, then serve one request.
+PROBE = r"""
+import io, json, sys, time
+t0 = time.perf_counter()
+from hr_evaluation.wsgi import application
+t1 = time.perf_counter()
+status = []
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "HTTP_HOST": "localhost",
+    "wsgi.input": io.BytesIO(), "wsgi.errors": sys.stderr, "wsgi.url_scheme": "http",
+    "wsgi.version": (1, 0), "wsgi.multithread": False, "wsgi.multiprocess": False,
+    "wsgi.run_once": True,
+}
+body = b"".join(application(environ, lambda s, h, e=None: status.append(s)))
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_request_ms": (t2 - t1) * 1000,
+                  "status": status[0] if status else None, "bytes": len(body)}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile a serverless cold start: per-module import time of the WSGI app "
+        "plus the time to serve the first request, checked against COLD_START_TARGET_MS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/",
+                            help="Route requested after import (default: /api/).")
+        parser.add_argument("--top", type=int, default=25,
+                            help="Number of modules to list.")
+        parser.add_argument("--sort", choices=("self", "cumulative"), default="cumulative",
+                            help="Order modules by self or cumulative import time.")
+        parser.add_argument("--target-ms", type=float, default=settings.COLD_START_TARGET_MS,
+                            help="Fail when import + first request exceeds this budget.")
+        parser.add_argument("--lazy", action="store_true",
+                            help="Profile with LAZY_IMPORTS=true regardless of the environment.")
+        parser.add_argument("--runs", type=int, default=5,
+                            help="Fresh interpreters to start; the median run is reported "
+                                 "(single cold starts vary by ±20%%).")
+
+    def handle(self, *args, **opts):
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", "hr_evaluation.settings")
+        if opts["lazy"]:
+            env["LAZY_IMPORTS"] = "true"
+
+        probes = []
+        for _ in range(max(1, opts["runs"])):
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", PROBE, opts["path"]],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                raise CommandError(f"Startup probe failed:\n{proc.stderr[-2000:]}")
+            timing = json.loads(proc.stdout.strip().splitlines()[-1])
+            probes.append((timing["import_ms"] + timing["first_request_ms"], timing, proc.stderr))
+        probes.sort(key=lambda probe: probe[0])
+        _, timing, stderr = probes[len(probes) // 2]   # the median run
+        modules = self._parse_importtime(stderr)
+
+        # ─── per module ───────────────────────────────────
+        key = 0 if opts["sort"] == "self" else 1
+        self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for name, self_us, cum_us in sorted(modules, key=lambda m: m[key + 1], reverse=True)[: opts["top"]]:
+            self.stdout.write(f"{self_us / 1000:9.1f} {cum_us / 1000:9.1f}  {name}")
+
+        # ─── per top-level package ────────────────────────
+        per_pkg = defaultdict(int)
+        for name, self_us, _ in modules:
+            per_pkg[name.split(".")[0]] += self_us
+        self.stdout.write("\nself time by package:")
+        for pkg, us in sorted(per_pkg.items(), key=lambda kv: kv[1], reverse=True)[:10]:
+            self.stdout.write(f"{us / 1000:9.1f}  {pkg}")
+
+        # ─── cold start vs. target ────────────────────────
+        total = timing["import_ms"] + timing["first_request_ms"]
+        self.stdout.write(
+            f"\nimport hr_evaluation.wsgi: {timing['import_ms']:.1f} ms, "
+            f"first GET {opts['path']} ({timing['status']}): {timing['first_request_ms']:.1f} ms, "
+            f"total {total:.1f} ms (target {opts['target_ms']:.0f} ms, {len(modules)} modules)"
+        )
+        if len(probes) > 1:
+            self.stdout.write(
+                f"median of {len(probes)} runs (min {probes[0][0]:.1f} ms, max {probes[-1][0]:.1f} ms, "
+                f"stdev {statistics.pstdev(p[0] for p in probes):.1f} ms)"
+            )
+        if total > opts["target_ms"]:
+            raise CommandError(f"Cold start {total:.1f} ms exceeds target {opts['target_ms']:.0f} ms.")
+        self.stdout.write(self.style.SUCCESS("✅  Cold start within target."))
+
+    @staticmethod
+    def _parse_importtime(stderr):
+        """`import time: <self us> | <cumulative us> | <indent><module>` → [(module, self, cumulative)]."""
+        modules = []
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+            modules.append((name.strip(), int(self_us), int(cum_us)))
+        return modules
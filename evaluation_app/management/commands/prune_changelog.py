@@ -0,0 +1,18 @@
+# evaluation_app/management/commands/prune_changelog.py
+from django.core.management.base import BaseCommand
+
+from evaluation_app.services import changes
+
+
+class Command(BaseCommand):
+    help = """
+    Delete change-feed entries older than --days (services/changes.py).
+    Clients whose mark is older get 410 from /api/changes/ and resync.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30)
+
+    def handle(self, *args, **opts):
+        deleted = changes.prune(max(1, opts["days"]))
+        self.stdout.write(self.style.SUCCESS(f"✅  {deleted} change log entries pruned."))
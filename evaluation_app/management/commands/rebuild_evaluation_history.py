@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from evaluation_app.models import Employee
+from evaluation_app.services import history
+
+
+class Command(BaseCommand):
+    help = "Rebuild every EmployeeEvaluationHistory row (signals keep them current afterwards)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--company", help="Only this company's employees.")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **opts):
+        size = opts["batch_size"]
+        ids = list(Employee.objects.for_tenant(opts["company"]).values_list("pk", flat=True))
+        built = 0
+        for start in range(0, len(ids), size):
+            built += history.rebuild(ids[start:start + size])
+        self.stdout.write(self.style.SUCCESS(f"✅  {built} histories rebuilt ({len(ids)} employees)."))
@@ -0,0 +1,27 @@
+# evaluation_app/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from evaluation_app import models as m
+from evaluation_app.services import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild every employee / evaluation SearchDocument (signals keep it current afterwards)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **opts):
+        size = opts["batch_size"]
+        for kind, model, index in (
+            (m.SearchKind.EMPLOYEE, m.Employee, search.index_employees),
+            (m.SearchKind.EVALUATION, m.Evaluation, search.index_evaluations),
+        ):
+            ids = list(model.objects.values_list("pk", flat=True))
+            for start in range(0, len(ids), size):
+                index(ids[start:start + size])
+            # drop documents whose source row no longer exists
+            m.SearchDocument.objects.filter(kind=kind).exclude(object_id__in=model.objects.values("pk")).delete()
+            self.stdout.write(f"{kind}: {len(ids)} documents")
+
+        self.stdout.write(self.style.SUCCESS("✅  Search index rebuilt."))
@@ -0,0 +1,28 @@
+# evaluation_app/management/commands/reconcile_headcounts.py
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluation_app.services import headcount
+
+
+class Command(BaseCommand):
+    help = "Recompute every Department.employee_count from the membership table in one grouped UPDATE."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true",
+                            help="Only report drifted departments; exit non-zero if any.")
+
+    def handle(self, *args, **opts):
+        drifted = list(headcount.drifted().values_list("name", "employee_count", "actual"))
+        for name, stored, actual in drifted:
+            self.stdout.write(f"{name}: stored {stored}, actual {actual}")
+
+        if opts["check"]:
+            if drifted:
+                raise CommandError(f"{len(drifted)} department counter(s) out of date.")
+            self.stdout.write(self.style.SUCCESS("✅  Headcounts are consistent."))
+            return
+
+        updated = headcount.reconcile()
+        self.stdout.write(self.style.SUCCESS(
+            f"✅  Reconciled {updated} departments ({len(drifted)} corrected)."
+        ))
@@ -0,0 +1,57 @@
+# evaluation_app/management/commands/run_webhooks.py
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from evaluation_app.services import webhooks
+
+_local = threading.local()
+
+
+def _deliver(subscription_id):
+    """Runs in a pool thread: each thread keeps its own connections (DB + HTTP)."""
+    close_old_connections()
+    sender = getattr(_local, "sender", None)
+    if sender is None:
+        sender = _local.sender = webhooks.Sender()
+    return webhooks.deliver(subscription_id, sender)
+
+
+class Command(BaseCommand):
+    help = """
+    Dispatch outbound webhooks (services/webhooks.py): fan new outbox events
+    out to subscriptions and POST batched, signed deliveries with retries.
+    --threads subscribers are served concurrently.  SIGTERM/SIGINT finishes
+    the current round, then exits.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=4, help="Subscribers served concurrently.")
+        parser.add_argument("--poll", type=float, default=1.0, help="Seconds to sleep when nothing is due.")
+        parser.add_argument("--burst", action="store_true", help="Exit once nothing is due (cron/CI).")
+
+    def handle(self, *args, **opts):
+        stop = threading.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: stop.set())
+
+        threads = max(1, opts["threads"])
+        self.stdout.write(f"Webhook dispatcher: {threads} thread(s)")
+        with ThreadPoolExecutor(threads) as pool:
+            while not stop.is_set():
+                close_old_connections()
+                events = webhooks.fan_out()
+                due = webhooks.due_subscriptions()
+                results = list(pool.map(_deliver, due))
+                sent, failed = sum(r[0] for r in results), sum(r[1] for r in results)
+                if events or sent or failed:
+                    self.stdout.write(f"{events} new event(s) · {sent} delivered · {failed} failed")
+                if not events and not due:
+                    if opts["burst"]:
+                        break
+                    stop.wait(opts["poll"])
+        connection.close()
+        self.stdout.write(self.style.SUCCESS("✅  Webhook dispatcher stopped."))
@@ -0,0 +1,106 @@
+# evaluation_app/management/commands/run_worker.py
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+from django.core.management.base import BaseCommand, OutputWrapper
+from django.db import close_old_connections, connection, connections
+
+from evaluation_app.services import jobs
+
+
+def serve(threads, opts, write):
+    """One process: `threads` claim/run loops until SIGTERM/SIGINT (or drained, with --burst)."""
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())  # finish the running job, then exit
+
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    loops = [threading.Thread(target=_loop, args=(f"{host}:{n}", stop, opts, write), daemon=True)
+             for n in range(threads)]
+    for t in loops:
+        t.start()
+    while any(t.is_alive() for t in loops):
+        for t in loops:
+            t.join(timeout=0.5)  # short joins keep the main thread responsive to signals
+
+
+def _loop(worker, stop, opts, write):
+    last_sweep = 0.0
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            if time.monotonic() - last_sweep > opts["stale_after"] / 2:
+                requeued, failed = jobs.requeue_stale(opts["stale_after"])
+                if requeued or failed:
+                    write(f"{worker}: stale jobs → {requeued} re-queued, {failed} failed")
+                last_sweep = time.monotonic()
+
+            job = jobs.claim(worker)
+            if job is None:
+                if opts["burst"]:
+                    return
+                stop.wait(opts["poll"])
+                continue
+
+            write(f"{worker}: ▶ {job.kind} {job.pk} (attempt {job.attempts}/{job.max_attempts})")
+            t0 = time.perf_counter()
+            outcome = jobs.run(job)
+            write(f"{worker}: {outcome} {job.kind} {job.pk} in {time.perf_counter() - t0:.1f}s")
+    finally:
+        connection.close()
+
+
+def _child(threads, opts):
+    import django
+    django.setup()  # no-op under fork, required under spawn
+    # what the command's self.stdout wraps; the wrapper itself doesn't pickle under spawn
+    serve(threads, opts, OutputWrapper(sys.stdout).write)
+
+
+class Command(BaseCommand):
+    help = """
+    Run background jobs from the Job table (services/jobs.py).
+    Scale with --processes (CPU-bound handlers) and --threads (I/O-bound).
+    SIGTERM/SIGINT lets running jobs finish before exiting.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1, help="Worker processes.")
+        parser.add_argument("--threads", type=int, default=1, help="Claim/run loops per process.")
+        parser.add_argument("--poll", type=float, default=1.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument("--stale-after", type=int, default=300,
+                            help="Re-queue RUNNING jobs without a heartbeat for this many seconds.")
+        parser.add_argument("--burst", action="store_true", help="Exit once the queue is drained (cron/CI).")
+
+    def handle(self, *args, **opts):
+        threads = max(1, opts["threads"])
+        processes = max(1, opts["processes"])
+        self.stdout.write(f"Worker: {processes} process(es) × {threads} thread(s); handlers: {', '.join(sorted(jobs.HANDLERS))}")
+
+        if processes == 1:
+            serve(threads, opts, self.stdout.write)
+        else:
+            self._supervise(processes, threads, opts)
+        self.stdout.write(self.style.SUCCESS("✅  Worker stopped."))
+
+    def _supervise(self, processes, threads, opts):
+        connections.close_all()  # never share a socket with forked children
+        children = [multiprocessing.Process(target=_child, args=(threads, opts)) for _ in range(processes)]
+        for child in children:
+            child.start()
+
+        def forward(signum, frame):  # SIGTERM → children finish their jobs and exit
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # the terminal sends SIGINT to children too
+        for child in children:
+            child.join()
+
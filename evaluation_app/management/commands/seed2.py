@@ -40,7 +40,6 @@ class Command(BaseCommand):
         dev_dept = ev.Department.objects.create(
             department_id  = uuid4(),
             name           = "Development",
-            employee_count = 0,
             manager        = lm_user,
             company        = novo,
             created_at     = now,
@@ -75,13 +74,10 @@ class Command(BaseCommand):
         )
 
         # ─── 5) LINK EMPLOYEES → DEPARTMENT ──────────────
-        ev.EmployeeDepartment.objects.bulk_create([
-            ev.EmployeeDepartment(employee=lm_emp,  department=dev_dept),
-            ev.EmployeeDepartment(employee=emp_emp, department=dev_dept),
-        ])
+        # .add() → m2m_changed keeps dev_dept.employee_count in step
+        dev_dept.employees.add(lm_emp, emp_emp)
         dev_dept.manager         = lm_user
-        dev_dept.employee_count  = 2
-        dev_dept.save(update_fields=["manager", "employee_count"])
+        dev_dept.save(update_fields=["manager"])
 
         # report success
         self.stdout.write(self.style.SUCCESS(
@@ -0,0 +1,63 @@
+# evaluation_app/management/commands/webhook_receiver.py
+import hmac
+import json
+import random
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+from evaluation_app.services import webhooks
+
+
+class Command(BaseCommand):
+    help = """
+    Stand-in webhook receiver for local testing: prints every batch it
+    gets, checks the signature when --secret is given, and can fail on
+    purpose (--fail-rate) to exercise retries and dead letters.
+    Point a subscription at http://127.0.0.1:<port>/.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--port", type=int, default=8099)
+        parser.add_argument("--secret", help="Subscription secret; bad signatures get 401.")
+        parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of batches answered with 503.")
+
+    def handle(self, *args, **opts):
+        write, secret, fail_rate = self.stdout.write, opts["secret"], opts["fail_rate"]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the dispatcher
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if secret:
+                    expected = webhooks.sign(secret, self.headers.get("X-Webhook-Timestamp", ""), body)
+                    if not hmac.compare_digest(expected, self.headers.get("X-Webhook-Signature", "")):
+                        return self._reply(401, "bad signature")
+                if random.random() < fail_rate:
+                    return self._reply(503, "failing on purpose")
+                events = json.loads(body)["events"]
+                for event in events:
+                    write(f"← {event['event']} #{event['id']} {event['data'].get('evaluation_id', '')}")
+                self._reply(200, f"{len(events)} received")
+
+            def _reply(self, status, text):
+                data = text.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, fmt, *args):
+                write(f"{self.client_address[0]}:{self.client_address[1]} {fmt % args}")
+
+        server = ThreadingHTTPServer(("127.0.0.1", opts["port"]), Handler)
+        write(f"Listening on http://127.0.0.1:{opts['port']}/ (Ctrl-C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        self.stdout.write(self.style.SUCCESS("✅  Receiver stopped."))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_company(apps, schema_editor):
+    Employee = apps.get_model("evaluation_app", "Employee")
+    Evaluation = apps.get_model("evaluation_app", "Evaluation")
+    Objective = apps.get_model("evaluation_app", "Objective")
+    Competency = apps.get_model("evaluation_app", "Competency")
+
+    Evaluation.objects.update(company_id=Subquery(
+        Employee.objects.filter(pk=OuterRef("employee_id")).values("company_id")[:1]
+    ))
+    for model in (Objective, Competency):
+        model.objects.update(company_id=Subquery(
+            Evaluation.objects.filter(pk=OuterRef("evaluation_id")).values("company_id")[:1]
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0003_alter_department_manager'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competency',
+            name='company',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='competencies', to='evaluation_app.company'),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='company',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='evaluations', to='evaluation_app.company'),
+        ),
+        migrations.AddField(
+            model_name='objective',
+            name='company',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='objectives', to='evaluation_app.company'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluation',
+            index=models.Index(fields=['company', 'period'], name='eval_company_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluation',
+            index=models.Index(fields=['company', 'status'], name='eval_company_status_idx'),
+        ),
+        migrations.RunPython(backfill_company, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TABLE = "evaluation_app_searchdocument"
+FTS = "evaluation_app_searchfts"
+
+
+def create_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            f"ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple', body)) STORED"
+        )
+        schema_editor.execute(f"CREATE INDEX searchdoc_vector_gin ON {TABLE} USING GIN (search_vector)")
+    elif vendor == "sqlite":
+        # external-content FTS5 table kept in sync with the document table by triggers
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS} USING fts5(body, content='{TABLE}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS}_ai AFTER INSERT ON {TABLE} BEGIN "
+            f"INSERT INTO {FTS}(rowid, body) VALUES (new.id, new.body); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS}_ad AFTER DELETE ON {TABLE} BEGIN "
+            f"INSERT INTO {FTS}({FTS}, rowid, body) VALUES ('delete', old.id, old.body); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS}_au AFTER UPDATE ON {TABLE} BEGIN "
+            f"INSERT INTO {FTS}({FTS}, rowid, body) VALUES ('delete', old.id, old.body); "
+            f"INSERT INTO {FTS}(rowid, body) VALUES (new.id, new.body); END"
+        )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS}")
+    # PostgreSQL: column + index go away with the table
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0004_tenant_company'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('EMPLOYEE', 'Employee'), ('EVALUATION', 'Evaluation')], max_length=10)),
+                ('object_id', models.UUIDField()),
+                ('body', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='evaluation_app.company')),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def add_self_rows(apps, schema_editor):
+    Employee = apps.get_model("evaluation_app", "Employee")
+    Closure = apps.get_model("evaluation_app", "ReportingLineClosure")
+    Closure.objects.bulk_create(
+        [Closure(ancestor_id=pk, descendant_id=pk, depth=0)
+         for pk in Employee.objects.values_list("pk", flat=True)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0005_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportingLine',
+            fields=[
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='reporting_line', serialize=False, to='evaluation_app.employee')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('manager', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='direct_reports', to='evaluation_app.employee')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReportingLineClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='evaluation_app.employee')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='evaluation_app.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='closure_descendant_idx')],
+                'unique_together': {('ancestor', 'descendant')},
+            },
+        ),
+        migrations.RunPython(add_self_rows, migrations.RunPython.noop),
+    ]
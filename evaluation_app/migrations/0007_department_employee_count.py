@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-19 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def recount(apps, schema_editor):
+    Department = apps.get_model("evaluation_app", "Department")
+    EmployeeDepartment = apps.get_model("evaluation_app", "EmployeeDepartment")
+    counts = (EmployeeDepartment.objects
+              .filter(department=OuterRef("pk"), employee__status__in=("ACTIVE", "DEFAULT_ACTIVE"))
+              .values("department")
+              .annotate(n=Count("pk"))
+              .values("n"))
+    Department.objects.update(employee_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0006_reporting_lines'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='department',
+            name='employee_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(recount, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:15
+
+import calendar
+import re
+from datetime import date
+
+from django.conf import settings
+from django.db import migrations, models
+
+# A frozen copy of services/periods.period_fields as of this migration, so
+# later changes to the live parser don't alter what this backfill does.
+_PATTERNS = (
+    (re.compile(r"^(?P<year>\d{4})$"), "year"),
+    (re.compile(r"^(?P<year>\d{4})[-/ ]?Q(?P<n>[1-4])$"), "quarter"),
+    (re.compile(r"^Q(?P<n>[1-4])[-/ ]?(?P<year>\d{4})$"), "quarter"),
+    (re.compile(r"^(?P<year>\d{4})[-/ ]?H(?P<n>[12])$"), "half"),
+    (re.compile(r"^(?P<year>\d{4})-(?P<n>0[1-9]|1[0-2])$"), "month"),
+)
+_EMPTY = {"period_year": None, "period_quarter": None, "period_start": None, "period_end": None}
+
+
+def period_fields(text):
+    value = (text or "").strip().upper()
+    for pattern, unit in _PATTERNS:
+        match = pattern.match(value)
+        if match is None:
+            continue
+        year, n = int(match["year"]), int(match.groupdict().get("n") or 0)
+        if not 1 <= year <= 9999:
+            break
+        first, last, quarter = {
+            "year":    (1, 12, None),
+            "quarter": (3 * n - 2, 3 * n, n),
+            "half":    (6 * n - 5, 6 * n, None),
+            "month":   (n, n, (n - 1) // 3 + 1),
+        }[unit]
+        return {
+            "period_year": year,
+            "period_quarter": quarter,
+            "period_start": date(year, first, 1),
+            "period_end": date(year, last, calendar.monthrange(year, last)[1]),
+        }
+    return dict(_EMPTY)
+
+
+def backfill(apps, schema_editor):
+    # one UPDATE per distinct period string (a handful), not per row
+    Evaluation = apps.get_model("evaluation_app", "Evaluation")
+    for period in Evaluation.objects.values_list("period", flat=True).distinct().order_by():
+        Evaluation.objects.filter(period=period).update(**period_fields(period))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0008_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evaluation',
+            name='period_end',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='period_quarter',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='period_start',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='period_year',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='evaluation',
+            index=models.Index(fields=['company', 'period_start', 'type'], name='eval_company_start_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluation',
+            index=models.Index(fields=['period_start', 'type'], name='eval_start_type_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0009_evaluation_period_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEvaluation',
+            fields=[
+                ('evaluation_id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('ANNUAL', 'Annual'), ('QUARTERLY', 'Quarterly'), ('OPTIONAL', 'Optional')], max_length=10)),
+                ('score', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True)),
+                ('period', models.CharField(max_length=20)),
+                ('period_year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('period_quarter', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('period_start', models.DateField(blank=True, null=True)),
+                ('period_end', models.DateField(blank=True, null=True)),
+                ('segment', models.CharField(max_length=100)),
+                ('offset', models.PositiveBigIntegerField()),
+                ('length', models.PositiveIntegerField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('company', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='evaluation_app.company')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_evaluations', to='evaluation_app.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'period_start'], name='archived_eval_company_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0012_webhooks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployeeEvaluationHistory',
+            fields=[
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='evaluation_history', serialize=False, to='evaluation_app.employee')),
+                ('latest_score', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True)),
+                ('latest_period', models.CharField(blank=True, max_length=20)),
+                ('previous_score', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True)),
+                ('trend', models.CharField(blank=True, choices=[('UP', 'Up'), ('DOWN', 'Down'), ('FLAT', 'Flat')], max_length=4)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('entries', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='evaluation_app.company')),
+            ],
+        ),
+    ]
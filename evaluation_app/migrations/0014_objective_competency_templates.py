@@ -0,0 +1,89 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:45
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0013_evaluation_history'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='competency',
+            name='category',
+            field=models.CharField(blank=True, choices=[('CORE', 'Core'), ('LEADERSHIP', 'Leadership'), ('FUNCTIONAL', 'Functional')], max_length=12),
+        ),
+        migrations.AlterField(
+            model_name='competency',
+            name='name',
+            field=models.CharField(blank=True, max_length=120),
+        ),
+        migrations.AlterField(
+            model_name='competency',
+            name='required_level',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='competency',
+            name='weight',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='objective',
+            name='title',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='objective',
+            name='weight',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='CompetencyTemplate',
+            fields=[
+                ('template_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('managerial_level', models.CharField(blank=True, choices=[('IC', 'Individual Contributor'), ('SUPERVISORY', 'Supervisory'), ('MIDDLE', 'Middle Management')], max_length=12)),
+                ('name', models.CharField(max_length=120)),
+                ('category', models.CharField(choices=[('CORE', 'Core'), ('LEADERSHIP', 'Leadership'), ('FUNCTIONAL', 'Functional')], max_length=12)),
+                ('required_level', models.PositiveSmallIntegerField()),
+                ('weight', models.PositiveSmallIntegerField()),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='competency_templates', to='evaluation_app.company')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='competency_templates', to='evaluation_app.department')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='competency',
+            name='template',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='competencies', to='evaluation_app.competencytemplate'),
+        ),
+        migrations.CreateModel(
+            name='ObjectiveTemplate',
+            fields=[
+                ('template_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('managerial_level', models.CharField(blank=True, choices=[('IC', 'Individual Contributor'), ('SUPERVISORY', 'Supervisory'), ('MIDDLE', 'Middle Management')], max_length=12)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('target', models.TextField(blank=True)),
+                ('weight', models.PositiveSmallIntegerField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='objective_templates', to='evaluation_app.company')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='objective_templates', to='evaluation_app.department')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='objective',
+            name='template',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='objectives', to='evaluation_app.objectivetemplate'),
+        ),
+    ]
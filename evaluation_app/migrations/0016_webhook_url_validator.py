@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:05
+
+import evaluation_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation_app', '0015_cache_table'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='webhooksubscription',
+            name='url',
+            field=models.URLField(max_length=500, validators=[evaluation_app.models.validate_webhook_url]),
+        ),
+    ]
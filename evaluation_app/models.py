@@ -47,6 +47,18 @@ class CompetencyCategory(models.TextChoices):
     FUNCTIONAL  = "FUNCTIONAL",  "Functional"
 
 
+# ── Tenant scoping ───────────────────────────────────────────────────────
+class TenantQuerySet(models.QuerySet):
+    """
+    Rows are partitioned by company (the tenant). `for_tenant(None)` means
+    cross-company access (ADMIN only; see views.mixins.resolve_tenant).
+    """
+    def for_tenant(self, company_id):
+        if company_id is None:
+            return self
+        return self.filter(**{getattr(self.model, "tenant_field", "company"): company_id})
+
+
 # ── Core tables ──────────────────────────────────────────────────────────
 
 
@@ -58,21 +70,36 @@ class Company(models.Model):
     industry   = models.CharField(max_length=100)
     size       = models.CharField(max_length=6, choices=CompanySize.choices)
     created_at = models.DateTimeField(default=timezone.now)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    tenant_field = "pk"
+    objects = TenantQuerySet.as_manager()
 
 
 class Department(models.Model):
     department_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name          = models.CharField(max_length=120)
-    employee_count = models.PositiveIntegerField()
+    employee_count = models.PositiveIntegerField(default=0, editable=False)  # active members, kept by signals
     manager       = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="managed_departments", null=True, blank=True)
     company       = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="departments")
     created_at    = models.DateTimeField(default=timezone.now)
-    updated_at    = models.DateTimeField(auto_now=True)
+    updated_at    = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = TenantQuerySet.as_manager()
 
     class Meta:
         unique_together = ("company", "name")
 
+    def save(self, *args, **kwargs):
+        # employee_count is owned by F() updates (services/headcount):
+        # never write back the copy loaded with this instance
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != "employee_count"
+            ]
+        super().save(*args, **kwargs)
+
 
 class Employee(models.Model):
     employee_id      = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -80,12 +107,14 @@ class Employee(models.Model):
     status           = models.CharField(max_length=16, choices=EmpStatus.choices)
     join_date        = models.DateField()
     created_at       = models.DateTimeField(default=timezone.now)
-    updated_at       = models.DateTimeField(auto_now=True)
+    updated_at       = models.DateTimeField(auto_now=True, db_index=True)
     user             = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="employee_profile")
     company          = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True)
 
     departments = models.ManyToManyField(Department, through="EmployeeDepartment", related_name="employees")
 
+    objects = TenantQuerySet.as_manager()
+
 
 class EmployeeDepartment(models.Model):
     employee   = models.ForeignKey(Employee, on_delete=models.CASCADE)
@@ -95,6 +124,29 @@ class EmployeeDepartment(models.Model):
         unique_together = ("employee", "department")
 
 
+# ── Reporting lines ----------------------------------------------------------
+class ReportingLine(models.Model):
+    """Direct line-manager link. Saving it re-threads ReportingLineClosure (signals)."""
+    employee   = models.OneToOneField(Employee, on_delete=models.CASCADE, primary_key=True, related_name="reporting_line")
+    manager    = models.ForeignKey(Employee, on_delete=models.SET_NULL, null=True, blank=True, related_name="direct_reports")
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class ReportingLineClosure(models.Model):
+    """
+    Transitive closure of ReportingLine: one row per (ancestor, descendant)
+    pair incl. the (e, e, 0) self row.  "Everyone under X" is a single index
+    range scan on (ancestor, descendant).
+    """
+    ancestor   = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="+")
+    descendant = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="+")
+    depth      = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [models.Index(fields=["descendant", "depth"], name="closure_descendant_idx")]
+
+
 # ── Weight configuration ---------------------------------------------------
 class WeightsConfiguration(models.Model):
     level_name        = models.CharField(primary_key=True, max_length=12, choices=ManagerialLevel.choices)
@@ -117,25 +169,158 @@ class Evaluation(models.Model):
     score         = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     reviewer      = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="reviews")
     period        = models.CharField(max_length=20)      # e.g. '2025-Q1'
+    # parsed from `period` on save (services/periods.py); NULL when unrecognised
+    period_year    = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    period_quarter = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    period_start   = models.DateField(null=True, blank=True, editable=False)
+    period_end     = models.DateField(null=True, blank=True, editable=False)
+    # tenant key, denormalized from employee.company (see signals)
+    company       = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="evaluations")
     created_at    = models.DateTimeField(default=timezone.now)
-    updated_at    = models.DateTimeField(auto_now=True)
+    updated_at    = models.DateTimeField(auto_now=True, db_index=True)
 
     # convenience M2M via through tables
     objectives   = models.ManyToManyField("Objective", through="EmployeeObjective", related_name="employees")
     competencies = models.ManyToManyField("Competency", through="EmployeeCompetency", related_name="employees")
 
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "period"], name="eval_company_period_idx"),
+            models.Index(fields=["company", "status"], name="eval_company_status_idx"),
+            # period range scans (?period_from / ?period_to), optionally by type
+            models.Index(fields=["company", "period_start", "type"], name="eval_company_start_type_idx"),
+            models.Index(fields=["period_start", "type"], name="eval_start_type_idx"),
+        ]
+
+
+class ArchivedEvaluation(models.Model):
+    """
+    Stub left in place of an archived evaluation (services/archive.py): the
+    columns needed to list and filter it, plus where its full snapshot
+    (objectives, competencies) lives in the compressed archive segments.
+    """
+    evaluation_id  = models.UUIDField(primary_key=True, editable=False)   # id of the former hot row
+    employee       = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="archived_evaluations")
+    company        = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+")
+    type           = models.CharField(max_length=10, choices=EvalType.choices)
+    score          = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
+    period         = models.CharField(max_length=20)
+    period_year    = models.PositiveSmallIntegerField(null=True, blank=True)
+    period_quarter = models.PositiveSmallIntegerField(null=True, blank=True)
+    period_start   = models.DateField(null=True, blank=True)
+    period_end     = models.DateField(null=True, blank=True)
+    segment        = models.CharField(max_length=100)       # file name under ARCHIVE_DIR
+    offset         = models.PositiveBigIntegerField()
+    length         = models.PositiveIntegerField()
+    archived_at    = models.DateTimeField(default=timezone.now)
+
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "period_start"], name="archived_eval_company_idx"),
+        ]
+
+
+class Trend(models.TextChoices):
+    UP   = "UP",   "Up"
+    DOWN = "DOWN", "Down"
+    FLAT = "FLAT", "Flat"
+
+
+class EmployeeEvaluationHistory(models.Model):
+    """
+    Denormalized summary of an employee's evaluations, hot and archived
+    (services/history.py), rebuilt whenever one of them changes so profile
+    and team pages read one row instead of every nested evaluation.
+    `entries` holds the newest `history.SIZE`:
+    [{"id", "type", "period", "status", "score", "archived"}, …].
+    """
+    employee       = models.OneToOneField(Employee, on_delete=models.CASCADE, primary_key=True, related_name="evaluation_history")
+    company        = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+")
+    latest_score   = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
+    latest_period  = models.CharField(max_length=20, blank=True)
+    previous_score = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
+    trend          = models.CharField(max_length=4, choices=Trend.choices, blank=True)  # latest vs previous score
+    total          = models.PositiveIntegerField(default=0)                              # all evaluations, not just `entries`
+    entries        = models.JSONField(default=list)
+    updated_at     = models.DateTimeField(auto_now=True)
+
+    objects = TenantQuerySet.as_manager()
+
+
+# ── Objective / competency templates ────────────────────────────────────
+class ObjectiveTemplate(models.Model):
+    """
+    Shared wording for the objectives of a department and/or managerial
+    level (empty = every one), instantiated at cycle launch
+    (services/templates.py).
+    """
+    template_id      = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    company          = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="objective_templates")
+    department       = models.ForeignKey(Department, on_delete=models.CASCADE, null=True, blank=True, related_name="objective_templates")
+    managerial_level = models.CharField(max_length=12, choices=ManagerialLevel.choices, blank=True)
+    title            = models.CharField(max_length=200)
+    description      = models.TextField(blank=True)
+    target           = models.TextField(blank=True)
+    weight           = models.PositiveSmallIntegerField()
+    is_active        = models.BooleanField(default=True)
+    created_at       = models.DateTimeField(default=timezone.now)
+    updated_at       = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = TenantQuerySet.as_manager()
+
+
+class CompetencyTemplate(models.Model):
+    template_id      = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    company          = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="competency_templates")
+    department       = models.ForeignKey(Department, on_delete=models.CASCADE, null=True, blank=True, related_name="competency_templates")
+    managerial_level = models.CharField(max_length=12, choices=ManagerialLevel.choices, blank=True)
+    name             = models.CharField(max_length=120)
+    category         = models.CharField(max_length=12, choices=CompetencyCategory.choices)
+    required_level   = models.PositiveSmallIntegerField()
+    weight           = models.PositiveSmallIntegerField()
+    description      = models.TextField(blank=True)
+    is_active        = models.BooleanField(default=True)
+    created_at       = models.DateTimeField(default=timezone.now)
+    updated_at       = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = TenantQuerySet.as_manager()
+
+
+class TemplateBacked:
+    """
+    Copy-on-write rows: with a `template`, the `template_fields` left empty
+    (NULL / "") are read from it; a value set on the row overrides it.
+    """
+    template_fields = ()
+
+    def effective(self, field):
+        value = getattr(self, field)
+        if value in (None, "") and self.template_id is not None:
+            return getattr(self.template, field)
+        return value
 
-class Objective(models.Model):
+
+class Objective(TemplateBacked, models.Model):
     objective_id  = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     evaluation    = models.ForeignKey(Evaluation, on_delete=models.CASCADE, related_name="objective_set")
-    title         = models.CharField(max_length=200)
+    template      = models.ForeignKey(ObjectiveTemplate, on_delete=models.PROTECT, null=True, blank=True, related_name="objectives")
+    # blank / NULL on template rows: inherited from `template`
+    title         = models.CharField(max_length=200, blank=True)
     description   = models.TextField(blank=True)
     target        = models.TextField(blank=True)
     achieved      = models.TextField(blank=True)
-    weight        = models.PositiveSmallIntegerField()
+    weight        = models.PositiveSmallIntegerField(null=True, blank=True)
     status        = models.CharField(max_length=15, choices=ObjectiveState.choices)
+    company       = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="objectives")  # = evaluation.company
     created_at    = models.DateTimeField(default=timezone.now)
-    updated_at    = models.DateTimeField(auto_now=True)
+    updated_at    = models.DateTimeField(auto_now=True, db_index=True)
+
+    template_fields = ("title", "description", "target", "weight")
+    objects = TenantQuerySet.as_manager()
 
 
 class EmployeeObjective(models.Model):
@@ -147,17 +332,23 @@ class EmployeeObjective(models.Model):
         unique_together = ("evaluation","employee", "objective")
 
 
-class Competency(models.Model):
+class Competency(TemplateBacked, models.Model):
     competence_id  = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     evaluation     = models.ForeignKey(Evaluation, on_delete=models.CASCADE, related_name="competency_set")
-    name           = models.CharField(max_length=120)
-    category       = models.CharField(max_length=12, choices=CompetencyCategory.choices)
-    required_level = models.PositiveSmallIntegerField()
+    template       = models.ForeignKey(CompetencyTemplate, on_delete=models.PROTECT, null=True, blank=True, related_name="competencies")
+    # blank / NULL on template rows: inherited from `template`
+    name           = models.CharField(max_length=120, blank=True)
+    category       = models.CharField(max_length=12, choices=CompetencyCategory.choices, blank=True)
+    required_level = models.PositiveSmallIntegerField(null=True, blank=True)
     actual_level   = models.PositiveSmallIntegerField()
-    weight         = models.PositiveSmallIntegerField()
+    weight         = models.PositiveSmallIntegerField(null=True, blank=True)
     description    = models.TextField(blank=True)
+    company        = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="competencies")  # = evaluation.company
     created_at     = models.DateTimeField(default=timezone.now)
-    updated_at     = models.DateTimeField(auto_now=True)
+    updated_at     = models.DateTimeField(auto_now=True, db_index=True)
+
+    template_fields = ("name", "category", "required_level", "weight", "description")
+    objects = TenantQuerySet.as_manager()
 
 
 class EmployeeCompetency(models.Model):
@@ -167,3 +358,165 @@ class EmployeeCompetency(models.Model):
 
     class Meta:
         unique_together = ("evaluation","employee", "competency")
+
+
+# ── Search index ────────────────────────────────────────────────────────
+class SearchKind(models.TextChoices):
+    EMPLOYEE   = "EMPLOYEE",   "Employee"
+    EVALUATION = "EVALUATION", "Evaluation"
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized full-text document per employee / evaluation, maintained by
+    signals (services/search.py).  Migration 0005 adds the engine-specific
+    index: a generated `tsvector` column + GIN on PostgreSQL, an external
+    content FTS5 table on SQLite.
+    """
+    kind       = models.CharField(max_length=10, choices=SearchKind.choices)
+    object_id  = models.UUIDField()
+    company    = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+")
+    body       = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ("kind", "object_id")
+
+
+# ── Background jobs ─────────────────────────────────────────────────────
+class JobStatus(models.TextChoices):
+    QUEUED    = "QUEUED",    "Queued"
+    RUNNING   = "RUNNING",   "Running"
+    SUCCEEDED = "SUCCEEDED", "Succeeded"
+    FAILED    = "FAILED",    "Failed"
+
+
+class Job(models.Model):
+    """
+    A unit of background work: `kind` names a handler registered in
+    services/jobs.py, run by `manage.py run_worker`.  The table is the queue,
+    so no broker is needed.
+    """
+    job_id       = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind         = models.CharField(max_length=64)
+    payload      = models.JSONField(default=dict, blank=True)
+    status       = models.CharField(max_length=10, choices=JobStatus.choices, default=JobStatus.QUEUED)
+    progress     = models.PositiveSmallIntegerField(default=0)   # percent
+    message      = models.CharField(max_length=200, blank=True)
+    result       = models.JSONField(null=True, blank=True)
+    error        = models.TextField(blank=True)
+    attempts     = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after    = models.DateTimeField(default=timezone.now)    # retry backoff
+    worker       = models.CharField(max_length=64, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    created_by   = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    company      = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+")
+    created_at   = models.DateTimeField(default=timezone.now)
+    started_at   = models.DateTimeField(null=True, blank=True)
+    finished_at  = models.DateTimeField(null=True, blank=True)
+
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="job_queue_idx"),
+        ]
+
+
+# ── Change feed ─────────────────────────────────────────────────────────
+class ChangeLog(models.Model):
+    """
+    One row per committed change to a synced model (services/changes.py);
+    `seq` is the feed's monotonic high-water mark.  `deleted` rows are
+    tombstones.  `company_id` is a plain column so tombstones survive the
+    company itself.
+    """
+    seq         = models.BigAutoField(primary_key=True)
+    model       = models.CharField(max_length=20)      # model_name, e.g. "evaluation"
+    object_id   = models.UUIDField()
+    company_id  = models.UUIDField(null=True, blank=True)
+    deleted     = models.BooleanField(default=False)
+    recorded_at = models.DateTimeField(default=timezone.now)
+
+    tenant_field = "company_id"
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company_id", "seq"], name="changelog_company_seq_idx"),
+            models.Index(fields=["recorded_at"], name="changelog_recorded_idx"),
+        ]
+
+
+# ── Outbound webhooks ───────────────────────────────────────────────────
+class WebhookEventType(models.TextChoices):
+    EVALUATION_APPROVED  = "evaluation.approved",  "Evaluation approved"
+    EVALUATION_COMPLETED = "evaluation.completed", "Evaluation completed"
+
+
+def validate_webhook_url(value):
+    """Public http(s) endpoints only (services/webhooks.public_address)."""
+    from evaluation_app.services.webhooks import public_address
+    public_address(value)
+
+
+class WebhookSubscription(models.Model):
+    """An integration's endpoint and the event types it receives."""
+    subscription_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    company     = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="webhook_subscriptions")
+    url         = models.URLField(max_length=500, validators=[validate_webhook_url])
+    event_types = models.JSONField(default=list)        # [WebhookEventType, …]
+    secret      = models.CharField(max_length=64)       # HMAC key for X-Webhook-Signature
+    is_active   = models.BooleanField(default=True)
+    created_at  = models.DateTimeField(default=timezone.now)
+
+    objects = TenantQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # also for writes that skip full_clean(); the dispatcher checks again per delivery
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "url" in update_fields:
+            validate_webhook_url(self.url)
+        super().save(*args, **kwargs)
+
+
+class WebhookEvent(models.Model):
+    """
+    Outbox row written in the transaction that changed the data; the
+    dispatcher (manage.py run_webhooks) fans it out to subscriptions.
+    """
+    event      = models.CharField(max_length=40, choices=WebhookEventType.choices)
+    company    = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    payload    = models.JSONField()
+    dispatched = models.BooleanField(default=False)     # fanned out to deliveries
+    created_at = models.DateTimeField(default=timezone.now)
+
+    objects = TenantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [models.Index(fields=["dispatched", "id"], name="webhook_outbox_idx")]
+
+
+class WebhookDelivery(models.Model):
+    """One event still owed to one subscription (deleted once delivered)."""
+    subscription    = models.ForeignKey(WebhookSubscription, on_delete=models.CASCADE, related_name="deliveries")
+    event           = models.ForeignKey(WebhookEvent, on_delete=models.CASCADE, related_name="deliveries")
+    attempts        = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error      = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["next_attempt_at", "subscription"], name="webhook_delivery_due_idx")]
+
+
+class WebhookDeadLetter(models.Model):
+    """A delivery that ran out of attempts; requeue from the admin."""
+    subscription = models.ForeignKey(WebhookSubscription, on_delete=models.CASCADE, related_name="dead_letters")
+    event        = models.CharField(max_length=40, choices=WebhookEventType.choices)
+    payload      = models.JSONField()
+    attempts     = models.PositiveSmallIntegerField()
+    last_error   = models.TextField(blank=True)
+    failed_at    = models.DateTimeField(default=timezone.now)
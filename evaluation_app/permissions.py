@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from evaluation_app import capabilities
+
 class IsHR(BasePermission):
     def has_permission(self, request, view):
         return request.user.role == "HR"
@@ -47,4 +49,19 @@ class IsSelfOrAdminHR(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.role in ("ADMIN", "HR"):
             return True
-        return obj.user_id == request.user.user_id
\ No newline at end of file
+        return obj.user_id == request.user.user_id
+
+class CapabilityPermission(BasePermission):
+    """
+    Grants an action when the user's cached capability set holds any of the
+    view's `required_capabilities[action]` ("*" = default for other actions;
+    an action with no entry is denied).  Object-level access is not checked
+    here: views narrow their querysets with `capabilities.scope()`, so
+    `get_object()` already 404s on rows outside the user's scope.
+    """
+    message = "Your role does not allow this action."
+
+    def has_permission(self, request, view):
+        required = getattr(view, "required_capabilities", {})
+        caps = required.get(getattr(view, "action", None), required.get("*"))
+        return bool(caps) and capabilities.resolve(request.user).any(caps)
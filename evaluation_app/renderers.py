@@ -0,0 +1,44 @@
+# evaluation_app/renderers.py
+"""
+Optional MessagePack renderer / parser (``pip install msgpack``).
+
+Clients send ``Accept: application/msgpack`` (or ``?format=msgpack``) to
+get list responses as MessagePack.  They are smaller than JSON and much
+cheaper to decode.  They can also POST / PATCH msgpack bodies.  Settings
+register both classes only when the package is importable.  UUIDs,
+decimals and dates travel as the same strings the JSON renderer emits.
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:  # optional
+    msgpack = None
+
+MEDIA_TYPE = "application/msgpack"
+_encoder = JSONEncoder()
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = MEDIA_TYPE
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -13,6 +13,8 @@ class EmployeeSerializer(serializers.ModelSerializer):
             "managerial_level", "status", "join_date",
         ] #
         read_only_fields = ('employee_id',)
+        # the caller's company unless ADMIN (EmployeeViewSet.perform_create / perform_update)
+        extra_kwargs = {"company": {"required": False}}
         
 
     def create(self, validated_data):
@@ -1,31 +1,166 @@
+import logging
+
 from rest_framework import serializers
 from evaluation_app.models import (
-    Evaluation, Objective, Competency, EmpStatus, EvalStatus, EvalType
+    ArchivedEvaluation, Evaluation, Objective, Competency,
+    Employee, EmployeeEvaluationHistory, ObjectiveTemplate, CompetencyTemplate,
 )
 from evaluation_app.serializers.employee_serilized import EmployeeSerializer
 
+logger = logging.getLogger(__name__)
+
+
+class TemplateBackedSerializer(serializers.ModelSerializer):
+    """
+    • Returns the effective value of the fields a row inherits from its
+      `template` (select_related / prefetch "template" to avoid N+1).
+    • Writing one of them overrides the template for that row only.
+    • Rows without a template need their own `required_without_template`.
+    """
+    required_without_template = ()
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if instance.template_id is not None:
+            for field in instance.template_fields:
+                if field in data and data[field] in (None, ""):
+                    data[field] = instance.effective(field)
+        return data
 
-class ObjectiveSerializer(serializers.ModelSerializer):
+    def validate(self, attrs):
+        template = attrs.get("template", getattr(self.instance, "template", None))
+        evaluation = attrs.get("evaluation", getattr(self.instance, "evaluation", None))
+        if template is None:
+            missing = {
+                field: "This field is required without a template."
+                for field in self.required_without_template
+                if attrs.get(field, getattr(self.instance, field, None)) in (None, "")
+            }
+            if missing:
+                raise serializers.ValidationError(missing)
+        elif evaluation is not None and template.company_id != evaluation.company_id:
+            raise serializers.ValidationError({"template": "Belongs to another company."})
+        return attrs
+
+class ObjectiveSerializer(TemplateBackedSerializer):
+    required_without_template = ("title", "weight")
     class Meta:
         model = Objective
         fields = "__all__"
         read_only_fields = ("objective_id", "created_at", "updated_at")
 
+class CompetencySerializer(TemplateBackedSerializer):
+    required_without_template = ("name", "category", "required_level", "weight")
+    class Meta:
+        model = Competency
+        fields = "__all__"
+        read_only_fields = ("competence_id", "created_at", "updated_at")
+
+class ObjectiveTemplateSerializer(serializers.ModelSerializer):
+    company_id = serializers.UUIDField(required=False)  # ADMIN without X-Company-ID; fixed after create
+    class Meta:
+        model = ObjectiveTemplate
+        fields = [
+            "template_id", "company_id", "department", "managerial_level",
+            "title", "description", "target", "weight", "is_active", "created_at", "updated_at",
+        ]
+        read_only_fields = ("template_id", "created_at", "updated_at")
+
+class CompetencyTemplateSerializer(serializers.ModelSerializer):
+    company_id = serializers.UUIDField(required=False)  # ADMIN without X-Company-ID; fixed after create
+    class Meta:
+        model = CompetencyTemplate
+        fields = [
+            "template_id", "company_id", "department", "managerial_level",
+            "name", "category", "required_level", "weight", "description", "is_active",
+            "created_at", "updated_at",
+        ]
+        read_only_fields = ("template_id", "created_at", "updated_at")
+
+class ArchivedEvaluationSerializer(serializers.ModelSerializer):
+    """Stub of an archived evaluation; the detail view adds its snapshot."""
+    archived = serializers.BooleanField(default=True, read_only=True)
+    class Meta:
+        model = ArchivedEvaluation
+        fields = [
+            "evaluation_id", "employee_id", "type", "score", "period",
+            "period_year", "period_quarter", "period_start", "period_end",
+            "archived_at", "archived",
+        ]
+        read_only_fields = fields
+
+class EmployeeEvaluationHistorySerializer(serializers.ModelSerializer):
+    """Precomputed summary (services/history.py); `entries` is newest first."""
+    employee_id = serializers.UUIDField(read_only=True)
+    class Meta:
+        model = EmployeeEvaluationHistory
+        fields = [
+            "employee_id", "latest_score", "latest_period", "previous_score", "trend",
+            "total", "entries", "updated_at",
+        ]
+        read_only_fields = fields
+
+class TeamEvaluationSerializer(serializers.ModelSerializer):
+    """Read-only evaluation with its objectives and competencies (prefetched)."""
+    reviewer_id  = serializers.UUIDField(read_only=True)
+    objectives   = ObjectiveSerializer(source="objective_set", many=True, read_only=True)
+    competencies = CompetencySerializer(source="competency_set", many=True, read_only=True)
+    class Meta:
+        model = Evaluation
+        fields = [
+            "evaluation_id", "type", "status", "score", "reviewer_id",
+            "period", "period_start", "period_end", "updated_at",
+            "objectives", "competencies",
+        ]
+        read_only_fields = fields
+
+class TeamMemberSerializer(serializers.ModelSerializer):
+    """
+    One row of GET /api/employees/team/.  Expects the queryset built by
+    EmployeeViewSet.team: `current_evaluations` (Prefetch to_attr),
+    `departments` prefetched, `is_direct_report` annotated, and
+    `evaluation_history` joined.
+    """
+    name             = serializers.CharField(source="user.name", read_only=True)
+    email            = serializers.CharField(source="user.email", read_only=True)
+    title            = serializers.CharField(source="user.title", read_only=True)
+    is_direct_report = serializers.BooleanField(read_only=True)
+    departments      = serializers.SerializerMethodField()
+    evaluation       = serializers.SerializerMethodField()
+    history          = EmployeeEvaluationHistorySerializer(source="evaluation_history", read_only=True)
+    class Meta:
+        model = Employee
+        fields = [
+            "employee_id", "name", "email", "title", "managerial_level", "status",
+            "is_direct_report", "departments", "evaluation", "history",
+        ]
+        read_only_fields = fields
+
+    def get_departments(self, obj):
+        return [{"department_id": d.pk, "name": d.name} for d in obj.departments.all()]
+
+    def get_evaluation(self, obj):
+        current = obj.current_evaluations
+        return TeamEvaluationSerializer(current[0]).data if current else None
+
 class EvaluationSerializer(serializers.ModelSerializer):
     """
-    • Nested objectives (read-only list).  
+    • Nested objectives: the evaluation's own rows (objective_set, as
+      prefetched by EvaluationViewSet), template-backed ones included,
+      with inherited fields resolved.  
     • Employee & reviewer use UUIDs but return brief info.
     """
     employee = EmployeeSerializer(read_only=True)
     employee_id = serializers.UUIDField()
     reviewer_id = serializers.UUIDField()
-    objectives  = ObjectiveSerializer(many=True)
+    objectives  = ObjectiveSerializer(source="objective_set", many=True, required=False)
     class Meta:
         model = Evaluation
         fields = [
             "evaluation_id", "employee", "employee_id",
             "type", "status", "score",
             "reviewer_id", "period",
+            "period_year", "period_quarter", "period_start", "period_end",
             "created_at", "updated_at",
             "objectives",
         ]
@@ -33,9 +168,10 @@ class EvaluationSerializer(serializers.ModelSerializer):
 
      # ── create / update helpers ──────────────────────────
     def create(self, validated_data):
-        print(">> Received validated_data:", validated_data)
+        logger.debug("evaluation create", extra={"fields": sorted(validated_data)})
         employee_id = validated_data.pop('employee_id')  
         reviewer_id = validated_data.pop('reviewer_id', None) 
+        objectives_data = validated_data.pop('objective_set', [])
 
         employee = self.context['request'].user.employee_profile.__class__.objects.get(
             pk=employee_id
@@ -45,22 +181,26 @@ class EvaluationSerializer(serializers.ModelSerializer):
             from accounts.models import User
             reviewer = User.objects.get(pk=reviewer_id)
 
-        return Evaluation.objects.create(
+        evaluation = Evaluation.objects.create(
             employee=employee,
             reviewer=reviewer,
             **validated_data
-        ) 
+        )
+        for objective_data in objectives_data:
+            objective_data.pop('evaluation', None)
+            Objective.objects.create(evaluation=evaluation, **objective_data)
+        return evaluation
     
     def update(self, instance, validated_data):
      
      # Handle objectives update if present
-     if 'objectives' in validated_data:
-        objectives_data = validated_data.pop('objectives')
+     if 'objective_set' in validated_data:
+        objectives_data = validated_data.pop('objective_set')
         
         for objective_data in objectives_data:
             # If objective has ID, update existing
             if 'objective_id' in objective_data:
-                objective = instance.objectives.filter(
+                objective = instance.objective_set.filter(
                     objective_id=objective_data['objective_id']
                 ).first()
                 if objective:
@@ -69,6 +209,7 @@ class EvaluationSerializer(serializers.ModelSerializer):
                     objective.save()
             # If no ID, create new objective
             else:
+                objective_data.pop('evaluation', None)
                 Objective.objects.create(
                     evaluation=instance,
                     **objective_data
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from evaluation_app.models import EvalType, Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            "job_id", "kind", "status", "progress", "message", "result", "error",
+            "attempts", "max_attempts", "created_at", "started_at", "finished_at",
+        ]
+        read_only_fields = fields
+
+
+class CycleLaunchSerializer(serializers.Serializer):
+    """Body of POST /api/evaluations/launch-cycle/."""
+    period     = serializers.CharField(max_length=20)
+    type       = serializers.ChoiceField(choices=EvalType.choices)
+    company_id = serializers.UUIDField(required=False)  # ADMIN without X-Company-ID
@@ -20,7 +20,8 @@ class DepartmentSerializer(serializers.ModelSerializer):
         required=False,
         allow_null=True,
     )
-    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all())
+    # ignored unless ADMIN without X-Company-ID: others write to their own company
+    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all(), required=False)
 
 
     class Meta:
@@ -34,7 +35,7 @@ class DepartmentSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ("department_id", "created_at", "updated_at")
+        read_only_fields = ("department_id", "employee_count", "created_at", "updated_at")
 
    # def create(self, data):
    #     company = data.pop("company")
@@ -1,5 +1,9 @@
+import logging
+
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+logger = logging.getLogger(__name__)
+
 class EmailLoginSerializer(TokenObtainPairSerializer):
     """
     Override default claim payload:
@@ -15,5 +19,5 @@ class EmailLoginSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
         token["role"] = user.role
         token["name"] = user.name or user.email
-        print(f"Token and email and name : {token}, {user.email}, {user.role}, {user.name}")
+        logger.info("token issued", extra={"user_id": str(user.pk), "role": user.role})
         return token
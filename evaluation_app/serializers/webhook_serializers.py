@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from evaluation_app.models import WebhookDeadLetter, WebhookEventType, WebhookSubscription
+
+
+class WebhookSubscriptionSerializer(serializers.ModelSerializer):
+    """`secret` is generated on create; receivers verify X-Webhook-Signature with it."""
+    event_types = serializers.ListField(child=serializers.ChoiceField(choices=WebhookEventType.choices),
+                                        allow_empty=False)
+    company_id  = serializers.UUIDField(required=False, write_only=True)  # ADMIN without X-Company-ID
+
+    class Meta:
+        model = WebhookSubscription
+        fields = ["subscription_id", "url", "event_types", "is_active", "secret", "company_id", "created_at"]
+        read_only_fields = ("subscription_id", "secret", "created_at")
+
+    def validate_event_types(self, value):
+        return sorted(set(value))
+
+
+class WebhookDeadLetterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = WebhookDeadLetter
+        fields = ["id", "event", "payload", "attempts", "last_error", "failed_at"]
+        read_only_fields = fields
@@ -0,0 +1,133 @@
+# evaluation_app/services/analytics.py
+"""
+Competency gap analytics.
+
+• gap = required_level − actual_level per Competency row (> 0 = shortfall).
+  Template-backed rows read their name / category / required level from
+  the template (services/templates.py), joined into the same GROUP BY.
+• Everything is one GROUP BY per figure, run in the database (on the read
+  replica when configured); only the aggregated rows reach Python, so the
+  cost doesn't grow with the number of Competency objects.
+• Rows are selected by an exact `period` or by a period range
+  (services/periods.py), which runs as an index range scan.
+• Results are cached per (tenant, period/range, type, options).  Keys embed a
+  version number that Competency signals bump, so any change invalidates
+  every cached report at once; `ANALYTICS_CACHE_SECONDS` bounds staleness
+  from changes signals don't see (department moves, bulk SQL).
+• The version and the reports live in the default cache, which must be
+  shared by every worker (CACHE_URL, settings.py): with a per-process
+  cache a bump in one worker leaves the others serving stale reports.
+  If the version key is evicted, it is re-seeded from the clock rather
+  than reset to 1, so old report keys can't be served again.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, IntegerField, Q
+from django.db.models.expressions import ExpressionWrapper
+
+from evaluation_app.models import Competency
+from evaluation_app.services import periods, templates
+from hr_evaluation.db_router import read_from_replica
+
+VERSION_KEY = "analytics:competency:version"
+GROUPINGS = {
+    "department": ("evaluation__employee__departments__department_id",
+                   "evaluation__employee__departments__name"),
+    "level":      ("evaluation__employee__managerial_level",
+                   "evaluation__employee__managerial_level"),
+}
+GAP = ExpressionWrapper(templates.expression("required_level") - F("actual_level"), output_field=IntegerField())
+
+
+def _seed():
+    return time.time_ns() // 1000   # above any version handed out before an eviction
+
+
+def bump_version():
+    """Invalidate every cached analytics result (called from signals)."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:  # key missing / evicted
+        cache.add(VERSION_KEY, _seed(), timeout=None)
+
+
+def _version():
+    return cache.get_or_set(VERSION_KEY, _seed, timeout=None)
+
+
+def _stats(qs):
+    return qs.annotate(
+        count=Count("pk"),
+        avg_gap=Avg("gap"),
+        below_required=Count("pk", filter=Q(gap__gt=0)),
+    )
+
+
+def _round(rows):
+    for row in rows:
+        row["avg_gap"] = round(row["avg_gap"] or 0, 2)
+        if "competency" in row:
+            row["name"] = row.pop("competency")
+        if "competency_category" in row:
+            row["category"] = row.pop("competency_category")
+    return rows
+
+
+def competency_rows(company_id, period=None, eval_type=None, start=None, end=None):
+    qs = Competency.objects.for_tenant(company_id)
+    if period:
+        qs = qs.filter(evaluation__period=period)
+    if start is not None or end is not None:
+        qs = qs.filter(periods.within(start, end, prefix="evaluation__"))
+    if eval_type:
+        qs = qs.filter(evaluation__type=eval_type)
+    # effective values; annotations may not shadow the model's own columns
+    return qs.annotate(
+        gap=GAP,
+        competency=templates.expression("name"),
+        competency_category=templates.expression("category"),
+    )
+
+
+def gap_matrix(rows, by):
+    """competency × department|level cells."""
+    group_id, group_name = GROUPINGS[by]
+    cells = (_stats(rows.values("competency", group=F(group_name), group_id=F(group_id)))
+             .order_by("competency", "group"))
+    return _round(list(cells))
+
+
+def top_gaps(rows, limit):
+    ranked = (_stats(rows.values("competency", "competency_category"))
+              .order_by("-avg_gap", "-below_required", "competency"))
+    return _round(list(ranked[:limit]))
+
+
+def distribution(rows):
+    """How many rows sit at each gap value (negative = above required)."""
+    return list(rows.values("gap").annotate(count=Count("pk")).order_by("gap"))
+
+
+def competency_gaps(company_id, period=None, eval_type=None, by="department", limit=10, start=None, end=None):
+    key = (f"analytics:gaps:v{_version()}:{company_id or 'all'}:{period or '*'}:{start}:{end}:"
+           f"{eval_type or '*'}:{by}:{limit}")
+    report = cache.get(key)
+    if report is not None:
+        return report
+
+    with read_from_replica():
+        rows = competency_rows(company_id, period, eval_type, start, end)
+        report = {
+            "period": period,
+            "period_from": start,
+            "period_to": end,
+            "type": eval_type,
+            "by": by,
+            "top_gaps": top_gaps(rows, limit),
+            "matrix": gap_matrix(rows, by),
+            "distribution": distribution(rows),
+        }
+    cache.set(key, report, timeout=settings.ANALYTICS_CACHE_SECONDS)
+    return report
@@ -0,0 +1,154 @@
+# evaluation_app/services/archive.py
+"""
+Archival of old COMPLETED evaluations to compressed segment files.
+
+• `archive()` keeps each company's N most recent periods hot.  Older
+  COMPLETED evaluations are snapshotted (evaluation + employee summary +
+  objectives + competencies) and appended to a segment file under
+  ARCHIVE_DIR.  Each record is one JSON line, zlib-compressed on its own,
+  so it can be read back independently.  Then, in one transaction, an
+  ArchivedEvaluation stub (segment, offset, length) replaces the hot rows.
+• Segments are written and fsync'ed before any row is deleted, so a crash
+  can at worst leave unreferenced bytes behind, never lose data.
+• `read_snapshot()` serves a stub through a per-process mmap of its
+  segment; the bytes come from the page cache, with no read() copies.
+• Parquet would need pyarrow, which the project does not depend on.
+"""
+import json
+import mmap
+import os
+import threading
+import uuid
+import zlib
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from evaluation_app.models import (
+    ArchivedEvaluation, Company, Competency, EvalStatus, Evaluation, Objective,
+)
+from evaluation_app.services import templates
+
+STUB_FIELDS = ("type", "score", "period", "period_year", "period_quarter", "period_start", "period_end")
+
+_maps = {}
+_maps_lock = threading.Lock()
+
+
+# ── selection ──────────────────────────────────────────────────────────
+def cutoff(company_id, keep_periods):
+    """period_start of the oldest hot period (None → nothing to archive)."""
+    starts = (Evaluation.objects.filter(company_id=company_id, period_start__isnull=False)
+              .values_list("period_start", flat=True).distinct().order_by("-period_start"))
+    kept = list(starts[:keep_periods])
+    return kept[-1] if len(kept) == keep_periods else None
+
+
+def candidates(company_id, keep_periods):
+    oldest_hot = cutoff(company_id, keep_periods)
+    if oldest_hot is None:
+        return Evaluation.objects.none()
+    return Evaluation.objects.filter(
+        company_id=company_id, status=EvalStatus.COMPLETED, period_start__lt=oldest_hot,
+    )
+
+
+# ── snapshots ──────────────────────────────────────────────────────────
+def snapshots(evaluation_ids):
+    """
+    Plain dicts (no model instances) for a batch, five queries total.
+    Template-backed rows are frozen with their effective values, so the
+    snapshot stays as it was whatever later happens to the template.
+    """
+    children = defaultdict(lambda: {"objectives": [], "competencies": []})
+    for model, key in ((Objective, "objectives"), (Competency, "competencies")):
+        rows = model.objects.filter(evaluation_id__in=evaluation_ids).order_by("created_at").values()
+        for row in templates.resolve_rows(model, rows):
+            children[row["evaluation_id"]][key].append(row)
+
+    evaluations = Evaluation.objects.filter(pk__in=evaluation_ids).values(
+        *(f.attname for f in Evaluation._meta.concrete_fields),
+        employee_name=F("employee__user__name"),
+        employee_email=F("employee__user__email"),
+        reviewer_name=F("reviewer__name"),
+    )
+    return [{**row, **children[row["evaluation_id"]]} for row in evaluations]
+
+
+# ── segments ───────────────────────────────────────────────────────────
+def _segment_path(name):
+    if os.path.basename(name) != name:
+        raise ValueError(f"Bad segment name {name!r}.")
+    return settings.ARCHIVE_DIR / name
+
+
+def write_segment(records):
+    """Append records to a new segment; returns (name, [(offset, length), …])."""
+    settings.ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    name = f"evaluations-{timezone.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.ndjson.z"
+    spans = []
+    with open(_segment_path(name), "xb") as fh:
+        for record in records:
+            blob = zlib.compress(json.dumps(record, cls=DjangoJSONEncoder).encode() + b"\n")
+            spans.append((fh.tell(), len(blob)))
+            fh.write(blob)
+        fh.flush()
+        os.fsync(fh.fileno())
+    return name, spans
+
+
+def _map(name):
+    mapped = _maps.get(name)
+    if mapped is None:
+        with _maps_lock:
+            mapped = _maps.get(name)
+            if mapped is None:
+                with open(_segment_path(name), "rb") as fh:  # the mapping outlives the fd
+                    mapped = _maps[name] = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapped
+
+
+def read_snapshot(stub):
+    blob = _map(stub.segment)[stub.offset:stub.offset + stub.length]
+    return json.loads(zlib.decompress(blob))
+
+
+# ── pipeline ───────────────────────────────────────────────────────────
+def archive_batch(evaluation_ids):
+    records = snapshots(evaluation_ids)
+    if not records:
+        return 0
+    name, spans = write_segment(records)
+    stubs = [
+        ArchivedEvaluation(
+            evaluation_id=record["evaluation_id"], employee_id=record["employee_id"],
+            company_id=record["company_id"], segment=name, offset=offset, length=length,
+            **{field: record[field] for field in STUB_FIELDS},
+        )
+        for record, (offset, length) in zip(records, spans)
+    ]
+    with transaction.atomic():
+        ArchivedEvaluation.objects.bulk_create(stubs)
+        # cascades to objectives / competencies / link rows (+ their signals)
+        Evaluation.objects.filter(pk__in=[stub.evaluation_id for stub in stubs]).delete()
+    return len(stubs)
+
+
+def archive(keep_periods, company_id=None, batch_size=500, dry_run=False, progress=None):
+    """Archive every company's (or one company's) cold evaluations; returns the count."""
+    companies = [company_id] if company_id else list(Company.objects.values_list("pk", flat=True))
+    total = 0
+    for cid in companies:
+        pending = candidates(cid, keep_periods)
+        if dry_run:
+            total += pending.count()
+            continue
+        while ids := list(pending.values_list("pk", flat=True)[:batch_size]):
+            total += archive_batch(ids)
+            if progress:
+                progress(total)
+    return total
@@ -0,0 +1,166 @@
+# evaluation_app/services/changes.py
+"""
+Change feed for delta sync (GET /api/changes/?since=<seq>).
+
+• Signals call `record()` for every save / delete of a `TRACKED` model.
+  Entries are inserted into ChangeLog inside the writing transaction, so
+  they commit or roll back with the data: a crash between the two can't
+  lose one.  Deletes become tombstones.
+• ChangeLog.seq is the high-water mark.  `page()` returns entries after it,
+  one per object (the newest wins), with the current row of every upsert
+  loaded in one query per model.  Clients store `next` and ask again.
+• Entries younger than `SETTLE_SECONDS` are held back.  Sequence values are
+  assigned at insert, and a concurrent transaction may commit its entries
+  after a higher seq was read.  The delay keeps such a late commit from
+  being skipped, so it must exceed the longest writing transaction (see
+  `MAX_WRITE_SECONDS`).
+• `resync()` is for clients without a mark (first sync, or behind `prune()`):
+  one model at a time, keyset-paged on the indexed (updated_at, pk), so
+  no page costs an OFFSET scan.  It hands out the current seq first, so
+  changes made during the resync still arrive through the feed.
+• Bulk writes that bypass signals (`bulk_create`, `QuerySet.update`) must
+  call `record_rows()` themselves.
+• Rows are sent as stored.  Template-backed objectives / competencies leave
+  their inherited columns empty, and the templates are synced as well, so
+  clients resolve them the way services/templates.py does.
+"""
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from evaluation_app.models import (
+    ChangeLog, Company, Competency, CompetencyTemplate, Department, Employee, Evaluation, Objective,
+    ObjectiveTemplate,
+)
+
+TRACKED = (Company, Department, Employee, Evaluation, Objective, Competency, ObjectiveTemplate, CompetencyTemplate)
+MODELS = {model._meta.model_name: model for model in TRACKED}
+# Invariant: every transaction that records changes commits less than
+# SETTLE_SECONDS after its first record(), or a client can read past its
+# entries before they are visible.  Request transactions are single-row
+# writes.  Bulk writers (services/tasks.py) run each batch in `bounded()`,
+# which rolls back instead of committing after MAX_WRITE_SECONDS; the
+# caller retries with a smaller batch.
+SETTLE_SECONDS = 10
+MAX_WRITE_SECONDS = SETTLE_SECONDS / 2
+MAX_PAGE = 5000
+
+
+class WriteTooSlow(Exception):
+    """A `bounded()` block ran past MAX_WRITE_SECONDS and was rolled back."""
+
+
+@contextmanager
+def bounded():
+    """
+    Outermost transaction.atomic() that refuses to commit after
+    MAX_WRITE_SECONDS: its entries could surface after the settle delay.
+    """
+    started = time.monotonic()
+    with transaction.atomic(durable=True):  # durable: leaving the block is the commit
+        yield
+        elapsed = time.monotonic() - started
+        if elapsed > MAX_WRITE_SECONDS:
+            raise WriteTooSlow(f"Transaction took {elapsed:.1f}s (limit {MAX_WRITE_SECONDS}s).")
+
+
+def record_rows(model, rows, deleted=False):
+    """rows: iterable of (pk, company_id).  One INSERT, in the caller's transaction."""
+    now = timezone.now()  # insert time, which SETTLE_SECONDS is measured from
+    name = model._meta.model_name
+    entries = [ChangeLog(model=name, object_id=pk, company_id=company_id, deleted=deleted, recorded_at=now)
+               for pk, company_id in rows]
+    if entries:
+        ChangeLog.objects.bulk_create(entries)
+
+
+def record(instance, deleted=False, company_id=None):
+    tenant = instance.pk if isinstance(instance, Company) else instance.company_id
+    record_rows(type(instance), [(instance.pk, company_id or tenant)], deleted)
+
+
+# ── reading ────────────────────────────────────────────────────────────
+def oldest_seq():
+    return ChangeLog.objects.order_by("seq").values_list("seq", flat=True).first()
+
+
+def page(company_id, since=0, limit=500):
+    """
+    {"changes": [...], "next": seq, "has_more": bool} for entries after `since`.
+    Each change is {"seq", "model", "id", "deleted", "data"} (`data` = the
+    row's current column values, None for tombstones).
+    """
+    settled = timezone.now() - timedelta(seconds=SETTLE_SECONDS)
+    entries = list(
+        ChangeLog.objects.for_tenant(company_id)
+        .filter(seq__gt=since, recorded_at__lte=settled)
+        .order_by("seq")
+        .values_list("seq", "model", "object_id", "deleted")[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest = {}
+    for seq, model, object_id, deleted in entries:  # ascending: the newest entry wins
+        latest[(model, object_id)] = (seq, deleted)
+
+    wanted = {}
+    for (model, object_id), (_, deleted) in latest.items():
+        if not deleted and model in MODELS:
+            wanted.setdefault(model, []).append(object_id)
+    rows = {}
+    for model, ids in wanted.items():
+        for row in MODELS[model].objects.filter(pk__in=ids).values():
+            rows[(model, row[MODELS[model]._meta.pk.attname])] = row
+
+    changes = []
+    for (model, object_id), (seq, deleted) in sorted(latest.items(), key=lambda item: item[1][0]):
+        data = None if deleted else rows.get((model, object_id))
+        if not deleted and data is None:
+            continue  # deleted since; its tombstone follows in a later entry
+        changes.append({"seq": seq, "model": model, "id": object_id, "deleted": deleted, "data": data})
+
+    return {
+        "since": since,
+        "next": entries[-1][0] if entries else since,
+        "has_more": has_more,
+        "changes": changes,
+    }
+
+
+def latest_seq():
+    return ChangeLog.objects.aggregate(seq=Max("seq"))["seq"] or 0
+
+
+def resync(company_id, model, after=None, limit=500):
+    """
+    Current rows of one model ordered by (updated_at, pk), after the
+    `after` = (updated_at, pk) cursor.  Returns {"rows", "next", "seq"}:
+    `next` is the cursor for the following page (None when done) and `seq`
+    the feed position to continue from once every model is synced.
+    """
+    seq = latest_seq()  # read before the rows: later changes stay in the feed
+    pk = MODELS[model]._meta.pk.attname
+    qs = MODELS[model].objects.for_tenant(company_id)
+    if after is not None:
+        updated_at, last_pk = after
+        # the plain `>=` bound lets the planner range-scan the updated_at index
+        qs = qs.filter(Q(updated_at__gt=updated_at) | Q(pk__gt=last_pk), updated_at__gte=updated_at)
+    rows = list(qs.order_by("updated_at", "pk").values()[:limit + 1])
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "rows": rows,
+        "next": (rows[-1]["updated_at"], rows[-1][pk]) if more else None,
+        "seq": seq,
+    }
+
+
+def prune(days):
+    """Drop entries older than `days`; clients further behind must resync."""
+    cutoff = timezone.now() - timedelta(days=days)
+    return ChangeLog.objects.filter(recorded_at__lt=cutoff).delete()[0]
@@ -0,0 +1,61 @@
+# evaluation_app/services/headcount.py
+"""
+Maintained `Department.employee_count` (active employees per department).
+
+• Signals adjust the counter with single `UPDATE … SET employee_count =
+  employee_count ± n` statements, so concurrent writers never lose updates.
+• ACTIVE and DEFAULT_ACTIVE employees count; INACTIVE ones don't.
+• `bulk_create` / raw SQL bypass signals: run `reconcile()` (or
+  `manage.py reconcile_headcounts`) after bulk imports.
+"""
+from django.db.models import Count, Exists, F, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from evaluation_app.models import Department, EmpStatus, Employee, EmployeeDepartment
+
+ACTIVE_STATUSES = (EmpStatus.ACTIVE, EmpStatus.DEFAULT)
+
+
+def is_active(status):
+    return status in ACTIVE_STATUSES
+
+
+def adjust(departments, delta):
+    """Add `delta` to the counters of `departments` (a queryset or pk list)."""
+    if not delta:
+        return
+    if not isinstance(departments, QuerySet):
+        departments = Department.objects.filter(pk__in=list(departments))
+    # clamp at 0: a drifted counter must not break the unsigned column
+    departments.update(employee_count=Greatest(F("employee_count") + delta, 0))
+
+
+def adjust_if_active(department_id, employee_id, delta):
+    """One UPDATE … WHERE EXISTS(active employee): no read round-trip."""
+    active = Employee.objects.filter(pk=employee_id, status__in=ACTIVE_STATUSES)
+    adjust(Department.objects.filter(pk=department_id).filter(Exists(active)), delta)
+
+
+def active_count(employee_ids):
+    return Employee.objects.filter(pk__in=list(employee_ids), status__in=ACTIVE_STATUSES).count()
+
+
+def actual_counts():
+    """Correlated `COUNT(*)` of active members, per department row."""
+    counts = (EmployeeDepartment.objects
+              .filter(department=OuterRef("pk"), employee__status__in=ACTIVE_STATUSES)
+              .values("department")
+              .annotate(n=Count("pk"))
+              .values("n"))
+    return Coalesce(Subquery(counts), 0)
+
+
+def drifted():
+    """Departments whose stored counter disagrees with the membership table."""
+    return Department.objects.annotate(actual=actual_counts()).exclude(employee_count=F("actual"))
+
+
+def reconcile(departments=None):
+    """Recompute counters in one grouped UPDATE; returns rows updated."""
+    qs = Department.objects.all() if departments is None else departments
+    return qs.update(employee_count=actual_counts())
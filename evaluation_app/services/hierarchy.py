@@ -0,0 +1,80 @@
+# evaluation_app/services/hierarchy.py
+"""
+Reporting-line hierarchy backed by a closure table.
+
+• `set_manager()` is the public way to (re)assign a line manager; saving a
+  ReportingLine from anywhere else (admin, shell) goes through the same
+  signal and ends in `move_subtree()`.
+• `move_subtree()` is incremental: it deletes the paths that linked the
+  moved subtree to its old ancestors and inserts (new ancestors × subtree)
+  paths, touching only the rows that actually change.
+• `subtree()` / `reports_of_user()` return `descendant_id` subqueries that
+  resolve with one index range scan, for role-scoped querysets.
+"""
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from evaluation_app.models import ReportingLine, ReportingLineClosure as Closure
+
+
+def ensure_node(employee_id):
+    """Every employee owns a (self, self, 0) row so joins never miss roots."""
+    Closure.objects.get_or_create(ancestor_id=employee_id, descendant_id=employee_id, defaults={"depth": 0})
+
+
+def subtree(employee_id, include_self=False, max_depth=None):
+    """`descendant_id` values under `employee_id`, as a subquery."""
+    rows = Closure.objects.filter(ancestor_id=employee_id)
+    if not include_self:
+        rows = rows.filter(depth__gt=0)
+    if max_depth is not None:
+        rows = rows.filter(depth__lte=max_depth)
+    return rows.values("descendant_id")
+
+
+def reports_of_user(user):
+    """Everyone reporting (transitively) to the employee profile of `user`."""
+    return Closure.objects.filter(ancestor__user=user, depth__gt=0).values("descendant_id")
+
+
+def is_in_subtree(employee_id, root_id):
+    return Closure.objects.filter(ancestor_id=root_id, descendant_id=employee_id).exists()
+
+
+def validate_manager(employee_id, manager_id):
+    if manager_id is None:
+        return
+    if manager_id == employee_id or is_in_subtree(manager_id, employee_id):
+        raise ValidationError("A manager cannot report to their own report (reporting-line cycle).")
+
+
+def move_subtree(employee_id, manager_id):
+    """Re-thread the closure rows of `employee_id`'s subtree under `manager_id`."""
+    with transaction.atomic():
+        ensure_node(employee_id)
+        members = list(Closure.objects.filter(ancestor_id=employee_id).values_list("descendant_id", "depth"))
+        member_ids = subtree(employee_id, include_self=True)
+
+        # detach: paths from outside the subtree into it
+        (Closure.objects.filter(descendant_id__in=member_ids)
+         .exclude(ancestor_id__in=member_ids).delete())
+
+        # attach: every ancestor of the new manager (incl. itself) × every member
+        if manager_id is not None:
+            ensure_node(manager_id)
+            ancestors = Closure.objects.filter(descendant_id=manager_id).values_list("ancestor_id", "depth")
+            Closure.objects.bulk_create([
+                Closure(ancestor_id=a, descendant_id=d, depth=a_depth + d_depth + 1)
+                for a, a_depth in ancestors
+                for d, d_depth in members
+            ], batch_size=1000)
+
+
+def set_manager(employee, manager):
+    """Assign (or clear, with None) `employee`'s line manager."""
+    with transaction.atomic():
+        line, _ = ReportingLine.objects.get_or_create(employee=employee)
+        line.manager = manager
+        line.save()  # → signals: validate_manager + move_subtree
+    return line
+
@@ -0,0 +1,101 @@
+# evaluation_app/services/history.py
+"""
+Per-employee evaluation history (EmployeeEvaluationHistory).
+
+• `rebuild(employee_ids)` recomputes the rows from Evaluation and
+  ArchivedEvaluation: three queries and one upsert per batch, whatever its
+  size.  Archiving deletes the hot row and inserts its stub in the same
+  transaction, so archived evaluations stay in the history.
+• Signals call `touch()` on every evaluation save / delete.  Employee ids
+  are collected per transaction and rebuilt once it commits, so a cascade
+  or a multi-row edit costs one rebuild per employee.  A rollback rebuilds
+  nothing.
+• Bulk writes that bypass signals (`launch_cycle`) call `rebuild()`
+  themselves.  `manage.py rebuild_evaluation_history` backfills.
+"""
+from collections import defaultdict
+from datetime import date
+
+from django.db import transaction
+
+from evaluation_app.models import (
+    ArchivedEvaluation, Employee, EmployeeEvaluationHistory, EvalStatus, Evaluation, Trend,
+)
+
+SIZE = 12   # entries kept per employee
+_UPDATE_FIELDS = ["company", "latest_score", "latest_period", "previous_score", "trend", "total", "entries", "updated_at"]
+
+
+def _entries(employee_ids):
+    """{employee_id: [entry, …]} newest period first, every evaluation (hot + archived)."""
+    found = defaultdict(list)   # employee_id → [(sort key, entry)]
+    for pk, employee_id, type_, period, start, status, score in (
+        Evaluation.objects.filter(employee_id__in=employee_ids)
+        .values_list("pk", "employee_id", "type", "period", "period_start", "status", "score")
+    ):
+        found[employee_id].append(((start or date.min, period), {
+            "id": str(pk), "type": type_, "period": period, "status": status, "score": score, "archived": False,
+        }))
+    for pk, employee_id, type_, period, start, score in (
+        ArchivedEvaluation.objects.filter(employee_id__in=employee_ids)
+        .values_list("pk", "employee_id", "type", "period", "period_start", "score")
+    ):
+        found[employee_id].append(((start or date.min, period), {
+            "id": str(pk), "type": type_, "period": period, "status": EvalStatus.COMPLETED, "score": score,
+            "archived": True,
+        }))
+    return defaultdict(list, {
+        employee_id: [entry for _, entry in sorted(items, key=lambda item: item[0], reverse=True)]
+        for employee_id, items in found.items()
+    })
+
+
+def summarize(employee_id, company_id, entries):
+    scored = [e["score"] for e in entries if e["score"] is not None]
+    latest, previous = (scored + [None, None])[:2]
+    trend = ""
+    if latest is not None and previous is not None:
+        trend = Trend.UP if latest > previous else Trend.DOWN if latest < previous else Trend.FLAT
+    return EmployeeEvaluationHistory(
+        employee_id=employee_id, company_id=company_id,
+        latest_score=latest, previous_score=previous, trend=trend,
+        latest_period=entries[0]["period"] if entries else "",
+        total=len(entries),
+        entries=[{**e, "score": None if e["score"] is None else float(e["score"])} for e in entries[:SIZE]],
+    )
+
+
+def rebuild(employee_ids):
+    employee_ids = list(set(employee_ids))
+    if not employee_ids:
+        return 0
+    companies = dict(Employee.objects.filter(pk__in=employee_ids).values_list("pk", "company_id"))
+    entries = _entries(list(companies))
+    rows = [summarize(pk, company_id, entries[pk]) for pk, company_id in companies.items() if entries[pk]]
+    with transaction.atomic():
+        EmployeeEvaluationHistory.objects.filter(pk__in=employee_ids).exclude(
+            pk__in=[row.employee_id for row in rows]
+        ).delete()
+        EmployeeEvaluationHistory.objects.bulk_create(
+            rows, update_conflicts=True, unique_fields=["employee"], update_fields=_UPDATE_FIELDS,
+        )
+    return len(rows)
+
+
+class _Pending(set):
+    def flush(self):
+        rebuild(self)
+
+
+def touch(employee_id):
+    """Rebuild `employee_id`'s history once the current transaction commits."""
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        rebuild([employee_id])
+        return
+    pending = getattr(connection, "_history_pending", None)
+    # a rollback drops the registered flush along with the pending ids
+    if pending is None or not any(func == pending.flush for _, func, _ in connection.run_on_commit):
+        pending = connection._history_pending = _Pending()
+        transaction.on_commit(pending.flush)
+    pending.add(employee_id)
@@ -0,0 +1,124 @@
+# evaluation_app/services/jobs.py
+"""
+DB-backed job queue (no broker).
+
+• `@handler("kind")` registers a function `fn(job, progress) -> result`
+  (JSON-serializable); handlers live in services/tasks.py, imported by the
+  app config so web and worker processes share one registry.
+• `enqueue()` inserts a QUEUED row; `manage.py run_worker` claims rows with
+  `SELECT … FOR UPDATE SKIP LOCKED` where the backend has it (PostgreSQL)
+  and a compare-and-set UPDATE everywhere, so workers never double-run a job.
+• Failures are retried with exponential backoff until `max_attempts`; a
+  worker that dies mid-job stops heart-beating and `requeue_stale()` hands
+  its job to someone else.  Handlers should therefore be idempotent.
+"""
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from evaluation_app.models import Job, JobStatus
+
+HANDLERS = {}
+RETRY_BASE_SECONDS = 10
+PROGRESS_INTERVAL = 1.0  # seconds between progress writes
+
+
+def handler(kind, max_attempts=3):
+    def register(fn):
+        fn.max_attempts = max_attempts
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+def enqueue(kind, payload=None, *, user=None, company_id=None, delay=0):
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind {kind!r}.")
+    return Job.objects.create(
+        kind=kind,
+        payload=payload or {},
+        max_attempts=HANDLERS[kind].max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+        created_by=user if user is not None and user.is_authenticated else None,
+        company_id=company_id,
+    )
+
+
+# ── worker side ────────────────────────────────────────────────────────
+def claim(worker):
+    """Take the oldest runnable job for `worker`, or None."""
+    now = timezone.now()
+    with transaction.atomic():
+        candidates = Job.objects.filter(status=JobStatus.QUEUED, run_after__lte=now).order_by("run_after")
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        job_id = candidates.values_list("pk", flat=True).first()
+        if job_id is None:
+            return None
+        # compare-and-set: backends without row locks (SQLite) may race here
+        claimed = Job.objects.filter(pk=job_id, status=JobStatus.QUEUED).update(
+            status=JobStatus.RUNNING, worker=worker, attempts=F("attempts") + 1,
+            started_at=now, heartbeat_at=now, progress=0, message="",
+        )
+    return Job.objects.get(pk=job_id) if claimed else None
+
+
+class Progress:
+    """Passed to handlers: `progress(done, total, message)`; also the heartbeat."""
+
+    def __init__(self, job):
+        self.job = job
+        self._last = 0.0
+
+    def __call__(self, done, total=100, message=""):
+        now = time.monotonic()
+        if now - self._last < PROGRESS_INTERVAL and done < total:
+            return
+        self._last = now
+        Job.objects.filter(pk=self.job.pk, worker=self.job.worker).update(
+            progress=min(100, int(done * 100 / total)) if total else 100,
+            message=message[:200],
+            heartbeat_at=timezone.now(),
+        )
+
+
+def _finish(job, **fields):
+    # guarded by `worker`: a job re-queued as stale belongs to someone else now
+    Job.objects.filter(pk=job.pk, worker=job.worker).update(**fields)
+
+
+def run(job):
+    """Execute a claimed job; returns the final (or retry) status."""
+    fn = HANDLERS.get(job.kind)
+    try:
+        if fn is None:
+            raise LookupError(f"No handler registered for {job.kind!r}.")
+        result = fn(job, Progress(job))
+    except Exception:
+        now = timezone.now()
+        if fn is not None and job.attempts < job.max_attempts:
+            delay = RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+            _finish(job, status=JobStatus.QUEUED, worker="", error=traceback.format_exc(),
+                    run_after=now + timedelta(seconds=delay))
+            return JobStatus.QUEUED
+        _finish(job, status=JobStatus.FAILED, error=traceback.format_exc(), finished_at=now)
+        return JobStatus.FAILED
+
+    _finish(job, status=JobStatus.SUCCEEDED, progress=100, result=result, error="",
+            finished_at=timezone.now())
+    return JobStatus.SUCCEEDED
+
+
+def requeue_stale(after_seconds):
+    """Jobs whose worker stopped heart-beating: retry them, or fail when out of attempts."""
+    cutoff = timezone.now() - timedelta(seconds=after_seconds)
+    stale = Job.objects.filter(status=JobStatus.RUNNING, heartbeat_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=JobStatus.FAILED, error="Worker stopped responding.", finished_at=timezone.now(),
+    )
+    requeued = stale.update(status=JobStatus.QUEUED, worker="")
+    return requeued, failed
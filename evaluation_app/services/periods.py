@@ -0,0 +1,85 @@
+# evaluation_app/services/periods.py
+"""
+Structured evaluation periods.
+
+`Evaluation.period` stays free-form ('2025-Q1'); `period_fields()` derives
+the indexed columns from it (pre_save signal, bulk creates; migration 0009
+backfilled them with a frozen copy):
+
+    '2025'            → year 2025,             2025-01-01 … 2025-12-31
+    '2025-Q1', 'Q1 2025' → year 2025, quarter 1, 2025-01-01 … 2025-03-31
+    '2025-H2'         → year 2025,             2025-07-01 … 2025-12-31
+    '2025-03'         → year 2025, quarter 1,  2025-03-01 … 2025-03-31
+
+Unrecognised strings, and years outside 1…9999 ('0000-Q1'), leave the
+columns NULL (they still match exact `period=` lookups).  Range filters use
+`period_start` so they run as index range scans.
+"""
+import calendar
+import re
+from datetime import MAXYEAR, MINYEAR, date
+
+from django.db.models import Q
+
+_PATTERNS = (
+    (re.compile(r"^(?P<year>\d{4})$"), "year"),
+    (re.compile(r"^(?P<year>\d{4})[-/ ]?Q(?P<n>[1-4])$"), "quarter"),
+    (re.compile(r"^Q(?P<n>[1-4])[-/ ]?(?P<year>\d{4})$"), "quarter"),
+    (re.compile(r"^(?P<year>\d{4})[-/ ]?H(?P<n>[12])$"), "half"),
+    (re.compile(r"^(?P<year>\d{4})-(?P<n>0[1-9]|1[0-2])$"), "month"),
+)
+EMPTY = {"period_year": None, "period_quarter": None, "period_start": None, "period_end": None}
+
+
+def _month_end(year, month):
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def period_fields(text):
+    """Column values for a `period` string (all None when unrecognised)."""
+    value = (text or "").strip().upper()
+    for pattern, unit in _PATTERNS:
+        match = pattern.match(value)
+        if match is None:
+            continue
+        year, n = int(match["year"]), int(match.groupdict().get("n") or 0)
+        if not MINYEAR <= year <= MAXYEAR:
+            break
+        if unit == "year":
+            first, last, quarter = 1, 12, None
+        elif unit == "quarter":
+            first, last, quarter = 3 * n - 2, 3 * n, n
+        elif unit == "half":
+            first, last, quarter = 6 * n - 5, 6 * n, None
+        else:
+            first, last, quarter = n, n, (n - 1) // 3 + 1
+        return {
+            "period_year": year,
+            "period_quarter": quarter,
+            "period_start": date(year, first, 1),
+            "period_end": _month_end(year, last),
+        }
+    return dict(EMPTY)
+
+
+def bound(text, end=False):
+    """
+    A range bound from a query parameter: an ISO date, or a period string
+    ('2025', '2025-Q3') whose first (or, with `end`, last) day is used.
+    Raises ValueError when it is neither.
+    """
+    fields = period_fields(text)
+    if fields["period_start"] is not None:
+        return fields["period_end" if end else "period_start"]
+    return date.fromisoformat(text.strip())
+
+
+def within(start=None, end=None, prefix=""):
+    """Q for periods lying inside [start, end]; `prefix` e.g. 'evaluation__'."""
+    q = Q()
+    if start is not None:
+        q &= Q(**{f"{prefix}period_start__gte": start})
+    if end is not None:
+        # the redundant start bound keeps both ends of the index range closed
+        q &= Q(**{f"{prefix}period_start__lte": end, f"{prefix}period_end__lte": end})
+    return q
@@ -0,0 +1,46 @@
+# evaluation_app/services/report_render.py
+"""
+Report rendering, the part of services/reports.py that runs in the pool
+workers.  Kept free of model imports: spawned workers import this module
+before `init_worker` has set Django up.
+"""
+import re
+from functools import lru_cache
+
+from django.template.loader import get_template
+from django.utils import timezone
+
+try:
+    from weasyprint import HTML
+except ImportError:  # optional: PDF output
+    HTML = None
+
+TEMPLATE = "reports/evaluation_report.html"
+FORMATS = ("html", "pdf") if HTML is not None else ("html",)
+
+
+@lru_cache(maxsize=None)
+def _template():
+    """Compiled once per process."""
+    return get_template(TEMPLATE)
+
+
+def init_worker():
+    import django
+    django.setup()  # spawned workers start without the app registry
+
+
+def _filename(record, fmt):
+    name = re.sub(r"[^\w.-]+", "_", record["employee_name"] or "employee").strip("_")
+    return f"{record['period'] or 'no-period'}/{name}-{record['evaluation_id']}.{fmt}"
+
+
+def render_batch(records, fmt="html"):
+    """[(file name, bytes), …] for a batch of snapshot dicts."""
+    template, rendered_at = _template(), timezone.now()
+    out = []
+    for record in records:
+        html = template.render({"evaluation": record, "rendered_at": rendered_at})
+        body = HTML(string=html).write_pdf() if fmt == "pdf" else html.encode()
+        out.append((_filename(record, fmt), body))
+    return out
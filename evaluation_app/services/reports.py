@@ -0,0 +1,99 @@
+# evaluation_app/services/reports.py
+"""
+Per-employee evaluation reports (HTML, or PDF when WeasyPrint is installed).
+
+• Data is fetched in batches: evaluation + employee + objectives +
+  competencies for `BATCH_SIZE` evaluations cost three queries
+  (`archive.snapshots`).  Only plain dicts leave the database layer.
+• Offline callers (`generate_reports`) render batches in a process pool
+  of `REPORT_WORKERS` processes (default: cores, at most 4).  The pool is
+  started on first use and reused.  Each worker compiles the template once
+  and keeps it (services/report_render.py).
+• Web requests pass `parallel=False` and render in the request's own
+  process.  A web worker therefore never starts a pool, so N web workers
+  can't fork N × REPORT_WORKERS renderers.  The view caps such an export
+  at REPORT_SYNC_MAX reports.
+• `zip_stream()` yields a zip archive chunk by chunk, so a whole cycle can
+  be streamed to the client or to disk.  At most two batches per worker
+  are in flight, which bounds memory.
+"""
+import io
+import multiprocessing
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+from evaluation_app.services.archive import snapshots
+from evaluation_app.services.report_render import FORMATS, init_worker, render_batch
+
+BATCH_SIZE = 200
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+# ── orchestration ──────────────────────────────────────────────────────
+def pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a threaded web process can deadlock the child
+            _pool = ProcessPoolExecutor(settings.REPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=init_worker)
+        return _pool
+
+
+def _batches(evaluation_ids, size):
+    for start in range(0, len(evaluation_ids), size):
+        yield snapshots(evaluation_ids[start:start + size])
+
+
+def render(evaluation_ids, fmt="html", batch_size=BATCH_SIZE, parallel=True):
+    """Yield (file name, bytes) per evaluation, in batch order."""
+    evaluation_ids = list(evaluation_ids)
+    if not parallel or len(evaluation_ids) <= batch_size:  # in-process
+        for records in _batches(evaluation_ids, batch_size):
+            yield from render_batch(records, fmt)
+        return
+
+    executor, in_flight = pool(), deque()
+    try:
+        for records in _batches(evaluation_ids, batch_size):
+            in_flight.append(executor.submit(render_batch, records, fmt))
+            if len(in_flight) >= 2 * settings.REPORT_WORKERS:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+    finally:
+        for future in in_flight:  # client went away: drop queued batches
+            future.cancel()
+
+
+class _Sink(io.RawIOBase):
+    """Unseekable write target; zipfile then emits data descriptors."""
+    def __init__(self):
+        self.parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+def zip_stream(evaluation_ids, fmt="html", batch_size=BATCH_SIZE, parallel=True):
+    """Yield the bytes of a zip holding one report per evaluation."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, body in render(evaluation_ids, fmt, batch_size, parallel):
+            archive.writestr(name, body)
+            yield sink.drain()
+    yield sink.drain()  # central directory
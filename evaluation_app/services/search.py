@@ -0,0 +1,126 @@
+# evaluation_app/services/search.py
+"""
+Full-text search over denormalized `SearchDocument` rows.
+
+• One document per employee (name, email, title, departments, company) and
+  per evaluation (the employee's fields + period/type/status + reviewer name
+  + objective titles), rebuilt by signals whenever a source row changes.
+• `matching(kind, q)` returns a SearchDocument queryset that hits the
+  engine index: `tsvector @@ tsquery` (GIN) on PostgreSQL, FTS5 `MATCH` on
+  SQLite, plain `icontains` elsewhere.  Use `.values("object_id")` as a
+  subquery to filter Employee / Evaluation querysets.
+• Every search term is a prefix match and all terms must match.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, Prefetch
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from evaluation_app.models import Employee, Evaluation, Objective, SearchDocument, SearchKind
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+SEPARATOR_RE = re.compile(r"\W+", re.UNICODE)
+MAX_TERMS = 8
+FTS_TABLE = "evaluation_app_searchfts"
+
+
+# ── document bodies ────────────────────────────────────────────────────
+def _employee_terms(employee):
+    user = employee.user
+    terms = [user.name, user.first_name, user.last_name, user.title, user.email]
+    # split the address so "acme" or "dave" alone match on every engine
+    terms.append(SEPARATOR_RE.sub(" ", user.email))
+    terms += [d.name for d in employee.departments.all()]
+    if employee.company is not None:
+        terms.append(employee.company.name)
+    return terms
+
+
+def employee_body(employee):
+    return " ".join(t for t in _employee_terms(employee) if t)
+
+
+def evaluation_body(evaluation):
+    terms = _employee_terms(evaluation.employee)
+    terms += [evaluation.period, evaluation.type, evaluation.status]
+    if evaluation.reviewer is not None:
+        terms.append(evaluation.reviewer.name)
+    terms += [o.effective("title") for o in evaluation.objective_set.all()]
+    return " ".join(t for t in terms if t)
+
+
+# ── indexing ───────────────────────────────────────────────────────────
+def _upsert(kind, rows):
+    now = timezone.now()
+    SearchDocument.objects.bulk_create(
+        [SearchDocument(kind=kind, object_id=pk, company_id=company_id, body=body, updated_at=now)
+         for pk, company_id, body in rows],
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=["company", "body", "updated_at"],
+    )
+
+
+def index_employees(employee_ids):
+    employees = (Employee.objects.filter(pk__in=list(employee_ids))
+                 .select_related("user", "company").prefetch_related("departments"))
+    _upsert(SearchKind.EMPLOYEE, [(e.pk, e.company_id, employee_body(e)) for e in employees])
+
+
+def index_evaluations(evaluation_ids):
+    evaluations = (Evaluation.objects.filter(pk__in=list(evaluation_ids))
+                   .select_related("employee__user", "employee__company", "reviewer")
+                   .prefetch_related("employee__departments",
+                                     Prefetch("objective_set", queryset=Objective.objects.select_related("template"))))
+    _upsert(SearchKind.EVALUATION, [(e.pk, e.company_id, evaluation_body(e)) for e in evaluations])
+
+
+def reindex_employees(employee_ids):
+    """Employee docs + the docs of their evaluations (which embed employee fields)."""
+    employee_ids = list(employee_ids)
+    index_employees(employee_ids)
+    index_evaluations(Evaluation.objects.filter(employee_id__in=employee_ids).values_list("pk", flat=True))
+
+
+def reindex_reviewed(user_id):
+    """Docs of the evaluations `user_id` reviews (they embed the reviewer's name)."""
+    index_evaluations(Evaluation.objects.filter(reviewer_id=user_id).values_list("pk", flat=True))
+
+
+def remove(kind, object_ids):
+    SearchDocument.objects.filter(kind=kind, object_id__in=list(object_ids)).delete()
+
+
+# ── querying ───────────────────────────────────────────────────────────
+def terms(query):
+    return TERM_RE.findall(query.lower())[:MAX_TERMS]
+
+
+def matching(kind, query):
+    """SearchDocument rows of `kind` whose body contains every term (prefix match)."""
+    words = terms(query)
+    if not words:
+        return SearchDocument.objects.none()
+
+    # unqualified columns: the table is re-aliased when used as a subquery
+    if connection.vendor == "postgresql":
+        tsquery = " & ".join(f"{w}:*" for w in words)
+        return SearchDocument.objects.filter(kind=kind).filter(RawSQL(
+            "search_vector @@ to_tsquery('simple', %s)", [tsquery], output_field=BooleanField()
+        ))
+    if connection.vendor == "sqlite":
+        # kind is checked inside the subquery so SQLite drives the lookup from
+        # the FTS match (CROSS JOIN fixes the order) instead of scanning the
+        # (kind, object_id) index
+        fts_query = " ".join(f'"{w}"*' for w in words)
+        return SearchDocument.objects.filter(id__in=RawSQL(
+            f"SELECT d.id FROM {FTS_TABLE} CROSS JOIN {SearchDocument._meta.db_table} d ON d.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND d.kind = %s",
+            [fts_query, kind],
+        ))
+    docs = SearchDocument.objects.filter(kind=kind)
+    for w in words:
+        docs = docs.filter(body__icontains=w)
+    return docs
@@ -0,0 +1,110 @@
+# evaluation_app/services/tasks.py
+"""
+Job handlers (see services/jobs.py).  Each receives the Job row — payload
+in `job.payload`, tenant in `job.company_id` — and a `progress` callable,
+and must be safe to re-run after a partial failure.
+"""
+from django.db import transaction
+
+from evaluation_app.models import (
+    Competency, Department, Employee, EvalStatus, Evaluation, Objective, SearchKind,
+)
+from evaluation_app.services import analytics, changes, headcount, history, search, templates
+from evaluation_app.services.jobs import handler
+from evaluation_app.services.periods import period_fields
+
+BATCH_SIZE = 200  # launch_cycle halves it for a batch that runs too long
+
+
+def _batches(ids, size=BATCH_SIZE):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+@handler("evaluations.launch_cycle")
+def launch_cycle(job, progress):
+    """
+    DRAFT evaluations for every active employee without one for the period,
+    with objectives / competencies instantiated from the matching templates.
+    Each batch commits as a whole, together with its search docs, change-feed
+    entries and history.  A retry after a failure therefore finds either
+    complete evaluations, which it skips, or none, which it creates.
+    A batch that outlasts changes.MAX_WRITE_SECONDS is rolled back and
+    redone in halves, so no change-feed entry commits after the settle delay.
+    """
+    period, eval_type = job.payload["period"], job.payload["type"]
+    employees = Employee.objects.for_tenant(job.company_id).filter(status__in=headcount.ACTIVE_STATUSES)
+    already = Evaluation.objects.filter(period=period, type=eval_type).values("employee_id")
+    todo = list(employees.exclude(pk__in=already).values_list("pk", "company_id"))
+    parsed = period_fields(period)
+
+    done, size = 0, BATCH_SIZE
+    while done < len(todo):
+        batch = todo[done:done + size]
+        try:
+            created = _create_batch(batch, period, eval_type, parsed)
+        except changes.WriteTooSlow:
+            if size == 1:
+                raise
+            size //= 2
+            continue
+        done += len(created)
+        progress(done, len(todo), f"{done}/{len(todo)} evaluations created")
+    return {"created": done}
+
+
+def _create_batch(batch, period, eval_type, parsed):
+    """One launch_cycle batch, in its own bounded transaction; returns the evaluations."""
+    with changes.bounded():
+        # bulk_create skips pre_save: set the tenant key + period columns here
+        created = Evaluation.objects.bulk_create([
+            Evaluation(employee_id=pk, company_id=company_id, type=eval_type,
+                       status=EvalStatus.DRAFT, period=period, **parsed)
+            for pk, company_id in batch
+        ])
+        objectives, competencies = templates.instantiate(created)
+        search.index_evaluations([e.pk for e in created])
+        changes.record_rows(Evaluation, [(e.pk, e.company_id) for e in created])
+        changes.record_rows(Objective, [(o.pk, o.company_id) for o in objectives])
+        changes.record_rows(Competency, [(c.pk, c.company_id) for c in competencies])
+        history.rebuild([e.employee_id for e in created])
+        if competencies:
+            transaction.on_commit(analytics.bump_version)
+    return created
+
+
+@handler("search.rebuild")
+def rebuild_search(job, progress):
+    sources = (
+        (SearchKind.EMPLOYEE, Employee, search.index_employees),
+        (SearchKind.EVALUATION, Evaluation, search.index_evaluations),
+    )
+    ids = {kind: list(model.objects.for_tenant(job.company_id).values_list("pk", flat=True))
+           for kind, model, _ in sources}
+    total, done = sum(len(v) for v in ids.values()), 0
+    for kind, _, index in sources:
+        for batch in _batches(ids[kind], 2000):
+            index(batch)
+            done += len(batch)
+            progress(done, total, f"{kind}: {done}/{total}")
+    return {kind: len(v) for kind, v in ids.items()}
+
+
+@handler("headcount.reconcile")
+def reconcile_headcount(job, progress):
+    return {"departments": headcount.reconcile(Department.objects.for_tenant(job.company_id))}
+
+
+@handler("search.reindex_template")
+def reindex_template(job, progress):
+    """Evaluation docs embedding an objective template's (inherited) title."""
+    ids = list(
+        Evaluation.objects.filter(objective_set__template_id=job.payload["template_id"])
+        .values_list("pk", flat=True).distinct()
+    )
+    done = 0
+    for batch in _batches(ids, 2000):
+        search.index_evaluations(batch)
+        done += len(batch)
+        progress(done, len(ids), f"{done}/{len(ids)} evaluations")
+    return {"evaluations": len(ids)}
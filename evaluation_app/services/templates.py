@@ -0,0 +1,117 @@
+# evaluation_app/services/templates.py
+"""
+Objective / competency templates (copy-on-write).
+
+• An ObjectiveTemplate / CompetencyTemplate holds the wording and weights
+  shared by every evaluation of a department and/or managerial level.
+  `instantiate()` gives each new evaluation one Objective / Competency row
+  per matching active template.  The row stores only `template_id`, the
+  tenant key and the per-employee columns (`achieved`, `status`,
+  `actual_level`).  Its `template_fields` stay empty and are read from the
+  template.  Setting one on the row overrides the template for that row
+  only.
+• Editing a template therefore rewrites no evaluation rows.  Derived data
+  is refreshed instead (signals): the analytics cache version is bumped,
+  and a title change re-indexes the affected evaluations in a background
+  job.
+• Readers resolve the effective values in one of three ways:
+  `row.effective(field)` on instances (select_related("template")),
+  `resolve_rows()` on `.values()` dicts, and `expression(field)` inside
+  queries (COALESCE(row, template)).
+"""
+from collections import defaultdict
+
+from django.db.models import F, Prefetch, Value
+from django.db.models.functions import Coalesce, NullIf
+
+from evaluation_app.models import (
+    Competency, CompetencyTemplate, Employee, Objective, ObjectiveState, ObjectiveTemplate,
+)
+
+TEXT_FIELDS = {"title", "description", "target", "name", "category"}   # inherited when ""
+
+
+# ── reading ────────────────────────────────────────────────────────────
+def expression(field):
+    """The effective value of `field` in a query over Objective / Competency."""
+    own = NullIf(F(field), Value("")) if field in TEXT_FIELDS else F(field)
+    return Coalesce(own, F(f"template__{field}"))
+
+
+def item_prefetches():
+    """An evaluation's objective_set / competency_set, templates joined in."""
+    return (
+        Prefetch("objective_set", queryset=Objective.objects.select_related("template")),
+        Prefetch("competency_set", queryset=Competency.objects.select_related("template")),
+    )
+
+
+def resolve_rows(model, rows):
+    """Fill the inherited fields of `.values()` dicts of `model`: one query."""
+    rows = list(rows)
+    ids = {row["template_id"] for row in rows if row["template_id"] is not None}
+    if not ids:
+        return rows
+    templates = {
+        template["template_id"]: template
+        for template in model.template.field.related_model.objects.filter(pk__in=ids)
+        .values("template_id", *model.template_fields)
+    }
+    for row in rows:
+        template = templates.get(row["template_id"])
+        if template is None:
+            continue
+        for field in model.template_fields:
+            if row[field] in (None, ""):
+                row[field] = template[field]
+    return rows
+
+
+# ── instantiation ──────────────────────────────────────────────────────
+def _applies(template, level, departments):
+    return ((not template.managerial_level or template.managerial_level == level)
+            and (template.department_id is None or template.department_id in departments))
+
+
+def _active(model, company_ids):
+    found = defaultdict(list)
+    for template in model.objects.filter(company_id__in=company_ids, is_active=True).order_by("created_at"):
+        found[template.company_id].append(template)
+    return found
+
+
+def instantiate(evaluations):
+    """
+    Template-backed Objective / Competency rows for new `evaluations`
+    (instances with pk, employee_id and company_id).  Four queries whatever
+    the batch size: placements, both template sets, and one INSERT per
+    model.  bulk_create skips signals; callers record the changes.
+    Returns (objectives, competencies).
+    """
+    evaluations = list(evaluations)
+    placement = defaultdict(lambda: ("", set()))   # employee_id → (level, {department_id})
+    for pk, level, department_id in (
+        Employee.objects.filter(pk__in={e.employee_id for e in evaluations})
+        .values_list("pk", "managerial_level", "departments")
+    ):
+        if pk not in placement:
+            placement[pk] = (level, set())
+        placement[pk][1].add(department_id)
+
+    company_ids = {e.company_id for e in evaluations}
+    objective_templates = _active(ObjectiveTemplate, company_ids)
+    competency_templates = _active(CompetencyTemplate, company_ids)
+
+    objectives, competencies = [], []
+    for evaluation in evaluations:
+        level, departments = placement[evaluation.employee_id]
+        tenant = {"evaluation_id": evaluation.pk, "company_id": evaluation.company_id}
+        objectives += [
+            Objective(template_id=t.pk, status=ObjectiveState.NOT_STARTED, **tenant)
+            for t in objective_templates[evaluation.company_id] if _applies(t, level, departments)
+        ]
+        competencies += [
+            Competency(template_id=t.pk, actual_level=0, **tenant)
+            for t in competency_templates[evaluation.company_id] if _applies(t, level, departments)
+        ]
+    return Objective.objects.bulk_create(objectives), Competency.objects.bulk_create(competencies)
@@ -0,0 +1,294 @@
+# evaluation_app/services/webhooks.py
+"""
+Outbound webhooks.
+
+• Producing: `emit()` inserts one WebhookEvent (outbox) row in the
+  transaction that changed the data.  That is all the request pays: no
+  HTTP, no subscription lookup.  A rolled-back change leaves no event.
+• `manage.py run_webhooks` (one local process) does the rest:
+  – `fan_out()` turns new events into WebhookDelivery rows, one per
+    matching active subscription (bulk insert);
+  – `deliver()` leases up to `BATCH_SIZE` due deliveries of one
+    subscription and POSTs them as a single JSON batch.  The body is
+    signed with the subscription's secret (X-Webhook-Signature =
+    hex HMAC-SHA256 of "<timestamp>.<body>");
+  – 2xx deletes the deliveries.  Anything else re-schedules them with
+    exponential backoff (± jitter).  After `MAX_ATTEMPTS` they move to
+    WebhookDeadLetter.
+• `Sender` keeps one persistent HTTP/1.1 connection per host, so a busy
+  subscriber costs one TCP/TLS handshake, not one per batch.
+• Destinations must be public (SSRF): `public_address()` rejects other
+  schemes and hosts resolving to loopback, private (RFC 1918 / ULA),
+  link-local (cloud metadata, 169.254.169.254), CGNAT or reserved
+  addresses.  It runs when a subscription is saved, and again before
+  every delivery.  The connection then goes to the address that was
+  checked, so a DNS change between the check and the connect can't
+  redirect it.  WEBHOOK_ALLOW_PRIVATE_URLS lifts the address check for
+  local development.
+• Receivers must de-duplicate on the event `id`.  A batch that timed out
+  after the receiver processed it is sent again.
+"""
+import hashlib
+import hmac
+import http.client
+import ipaddress
+import json
+import random
+import secrets
+import socket
+import time
+from collections import defaultdict
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from evaluation_app.models import (
+    EvalStatus, WebhookDeadLetter, WebhookDelivery, WebhookEvent, WebhookEventType, WebhookSubscription,
+)
+
+STATUS_EVENTS = {
+    EvalStatus.APPROVED:  WebhookEventType.EVALUATION_APPROVED,
+    EvalStatus.COMPLETED: WebhookEventType.EVALUATION_COMPLETED,
+}
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 8
+RETRY_BASE_SECONDS = 10
+RETRY_MAX_SECONDS = 6 * 60 * 60
+LEASE_SECONDS = 60    # a crashed dispatcher's batch becomes due again after this
+TIMEOUT_SECONDS = 10
+
+
+# ── destinations ───────────────────────────────────────────────────────
+def public_address(url):
+    """
+    The IP address to deliver `url` to.  Raises ValidationError unless it
+    is http(s) and every address its host resolves to is public.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValidationError("Webhook URLs must be http:// or https:// with a host name.")
+    if parts.username or parts.password:
+        raise ValidationError("Webhook URLs can't carry credentials.")
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        resolved = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except (ValueError, UnicodeError, socket.gaierror):
+        raise ValidationError(f"Can't resolve {parts.hostname}.")
+    addresses = [info[4][0] for info in resolved]
+    if not settings.WEBHOOK_ALLOW_PRIVATE_URLS:
+        for address in addresses:
+            ip = ipaddress.ip_address(address.split("%")[0])
+            ip = getattr(ip, "ipv4_mapped", None) or ip
+            if not ip.is_global or ip.is_multicast:
+                raise ValidationError(f"{parts.hostname} resolves to a non-public address ({address}).")
+    return addresses[0]
+
+
+def new_secret():
+    return secrets.token_hex(32)
+
+
+def sign(secret, timestamp, body):
+    return hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+
+
+# ── producing ──────────────────────────────────────────────────────────
+def evaluation_payload(evaluation, previous_status):
+    return {
+        "evaluation_id": evaluation.pk,
+        "employee_id": evaluation.employee_id,
+        "type": evaluation.type,
+        "period": evaluation.period,
+        "score": evaluation.score,
+        "status": evaluation.status,
+        "previous_status": previous_status,
+        "changed_at": evaluation.updated_at,
+    }
+
+
+def emit(event, company_id, payload):
+    # round-trip through JSON now: UUIDs / Decimals / datetimes as strings
+    data = json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+    return WebhookEvent.objects.create(event=event, company_id=company_id, payload=data)
+
+
+# ── fan-out ────────────────────────────────────────────────────────────
+def fan_out(limit=1000):
+    """Deliveries for up to `limit` new events; returns how many events were handled."""
+    events = list(WebhookEvent.objects.filter(dispatched=False).order_by("pk")
+                  .values_list("pk", "event", "company_id")[:limit])
+    if not events:
+        return 0
+    subscriptions = defaultdict(list)
+    for pk, company_id, event_types in (WebhookSubscription.objects
+                                        .filter(is_active=True, company_id__in={e[2] for e in events})
+                                        .values_list("pk", "company_id", "event_types")):
+        subscriptions[company_id].append((pk, set(event_types)))
+
+    deliveries, unwanted = [], []
+    for event_id, event, company_id in events:
+        targets = [pk for pk, types in subscriptions[company_id] if event in types]
+        deliveries += [WebhookDelivery(subscription_id=pk, event_id=event_id) for pk in targets]
+        if not targets:
+            unwanted.append(event_id)
+
+    with transaction.atomic():
+        ids = [e[0] for e in events]
+        if WebhookEvent.objects.filter(pk__in=ids, dispatched=False).update(dispatched=True) != len(ids):
+            transaction.set_rollback(True)  # another dispatcher got there first
+            return 0
+        WebhookDelivery.objects.bulk_create(deliveries)
+        WebhookEvent.objects.filter(pk__in=unwanted).delete()
+    return len(events)
+
+
+# ── delivery ───────────────────────────────────────────────────────────
+class Sender:
+    """POSTs over persistent connections, one per (scheme, host, port)."""
+
+    def __init__(self, timeout=TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self.connections = {}
+
+    def post(self, url, body, headers, address=None):
+        """`address`: connect there instead of resolving the host again."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port, address)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        while True:
+            reused = key in self.connections
+            conn = self.connections.get(key) or self._connect(parts, address)
+            try:
+                conn.request("POST", path, body, {**headers, "Connection": "keep-alive"})
+                response = conn.getresponse()
+                data = response.read()  # drained, so the connection can be reused
+            except (http.client.HTTPException, OSError):
+                self._drop(key)
+                if reused:
+                    continue  # the server closed an idle connection: retry once on a fresh one
+                raise
+            if response.will_close:
+                self._drop(key)
+            else:
+                self.connections[key] = conn
+            return response.status, data
+
+    def _connect(self, parts, address=None):
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = cls(parts.hostname, parts.port, timeout=self.timeout)
+        if address is not None:
+            # Host header, SNI and certificate checks still use the host name
+            conn._create_connection = lambda addr, *args, **kwargs: socket.create_connection(
+                (address, addr[1]), *args, **kwargs)
+        return conn
+
+    def _drop(self, key):
+        conn = self.connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        for key in list(self.connections):
+            self._drop(key)
+
+
+def due_subscriptions(limit=100):
+    return list(WebhookDelivery.objects.filter(next_attempt_at__lte=timezone.now())
+                .order_by().values_list("subscription_id", flat=True).distinct()[:limit])
+
+
+def _lease(subscription_id):
+    now = timezone.now()
+    ids = list(WebhookDelivery.objects.filter(subscription_id=subscription_id, next_attempt_at__lte=now)
+               .order_by("event_id").values_list("pk", flat=True)[:BATCH_SIZE])
+    until = now + timedelta(seconds=LEASE_SECONDS)
+    WebhookDelivery.objects.filter(pk__in=ids, next_attempt_at__lte=now).update(next_attempt_at=until)
+    # only the rows this update moved carry exactly `until`
+    return list(WebhookDelivery.objects.filter(pk__in=ids, next_attempt_at=until).select_related("event"))
+
+
+def backoff(attempts):
+    delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def _failed(subscription, deliveries, error):
+    now, dead = timezone.now(), []
+    by_attempts = defaultdict(list)
+    for delivery in deliveries:
+        if delivery.attempts + 1 >= MAX_ATTEMPTS:
+            dead.append(delivery)
+        else:
+            by_attempts[delivery.attempts + 1].append(delivery.pk)
+    for attempts, ids in by_attempts.items():
+        WebhookDelivery.objects.filter(pk__in=ids).update(
+            attempts=attempts, next_attempt_at=now + backoff(attempts), last_error=error,
+        )
+    if dead:
+        with transaction.atomic():
+            WebhookDeadLetter.objects.bulk_create([
+                WebhookDeadLetter(subscription=subscription, event=d.event.event, payload=d.event.payload,
+                                  attempts=d.attempts + 1, last_error=error)
+                for d in dead
+            ])
+            _forget(dead)
+
+
+def _forget(deliveries):
+    event_ids = {d.event_id for d in deliveries}
+    WebhookDelivery.objects.filter(pk__in=[d.pk for d in deliveries]).delete()
+    # events no other subscription still waits for
+    WebhookEvent.objects.filter(pk__in=event_ids, deliveries__isnull=True).delete()
+
+
+def deliver(subscription_id, sender):
+    """Send one batch to one subscription; returns (sent, failed) counts."""
+    subscription = WebhookSubscription.objects.filter(pk=subscription_id).first()
+    deliveries = _lease(subscription_id) if subscription else []
+    if not deliveries:
+        return 0, 0
+    if not subscription.is_active:
+        _forget(deliveries)  # switched off: drop what it was owed
+        return 0, 0
+
+    body = json.dumps({"events": [
+        {"id": d.event_id, "event": d.event.event, "created_at": d.event.created_at, "data": d.event.payload}
+        for d in deliveries
+    ]}, cls=DjangoJSONEncoder).encode()
+    timestamp = str(int(time.time()))
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "hr-eval-webhooks/1",
+        "X-Webhook-Id": str(subscription.pk),
+        "X-Webhook-Timestamp": timestamp,
+        "X-Webhook-Signature": sign(subscription.secret, timestamp, body),
+    }
+    try:
+        address = public_address(subscription.url)  # DNS may have changed since the subscription was saved
+        status, response = sender.post(subscription.url, body, headers, address)
+        error = "" if 200 <= status < 300 else f"HTTP {status}: {response[:500].decode(errors='replace')}"
+    except ValidationError as exc:
+        error = f"Blocked: {' '.join(exc.messages)}"
+    except (http.client.HTTPException, OSError) as exc:
+        error = f"{type(exc).__name__}: {exc}"
+
+    if error:
+        _failed(subscription, deliveries, error)
+        return 0, len(deliveries)
+    _forget(deliveries)
+    return len(deliveries), 0
+
+
+def requeue(dead_letters):
+    """Give dead letters a fresh set of attempts."""
+    with transaction.atomic():
+        for letter in dead_letters:
+            event = WebhookEvent.objects.create(event=letter.event, company_id=letter.subscription.company_id,
+                                                payload=letter.payload, dispatched=True)
+            WebhookDelivery.objects.create(subscription_id=letter.subscription_id, event=event)
+            letter.delete()
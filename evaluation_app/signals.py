@@ -0,0 +1,330 @@
+# evaluation_app/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from evaluation_app.models import (
+    Company, Competency, CompetencyTemplate, Department, Employee, EmployeeDepartment,
+    EmployeeEvaluationHistory, Evaluation, Objective, ObjectiveTemplate, ReportingLine, SearchKind,
+)
+from evaluation_app import capabilities
+from evaluation_app.services import analytics, changes, headcount, hierarchy, history, jobs, search, webhooks
+from evaluation_app.services.periods import period_fields
+
+
+# ── Tenant key denormalization ──────────────────────────────────────────
+@receiver(pre_save, sender=Evaluation)
+def evaluation_tenant(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.company_id = instance.employee.company_id
+
+
+# ── Structured period columns ───────────────────────────────────────────
+@receiver(pre_save, sender=Evaluation)
+def evaluation_period(sender, instance, raw=False, **kwargs):
+    if not raw:
+        for field, value in period_fields(instance.period).items():
+            setattr(instance, field, value)
+
+
+@receiver(pre_save, sender=Objective)
+@receiver(pre_save, sender=Competency)
+def evaluation_item_tenant(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.company_id = instance.evaluation.company_id
+
+
+@receiver(pre_save, sender=Employee)
+def employee_remember_company(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or (update_fields is not None and "company" not in update_fields):
+        return
+    instance._previous_company_id = (
+        Employee.objects.filter(pk=instance.pk).values_list("company_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Employee)
+def employee_company_moved(sender, instance, created, raw=False, **kwargs):
+    """Re-key the employee's evaluation data when they move to another company."""
+    previous = instance.__dict__.pop("_previous_company_id", instance.company_id)
+    if raw or created or previous == instance.company_id:
+        return
+    evaluations = Evaluation.objects.filter(employee=instance)
+    moved = {
+        model: list(qs.values_list("pk", flat=True))
+        for model, qs in ((Evaluation, evaluations),
+                          (Objective, Objective.objects.filter(evaluation__in=evaluations)),
+                          (Competency, Competency.objects.filter(evaluation__in=evaluations)))
+    }
+    evaluations.update(company_id=instance.company_id)
+    Objective.objects.filter(evaluation__in=evaluations).update(company_id=instance.company_id)
+    Competency.objects.filter(evaluation__in=evaluations).update(company_id=instance.company_id)
+    EmployeeEvaluationHistory.objects.filter(employee=instance).update(company_id=instance.company_id)
+    # change feed: gone from the old company's feed, new in the new one's
+    changes.record(instance, deleted=True, company_id=previous)
+    for model, ids in moved.items():
+        changes.record_rows(model, [(pk, previous) for pk in ids], deleted=True)
+        changes.record_rows(model, [(pk, instance.company_id) for pk in ids])
+
+
+# ── Search index sync ───────────────────────────────────────────────────
+# Run after commit so rolled-back writes never reach the index.
+USER_SEARCH_FIELDS = {"name", "first_name", "last_name", "email", "title"}
+
+
+@receiver(post_save, sender=Employee)
+def search_employee_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(lambda: search.reindex_employees([instance.pk]))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def search_user_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not update_fields & USER_SEARCH_FIELDS):
+        return  # e.g. the last_login bump on every JWT login
+    employee_ids = list(Employee.objects.filter(user=instance).values_list("pk", flat=True))
+    if employee_ids:
+        transaction.on_commit(lambda: search.reindex_employees(employee_ids))
+    if update_fields is None or "name" in update_fields:
+        transaction.on_commit(lambda: search.reindex_reviewed(instance.pk))
+
+
+@receiver(post_save, sender=EmployeeDepartment)
+@receiver(post_delete, sender=EmployeeDepartment)
+def search_placement_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(lambda: search.reindex_employees([instance.employee_id]))
+
+
+@receiver(m2m_changed, sender=Employee.departments.through)
+def search_departments_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    # department.employees.clear() reports no pk_set; those docs refresh on the next rebuild
+    employee_ids = list(pk_set or ()) if reverse else [instance.pk]
+    if employee_ids:
+        transaction.on_commit(lambda: search.reindex_employees(employee_ids))
+
+
+@receiver(post_save, sender=Department)
+def search_department_saved(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    employee_ids = list(instance.employees.values_list("pk", flat=True))
+    transaction.on_commit(lambda: search.reindex_employees(employee_ids))
+
+
+@receiver(post_save, sender=Company)
+def search_company_saved(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    employee_ids = list(Employee.objects.filter(company=instance).values_list("pk", flat=True))
+    transaction.on_commit(lambda: search.reindex_employees(employee_ids))
+
+
+@receiver(post_save, sender=Evaluation)
+def search_evaluation_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(lambda: search.index_evaluations([instance.pk]))
+
+
+@receiver(post_save, sender=Objective)
+@receiver(post_delete, sender=Objective)
+def search_objective_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(lambda: search.index_evaluations([instance.evaluation_id]))
+
+
+@receiver(pre_save, sender=ObjectiveTemplate)
+def search_template_remember_title(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or (update_fields is not None and "title" not in update_fields):
+        return
+    instance._previous_title = (
+        ObjectiveTemplate.objects.filter(pk=instance.pk).values_list("title", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=ObjectiveTemplate)
+def search_template_saved(sender, instance, created, raw=False, **kwargs):
+    # evaluation docs embed the inherited title; there can be thousands of them
+    if raw or created or instance.__dict__.pop("_previous_title", instance.title) == instance.title:
+        return
+    payload = {"template_id": str(instance.pk)}
+    transaction.on_commit(
+        lambda: jobs.enqueue("search.reindex_template", payload, company_id=instance.company_id)
+    )
+
+
+@receiver(post_delete, sender=Employee)
+def search_employee_deleted(sender, instance, **kwargs):
+    search.remove(SearchKind.EMPLOYEE, [instance.pk])
+
+
+@receiver(post_delete, sender=Evaluation)
+def search_evaluation_deleted(sender, instance, **kwargs):
+    search.remove(SearchKind.EVALUATION, [instance.pk])
+
+
+# ── Reporting-line closure ──────────────────────────────────────────────
+@receiver(post_save, sender=Employee)
+def hierarchy_employee_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        hierarchy.ensure_node(instance.pk)
+
+
+@receiver(pre_save, sender=ReportingLine)
+def hierarchy_line_validate(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    hierarchy.validate_manager(instance.employee_id, instance.manager_id)
+    instance._previous_manager_id = (
+        ReportingLine.objects.filter(pk=instance.pk).values_list("manager_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=ReportingLine)
+def hierarchy_line_saved(sender, instance, raw=False, **kwargs):
+    previous = instance.__dict__.pop("_previous_manager_id", None)
+    if not raw and previous != instance.manager_id:
+        hierarchy.move_subtree(instance.employee_id, instance.manager_id)
+
+
+@receiver(post_delete, sender=ReportingLine)
+def hierarchy_line_deleted(sender, instance, **kwargs):
+    if Employee.objects.filter(pk=instance.employee_id).exists():  # not an employee cascade
+        hierarchy.move_subtree(instance.employee_id, None)
+
+
+@receiver(pre_delete, sender=Employee)
+def hierarchy_employee_deleted(sender, instance, **kwargs):
+    # ReportingLine.manager is SET_NULL'd by a bulk UPDATE (no signals): detach the reports here
+    for report_id in ReportingLine.objects.filter(manager=instance).values_list("employee_id", flat=True):
+        hierarchy.move_subtree(report_id, None)
+
+
+# ── Department headcount ────────────────────────────────────────────────
+# Membership rows are created by .create()/save() (post_save) or by
+# employee.departments.add() (bulk insert → m2m_changed post_add only).
+# Every removal path — delete(), .remove(), .clear(), cascades — goes through
+# a collector delete that sends post_delete per row, so that's the only one
+# counted for removals.
+@receiver(post_save, sender=EmployeeDepartment)
+def headcount_member_added(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        headcount.adjust_if_active(instance.department_id, instance.employee_id, +1)
+
+
+@receiver(post_delete, sender=EmployeeDepartment)
+def headcount_member_removed(sender, instance, **kwargs):
+    headcount.adjust_if_active(instance.department_id, instance.employee_id, -1)
+
+
+@receiver(m2m_changed, sender=Employee.departments.through)
+def headcount_members_added(sender, instance, action, reverse, pk_set, **kwargs):
+    if action != "post_add" or not pk_set:
+        return  # pk_set holds only the newly inserted ids
+    if reverse:   # department.employees.add(*employees)
+        headcount.adjust([instance.pk], headcount.active_count(pk_set))
+    elif headcount.is_active(instance.status):   # employee.departments.add(*departments)
+        headcount.adjust(pk_set, +1)
+
+
+@receiver(pre_save, sender=Employee)
+def headcount_remember_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or (update_fields is not None and "status" not in update_fields):
+        return
+    instance._previous_status = (
+        Employee.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Employee)
+def headcount_status_changed(sender, instance, raw=False, **kwargs):
+    previous = instance.__dict__.pop("_previous_status", instance.status)
+    was, now = headcount.is_active(previous), headcount.is_active(instance.status)
+    if not raw and was != now:
+        headcount.adjust(Department.objects.filter(employees=instance), +1 if now else -1)
+
+
+# ── Analytics cache ─────────────────────────────────────────────────────
+@receiver(post_save, sender=Competency)
+@receiver(post_delete, sender=Competency)
+@receiver(post_save, sender=CompetencyTemplate)
+@receiver(post_delete, sender=CompetencyTemplate)
+def analytics_competency_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(analytics.bump_version)
+
+
+# ── Change feed ─────────────────────────────────────────────────────────
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Evaluation)
+@receiver(post_save, sender=Objective)
+@receiver(post_save, sender=Competency)
+@receiver(post_save, sender=ObjectiveTemplate)
+@receiver(post_save, sender=CompetencyTemplate)
+def changes_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        changes.record(instance)
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Evaluation)
+@receiver(post_delete, sender=Objective)
+@receiver(post_delete, sender=Competency)
+@receiver(post_delete, sender=ObjectiveTemplate)
+@receiver(post_delete, sender=CompetencyTemplate)
+def changes_deleted(sender, instance, **kwargs):
+    changes.record(instance, deleted=True)
+
+
+# ── Webhooks (outbox) ───────────────────────────────────────────────────
+@receiver(pre_save, sender=Evaluation)
+def webhooks_remember_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or (update_fields is not None and "status" not in update_fields):
+        return
+    instance._previous_status = (
+        Evaluation.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Evaluation)
+def webhooks_status_changed(sender, instance, created, raw=False, **kwargs):
+    previous = instance.__dict__.pop("_previous_status", instance.status)
+    if created:
+        previous = None
+    event = webhooks.STATUS_EVENTS.get(instance.status)
+    if not raw and event and previous != instance.status:
+        webhooks.emit(event, instance.company_id, webhooks.evaluation_payload(instance, previous))
+
+
+# ── Evaluation history ──────────────────────────────────────────────────
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+def history_evaluation_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        history.touch(instance.employee_id)
+
+
+# ── Capability cache ────────────────────────────────────────────────────
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def capabilities_role_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or (update_fields is not None and "role" not in update_fields):
+        return
+    previous = type(instance).objects.filter(pk=instance.pk).values_list("role", flat=True).first()
+    if previous != instance.role:
+        capabilities.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def capabilities_profile_changed(sender, instance, **kwargs):
+    # the cached set carries the profile's employee_id / company_id
+    capabilities.invalidate(instance.user_id)
@@ -0,0 +1,176 @@
+# evaluation_app/throttling.py
+"""
+Token-bucket API throttles.
+
+• A rate is "<count>/<period>[:<burst>]", e.g. "120/min:30": the bucket
+  refills at 2 tokens/s and holds at most 30.  So a client can burst 30
+  requests, then gets 2/s.  Each request takes one token.  An empty bucket
+  → 429 with Retry-After set to when the next token arrives.
+• `RoleRateThrottle` (the default for every API view) picks the rate from
+  settings.THROTTLE_RATES[scope][role].  The scope is the view's
+  `throttle_scope`, and "*" is the fallback at both levels.  Anonymous
+  requests use the "ANON" role, keyed by client IP.
+• `LoginRateThrottle` guards /api/auth/login/ with two buckets: one per
+  submitted e-mail / username (slow password guessing against one account)
+  and one per IP (spraying many accounts).  Both must have a token, and
+  a request denied by one bucket takes no token from the other.
+• Client IPs come from DRF's `get_ident()`.  It trusts X-Forwarded-For
+  only as far as settings NUM_PROXIES (the number of reverse proxies in
+  front of the app), so a client can't pick its own bucket.
+• Bucket state lives in `LocalBucketStore` (per process, no I/O) or, with
+  THROTTLE_STORE=cache, in the Django cache, shared by every process.  The
+  cache store does get-then-set without a lock, so concurrent requests
+  can over-admit by a few requests.  A store's `consume()` takes one token
+  from each of a request's buckets, or from none of them if any is empty.
+"""
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+_PERIODS = {"s": 1, "sec": 1, "second": 1, "m": 60, "min": 60, "minute": 60,
+            "h": 3600, "hour": 3600, "d": 86400, "day": 86400}
+_RATE = re.compile(r"^\s*(\d+)\s*/\s*([a-z]+)\s*(?::\s*(\d+))?\s*$")
+
+
+@dataclass(frozen=True)
+class Rate:
+    per_second: float
+    burst: int
+
+    @classmethod
+    def parse(cls, text):
+        match = _RATE.match(text.lower())
+        if match is None or match[2] not in _PERIODS:
+            raise ValueError(f"Bad throttle rate {text!r} (expected e.g. '120/min:30').")
+        count = int(match[1])
+        return cls(count / _PERIODS[match[2]], int(match[3] or count))
+
+
+def take(state, rate, now):
+    """Refill by elapsed time, take one token → (new state, seconds to wait or 0)."""
+    tokens, stamp = state if state is not None else (rate.burst, now)
+    tokens = min(rate.burst, tokens + max(0.0, now - stamp) * rate.per_second)
+    if tokens >= 1:
+        return (tokens - 1, now), 0.0
+    return (tokens, now), (1 - tokens) / rate.per_second
+
+
+# ── stores ─────────────────────────────────────────────────────────────
+def take_all(states, rates, now):
+    """`take` over several buckets → (new states, wait); states unchanged unless all admit."""
+    results = [take(state, rate, now) for state, rate in zip(states, rates)]
+    wait = max((w for _, w in results), default=0.0)
+    return (states if wait else [state for state, _ in results]), wait
+
+
+class LocalBucketStore:
+    """In-process buckets (LRU-bounded); limits then apply per process."""
+
+    def __init__(self, max_keys=100_000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, buckets):
+        """buckets: [(key, Rate)] → seconds to wait (0 = admitted)."""
+        with self._lock:
+            states, wait = take_all([self._buckets.get(key) for key, _ in buckets],
+                                    [rate for _, rate in buckets], time.monotonic())
+            for (key, _), state in zip(buckets, states):
+                if state is None:
+                    continue
+                self._buckets[key] = state
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)  # least recently seen
+        return wait
+
+
+class CacheBucketStore:
+    """Buckets in the Django cache (shared across processes / hosts)."""
+
+    def consume(self, buckets):
+        """buckets: [(key, Rate)] → seconds to wait (0 = admitted)."""
+        keys = [f"throttle:{key}" for key, _ in buckets]
+        found = cache.get_many(keys)
+        states, wait = take_all([found.get(key) for key in keys], [rate for _, rate in buckets], time.time())
+        if not wait:
+            for key, (_, rate), state in zip(keys, buckets, states):
+                # once the bucket would be full again, a missing key means the same
+                cache.set(key, state, timeout=math.ceil(rate.burst / rate.per_second) + 1)
+        return wait
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CacheBucketStore() if settings.THROTTLE_STORE == "cache" else LocalBucketStore()
+    return _store
+
+
+_rates = {}
+
+
+def rate(text):
+    """Parsed (and memoised) rate string."""
+    if text not in _rates:
+        _rates[text] = Rate.parse(text)
+    return _rates[text]
+
+
+# ── DRF throttles ──────────────────────────────────────────────────────
+class TokenBucketThrottle(BaseThrottle):
+    """Base: subclasses return [(bucket key, rate string)]; all must admit."""
+
+    def buckets(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+        buckets = [(key, rate(text)) for key, text in self.buckets(request, view)]
+        self._wait = store().consume(buckets) if buckets else 0.0
+        return self._wait == 0
+
+    def wait(self):
+        return self._wait
+
+
+class RoleRateThrottle(TokenBucketThrottle):
+    def buckets(self, request, view):
+        scope = getattr(view, "throttle_scope", None) or "*"
+        rates = settings.THROTTLE_RATES
+        per_role = rates.get(scope) or rates["*"]
+        user = request.user
+        if user and user.is_authenticated:
+            role, ident = user.role, f"user:{user.pk}"
+        else:
+            role, ident = "ANON", f"ip:{self.get_ident(request)}"
+        text = per_role.get(role) or per_role.get("*") or rates["*"].get(role) or rates["*"]["*"]
+        return [(f"{scope}:{ident}", text)]
+
+
+class LoginRateThrottle(TokenBucketThrottle):
+    def buckets(self, request, view):
+        if request.method != "POST":
+            return []
+        limits = settings.LOGIN_THROTTLE_RATES
+        buckets = [(f"login:ip:{self.get_ident(request)}", limits["ip"])]
+        data = request.data if hasattr(request.data, "get") else {}
+        account = data.get("email") or data.get("username")
+        if isinstance(account, str) and account.strip():
+            buckets.append((f"login:account:{account.strip().lower()}", limits["email"]))
+        return buckets
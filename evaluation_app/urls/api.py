@@ -1,8 +1,15 @@
 # evaluation_app/urls/api.py
 from rest_framework.routers import DefaultRouter
 from evaluation_app.views.employee import EmployeeViewSet
-from evaluation_app.views.evaluationViewSet import EvaluationViewSet
+from evaluation_app.views.evaluationViewSet import ArchivedEvaluationViewSet, EvaluationViewSet
 from evaluation_app.views.auth import EmailLoginView 
+from evaluation_app.views.analytics import CompetencyGapView
+from evaluation_app.views.changes import ChangeFeedView
+from evaluation_app.views.history import EvaluationHistoryView
+from evaluation_app.views.jobs import JobViewSet
+from evaluation_app.views.profiling import ProfiledRequestView, ProfilingFlameGraphView, ProfilingView
+from evaluation_app.views.templates import CompetencyTemplateViewSet, ObjectiveTemplateViewSet
+from evaluation_app.views.webhooks import WebhookSubscriptionViewSet
 
 from django.urls import path
 from rest_framework_simplejwt.views import  (
@@ -14,12 +21,27 @@ router = DefaultRouter()
 #router.register(r"employees", EmployeeViewSet)
 router.register("employees", EmployeeViewSet, basename="employee") #GET /api/employees/  & GET /api/employees/{employee_id}/
 router.register("evaluations", EvaluationViewSet, basename="evaluation") #GET /api/evaluations/  
+router.register("archived-evaluations", ArchivedEvaluationViewSet, basename="archived-evaluation") #GET /api/archived-evaluations/{evaluation_id}/
+router.register("jobs", JobViewSet, basename="job") #GET /api/jobs/{job_id}/  (background job status)
+router.register("webhooks", WebhookSubscriptionViewSet, basename="webhook") #CRUD /api/webhooks/  (outbound subscriptions)
+router.register("objective-templates", ObjectiveTemplateViewSet, basename="objective-template") #CRUD /api/objective-templates/
+router.register("competency-templates", CompetencyTemplateViewSet, basename="competency-template") #CRUD /api/competency-templates/
 
 urlpatterns = [
     # JWT
     path("auth/login/",   EmailLoginView.as_view(),   name="jwt-login"),
     path("auth/refresh/", TokenRefreshView.as_view(),      name="jwt-refresh"),
     path("auth/logout/",  TokenBlacklistView.as_view(),    name="jwt-logout"),
+    # analytics
+    path("analytics/competency-gaps/", CompetencyGapView.as_view(), name="competency-gaps"),
+    # precomputed per-employee history (bulk)
+    path("evaluation-history/", EvaluationHistoryView.as_view(), name="evaluation-history"),
+    # delta sync
+    path("changes/", ChangeFeedView.as_view(), name="change-feed"),
+    # on-demand profiling (ADMIN)
+    path("profiling/", ProfilingView.as_view(), name="profiling"),
+    path("profiling/flamegraph/", ProfilingFlameGraphView.as_view(), name="profiling-flamegraph"),
+    path("profiling/requests/<int:slot>/", ProfiledRequestView.as_view(), name="profiling-request"),
     # REST resources   
     *router.urls
 ]          
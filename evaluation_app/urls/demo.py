@@ -1,7 +1,8 @@
 from django.urls import path
-from evaluation_app.views.htmx_demo import employee_list, employee_create
+from evaluation_app.views.htmx_demo import employee_list, employee_create, employee_status
 
 urlpatterns = [
-    path("employees/",            employee_list,  name="emp-list"),
-    path("employees/create/",     employee_create, name="emp-create"),
+    path("employees/",                          employee_list,   name="emp-list"),
+    path("employees/create/",                   employee_create, name="emp-create"),
+    path("employees/<uuid:employee_id>/status/", employee_status, name="emp-status"),
 ]
@@ -0,0 +1,48 @@
+# evaluation_app/views/analytics.py
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from evaluation_app.filters import period_bound
+from evaluation_app.models import EvalType
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.services import analytics
+from evaluation_app.views.mixins import resolve_tenant
+
+
+class CompetencyGapView(APIView):
+    """
+    GET /api/analytics/competency-gaps/?period=2025-Q1[&type=QUARTERLY][&by=department|level][&top=10]
+    GET /api/analytics/competency-gaps/?period_from=2025-Q1&period_to=2025-Q4[&…]
+
+    Gap matrix (competency × department or managerial level), top-N gaps and
+    the gap distribution for one period (or a period range), scoped to the
+    caller's company.
+    ADMIN / HR / HOD only.
+    """
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    required_capabilities = {"*": (Cap.ANALYTICS_VIEW,)}
+
+    def get(self, request):
+        params = request.query_params
+        period = params.get("period") or None
+        start = period_bound(params, "period_from")
+        end = period_bound(params, "period_to", end=True)
+        if period is None and start is None and end is None:
+            raise ValidationError({"period": "Required (e.g. 2025-Q1), or period_from / period_to."})
+        eval_type = params.get("type") or None
+        if eval_type and eval_type not in EvalType.values:
+            raise ValidationError({"type": f"One of {', '.join(EvalType.values)}."})
+        by = params.get("by", "department")
+        if by not in analytics.GROUPINGS:
+            raise ValidationError({"by": f"One of {', '.join(analytics.GROUPINGS)}."})
+        try:
+            top = min(max(int(params.get("top", 10)), 1), 100)
+        except ValueError:
+            raise ValidationError({"top": "Must be an integer."})
+
+        return Response(analytics.competency_gaps(
+            resolve_tenant(request), period, eval_type, by, top, start=start, end=end,
+        ))
@@ -1,5 +1,7 @@
 from rest_framework_simplejwt.views import TokenObtainPairView
 from evaluation_app.serializers.serializers import EmailLoginSerializer
+from evaluation_app.throttling import LoginRateThrottle
 
 class EmailLoginView(TokenObtainPairView):
-    serializer_class = EmailLoginSerializer
\ No newline at end of file
+    serializer_class = EmailLoginSerializer
+    throttle_classes = [LoginRateThrottle]  # per account + per IP
\ No newline at end of file
@@ -0,0 +1,80 @@
+# evaluation_app/views/changes.py
+import base64
+import binascii
+import uuid
+
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.services import changes
+from evaluation_app.views.mixins import resolve_tenant
+
+
+def _limit(params):
+    try:
+        return min(max(int(params.get("limit", 500)), 1), changes.MAX_PAGE)
+    except ValueError:
+        raise ValidationError({"limit": "Must be an integer."})
+
+
+def _encode_cursor(updated_at, pk):
+    """Opaque, URL-safe resync cursor."""
+    return base64.urlsafe_b64encode(f"{updated_at.isoformat()}|{pk}".encode()).decode()
+
+
+def _cursor(text):
+    """Cursor from `_encode_cursor` → (datetime, UUID)."""
+    try:
+        updated_at, _, pk = base64.urlsafe_b64decode(text.encode()).decode().rpartition("|")
+        parsed = parse_datetime(updated_at), uuid.UUID(pk)
+    except (ValueError, binascii.Error):
+        parsed = None, None
+    if parsed[0] is None:
+        raise ValidationError({"after": "Use the `next` value of the previous page."})
+    return parsed
+
+
+class ChangeFeedView(APIView):
+    """
+    GET /api/changes/?since=<seq>[&limit=500]
+        Changes to companies, departments, employees, evaluations, objectives
+        and competencies after `since`, one per object: {seq, model, id,
+        deleted, data}.  Store `next` and pass it as `since`; `has_more`
+        means ask again right away.  410 → the log was pruned past `since`:
+        resync.
+    GET /api/changes/?model=employee[&after=<next>][&limit=500]
+        Full resync of one model, keyset-paged on updated_at.  Afterwards
+        follow the feed from the `seq` returned by its first page.
+    Scoped to the caller's company.  ADMIN / HR only.
+    """
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    required_capabilities = {"*": (Cap.CHANGES_READ,)}
+
+    def get(self, request):
+        params, tenant, limit = request.query_params, resolve_tenant(request), _limit(request.query_params)
+
+        if params.get("model"):
+            model = params["model"]
+            if model not in changes.MODELS:
+                raise ValidationError({"model": f"One of {', '.join(changes.MODELS)}."})
+            after = _cursor(params["after"]) if params.get("after") else None
+            result = changes.resync(tenant, model, after, limit)
+            if result["next"] is not None:
+                result["next"] = _encode_cursor(*result["next"])
+            return Response(result)
+
+        since = params.get("since", "0")
+        if not since.isdigit():
+            raise ValidationError({"since": "A `next` value from a previous response (or 0)."})
+        since = int(since)
+        oldest = changes.oldest_seq()
+        if since and oldest is not None and since < oldest - 1:
+            return Response({"detail": "Changes after `since` were pruned; resync with ?model=."},
+                            status=status.HTTP_410_GONE)
+        return Response(changes.page(tenant, since, limit))
@@ -1,77 +1,153 @@
-from rest_framework import viewsets, filters
-from rest_framework.permissions import IsAuthenticated
-from evaluation_app.models import Employee
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Exists, OuterRef, Prefetch, Q
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
+from rest_framework.response import Response
+from evaluation_app.filters import FullTextSearchFilter
+from evaluation_app.models import (
+    Employee, EmployeeDepartment, Evaluation, ReportingLineClosure, SearchKind,
+)
 from evaluation_app.serializers.employee_serilized import EmployeeSerializer
-from evaluation_app.permissions import IsHR, IsAdmin, IsHOD, IsLineManager, IsSelfOrAdminHR
+from evaluation_app.serializers.evaluation_serilizer import TeamMemberSerializer
+from evaluation_app import capabilities
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.services import hierarchy, templates
+from evaluation_app.services.periods import period_fields
+from evaluation_app.views.mixins import TenantScopedMixin, resolve_tenant, tenant_company_id, uuid_param
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(TenantScopedMixin, viewsets.ModelViewSet):
 
     """
     * HR/Admin: list every employee.
-    * Line-Manager: only employees in departments they manage.
+    * Line-Manager: only employees in departments they manage or who
+      report to them (transitively, via the reporting-line closure).
     * Employee: only ‘me’.
+    Access comes from the user's cached capability set (capabilities.py).
     """
 
    # queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
-    permission_classes = [IsAuthenticated]  # default fallback
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['user__name', 'user__email']
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    filter_backends = [FullTextSearchFilter]
+    search_kind = SearchKind.EMPLOYEE  # name, email, title, department, company
      
-    def get_permissions(self):
-        role = self.request.user.role
+    required_capabilities = {
+        "list":           (Cap.EMPLOYEE_READ_ALL, Cap.EMPLOYEE_READ_MANAGED),
+        "retrieve":       (Cap.EMPLOYEE_READ_ALL, Cap.EMPLOYEE_READ_MANAGED, Cap.EMPLOYEE_READ_SELF),
+        "reports":        (Cap.EMPLOYEE_READ_ALL, Cap.EMPLOYEE_READ_MANAGED, Cap.EMPLOYEE_READ_SELF),
+        "update":         (Cap.EMPLOYEE_UPDATE_ALL, Cap.EMPLOYEE_UPDATE_MANAGED),
+        "partial_update": (Cap.EMPLOYEE_UPDATE_ALL, Cap.EMPLOYEE_UPDATE_MANAGED),
+        "destroy":        (Cap.EMPLOYEE_DELETE,),
+        "create":         (Cap.EMPLOYEE_CREATE,),
+        "set_manager":    (Cap.REPORTING_LINE_MANAGE,),
+        "team":           (Cap.EMPLOYEE_READ_ALL, Cap.EMPLOYEE_READ_MANAGED),
+    }
 
-        # ─── LIST ───────────────────────────────────────
-        if self.action == 'list':
-            if role in ('ADMIN','HR'):
-                return [(IsAdmin|IsHR)()]
-            if role in ('HOD','LM'):
-                return [(IsHOD|IsLineManager)()]
-            self.permission_denied(self.request, message="Cannot list all employees.")
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return Employee.objects.none()
+        qs   = Employee.objects.select_related('user','company').prefetch_related('departments')
+        # all / managed (departments + reporting subtree) / self, in one WHERE
+        verb = "read" if self.request.method in SAFE_METHODS else "update"
+        return capabilities.scope(self.request.user, qs, "employee", verb)
 
-        # ─── RETRIEVE ───────────────────────────────────
-        if self.action == 'retrieve':
-            # allow employee to see their own, and Admin/HR see anyone
-            return [IsSelfOrAdminHR()]
+    def perform_create(self, serializer):
+        company_id = tenant_company_id(self.request, serializer.validated_data.pop("company", None))
+        serializer.save(company_id=company_id)
 
-        # ─── UPDATE / PARTIAL_UPDATE ────────────────────
-        if self.action in ('update','partial_update'):
-            # Admin & HR get free reign ...
-            if role in ('ADMIN','HR'):
-                return [(IsAdmin|IsHR)()]
-            # … HOD & LM only on people they manage
-            if role in ('HOD','LM'):
-                return [(IsHOD|IsLineManager)()]
-            # everyone else forbidden
-            self.permission_denied(self.request, message="You cannot update this employee.")
+    def perform_update(self, serializer):
+        if self.request.user.role != "ADMIN":
+            serializer.validated_data.pop("company", None)  # only ADMIN moves employees between companies
+        serializer.save()
 
-        # ─── DELETE ─────────────────────────────────────
-        if self.action == 'destroy':
-            if role in ('ADMIN','HR'):
-                return [(IsAdmin|IsHR)()]
-            self.permission_denied(self.request, message="You cannot delete employees.")
+    @action(detail=True, methods=["get"])
+    def reports(self, request, pk=None):
+        """Direct reports; `?transitive=true` → everyone under this employee."""
+        employee = self.get_object()
+        depth = None if request.query_params.get("transitive") == "true" else 1
+        qs = (Employee.objects.select_related('user','company').prefetch_related('departments')
+              .filter(pk__in=hierarchy.subtree(employee.pk, max_depth=depth)))
+        return Response(self.get_serializer(qs, many=True).data)
 
-        # ─── CREATE ─────────────────────────────────────
-        if self.action == 'create':
-            if role in ('ADMIN','HR'):
-                return [(IsAdmin|IsHR)()]
-            self.permission_denied(self.request, message="You cannot create employees.")
+    @action(detail=False, methods=["get"])
+    def team(self, request):
+        """
+        GET /api/employees/team/[?period=2026-Q4][&type=QUARTERLY][&manager_id=<employee>]
+        The caller's direct reports plus the members of departments they
+        manage, each with their evaluation for `period` (default: the
+        current quarter) including objectives and competencies, and their
+        precomputed history.  HR / ADMIN may pass `manager_id` to see
+        someone else's team.
+        Five queries whatever the team size: employees (+ user, company,
+        history joined), departments, evaluations, objectives, competencies.
+        """
+        params, caps = request.query_params, capabilities.resolve(request.user)
+        manager_id = params.get("manager_id")
+        manager_id = uuid_param(manager_id, "manager_id") if manager_id else caps.employee_id
+        if manager_id is None:
+            raise ValidationError({"manager_id": "You have no employee profile; pass manager_id."})
+        if str(manager_id) != str(caps.employee_id) and Cap.EMPLOYEE_READ_ALL not in caps:
+            raise PermissionDenied("You can only view your own team.")
+        if params.get("manager_id"):
+            manager = get_object_or_404(Employee.objects.for_tenant(resolve_tenant(request)), pk=manager_id)
+            manager_id, manager_user_id = manager.pk, manager.user_id
+        else:
+            manager_user_id = request.user.pk
 
-        # fallback
-        return super().get_permissions()
+        today = timezone.localdate()
+        period = params.get("period") or f"{today.year}-Q{(today.month - 1) // 3 + 1}"
+        fields = period_fields(period)
+        if fields["period_start"] is not None:  # '2026-Q4' and 'Q4 2026' alike, on the indexed columns
+            current = Evaluation.objects.filter(period_start=fields["period_start"], period_end=fields["period_end"])
+        else:
+            current = Evaluation.objects.filter(period=period)
+        if params.get("type"):
+            current = current.filter(type=params["type"])
 
-    def get_queryset(self):
-        user = self.request.user
-        qs   = Employee.objects.select_related('user','company').prefetch_related('departments')
+        direct = ReportingLineClosure.objects.filter(ancestor_id=manager_id, descendant_id=OuterRef("pk"), depth=1)
+        in_departments = EmployeeDepartment.objects.filter(department__manager_id=manager_user_id).values("employee_id")
+        members = (
+            capabilities.scope(request.user, Employee.objects.for_tenant(resolve_tenant(request)), "employee")
+            .filter(Q(pk__in=hierarchy.subtree(manager_id, max_depth=1)) | Q(pk__in=in_departments))
+            .exclude(pk=manager_id)
+            .annotate(is_direct_report=Exists(direct))
+            .select_related("user", "evaluation_history")
+            .prefetch_related(
+                "departments",
+                Prefetch(
+                    "evaluations",
+                    queryset=current.order_by("-updated_at").prefetch_related(*templates.item_prefetches()),
+                    to_attr="current_evaluations",
+                ),
+            )
+            .order_by("user__name", "pk")
+        )
+        return Response({
+            "manager_id": manager_id,
+            "period": period,
+            "members": TeamMemberSerializer(members, many=True).data,
+        })
 
-        if user.role in ('ADMIN','HR'):
-            return qs
-        if user.role in ('HOD','LM'):
-            # only those in departments they manage
-            return qs.filter(departments__manager=user).distinct()
-        # regular employee only sees self
-        return qs.filter(user=user)
+    @action(detail=True, methods=["put"], url_path="manager")
+    def set_manager(self, request, pk=None):
+        """Body: {"manager_id": <employee uuid> | null}."""
+        employee = self.get_object()
+        manager_id = request.data.get("manager_id")
+        manager = None
+        if manager_id:
+            manager = get_object_or_404(Employee.objects.for_tenant(resolve_tenant(request)),
+                                        pk=uuid_param(manager_id, "manager_id"))
+        try:
+            hierarchy.set_manager(employee, manager)
+        except DjangoValidationError as exc:
+            raise ValidationError({"manager_id": exc.messages})
+        return Response({"employee_id": employee.pk, "manager_id": manager and manager.pk})
 
 
         
\ No newline at end of file
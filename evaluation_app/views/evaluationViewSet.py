@@ -1,79 +1,179 @@
+import logging
+import uuid
+
+from django.conf import settings
 from rest_framework import viewsets, status,mixins
-from django.db.models import Prefetch
+from django.http import Http404, StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 from evaluation_app.serializers.evaluation_serilizer import (
-    EvaluationSerializer, ObjectiveSerializer
+    ArchivedEvaluationSerializer, EvaluationSerializer
 )
-from rest_framework.permissions import IsAuthenticated
+from evaluation_app.serializers.job_serializers import CycleLaunchSerializer
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 
+from evaluation_app.filters import FullTextSearchFilter, PeriodRangeFilter
 from evaluation_app.models import (
-    Evaluation, Employee, Objective, EvalStatus, EvalType
-)
-from evaluation_app.permissions import(
-    IsAdmin, IsHR, IsHOD, IsLineManager, IsSelfOrAdminHR
+    ArchivedEvaluation, Company, Evaluation, Employee, SearchKind
 )
+from evaluation_app import capabilities
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.services import archive, reports, templates
+from evaluation_app.views.jobs import accepted
+from evaluation_app.views.mixins import TenantScopedMixin, resolve_tenant
+
+logger = logging.getLogger(__name__)
+
 
-class EvaluationViewSet(viewsets.ModelViewSet):
+class EvaluationViewSet(TenantScopedMixin, viewsets.ModelViewSet):
     """
     Permissions
     -----------
     • ADMIN / HR      → full CRUD.  
     • HOD / LM        → may create evaluations **only** for employees
-                        they manage; may update those evaluations.  
+                        they manage (department or reporting line);
+                        may update those evaluations.  
     • Employee        → read-only access to own evaluations.  
+    • launch-cycle    → ADMIN / HR; runs as a background job (202).
+    • reports         → zip of per-employee reports for the visible evaluations.
+    • Archived ids    → retrieve falls back to the archive snapshot.
     """
-    permission_classes = [IsAuthenticated]  #default fallback
+    permission_classes = [IsAuthenticated, CapabilityPermission]  # see required_capabilities
     serializer_class = EvaluationSerializer
+    filter_backends = [FullTextSearchFilter, PeriodRangeFilter]
+    search_kind = SearchKind.EVALUATION  # employee fields, period, objective titles
+    throttle_scope = "evaluations"       # settings.THROTTLE_RATES
     
-    #----dynamic permissions----
-    def get_permissions(self):
-        
-        if self.action in ("list", "retrieve"):
-            #reading
-            if self.request.user.role in ("ADMIN", "HR"):
-                return [(IsAdmin | IsHR)()]  
-            if self.request.user.role in ("HOD", "LM"):
-                return [(IsHOD | IsLineManager)()]
-            return [IsSelfOrAdminHR()]
-        #creating, updating, deleting
-        if self.request.user.role in ("ADMIN", "HR"):
-            return [(IsAdmin | IsHR)()]
-        
-        return [(IsHOD | IsLineManager)()] # LM & HOD restricted further in perform_create
-    # ----------------------------------------------------------
-    # ---- queryset filtered by role ---------------------------
-    
+    _UPDATE = (Cap.EVALUATION_UPDATE_ALL, Cap.EVALUATION_UPDATE_MANAGED)
+    required_capabilities = {
+        "list":           (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_READ_SELF),
+        "retrieve":       (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_READ_SELF),
+        "create":         (Cap.EVALUATION_CREATE_ALL, Cap.EVALUATION_CREATE_MANAGED),  # narrowed in perform_create
+        "update":         _UPDATE,
+        "partial_update": _UPDATE,
+        "destroy":        _UPDATE,
+        "launch_cycle":   (Cap.EVALUATION_LAUNCH_CYCLE,),
+        "reports":        (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED),
+    }
+
+    # ---- queryset filtered by capability ---------------------
     def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return Evaluation.objects.none()
         qs = (Evaluation.objects.select_related("employee__user","reviewer")
-              .prefetch_related("objective_set", "competency_set")
+              .prefetch_related(*templates.item_prefetches())
               ) 
-        user = self.request.user
-        if user.role in ("ADMIN", "HR"):
-            return qs
-        if user.role in ("HOD", "LM"):
-            return qs.filter(employee__departments__manager=user).distinct()
-        return qs.filter(employee__user=user)
+        verb = "read" if self.request.method in SAFE_METHODS else "update"
+        return capabilities.scope(self.request.user, qs, "evaluation", verb)
     # ----------------------------------------------------------
 
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            stub = archived_stub(request, self.kwargs["pk"])
+            if stub is None:
+                raise
+            return Response(archived_detail(stub))
+
     # ---- extra validation for LM / HOD -----------------------
     def perform_create(self, serializer):
-        print(">> perform_create by", self.request.user, self.request.user.role)
-        print(">> incoming validated data:", serializer.validated_data)
         user = self.request.user
-        employee_id = self.request.data.get("employee_id")
-
-
-        if user.role in ("HOD", "LM"):
-           managed = Employee.objects.filter(
-               departments__manager=user,employee_id=employee_id
-           ).exists()
-           if not managed:
-               return Response(
-                   {"detail": "You can only create evaluations for employees you manage."},
-                   status=status.HTTP_403_FORBIDDEN
-               )
-    
-           serializer.save()
+        employee_id = serializer.validated_data["employee_id"]
+        logger.debug("evaluation create requested", extra={
+            "user_id": str(user.pk), "role": user.role, "employee_id": str(employee_id),
+        })
+
+        tenant = resolve_tenant(self.request)
+        if not Employee.objects.for_tenant(tenant).filter(pk=employee_id).exists():
+            raise ValidationError({"employee_id": "Unknown employee."})
+        if Cap.EVALUATION_CREATE_ALL not in capabilities.resolve(user):
+            if not capabilities.manages(user, employee_id):
+                raise PermissionDenied("You can only create evaluations for employees you manage.")
+        serializer.save()
+    # ----------------------------------------------------------
+
+    # ---- cycle launch (background job) -----------------------
+    @action(detail=False, methods=["post"], url_path="launch-cycle")
+    def launch_cycle(self, request):
+        """DRAFT evaluations for every active employee → 202 + job id."""
+        params = CycleLaunchSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        company_id = resolve_tenant(request) or params.validated_data.get("company_id")
+        if company_id is None:
+            raise ValidationError({"company_id": "Required (or send X-Company-ID)."})
+        if not Company.objects.filter(pk=company_id).exists():
+            raise ValidationError({"company_id": "Unknown company."})
+        payload = {"period": params.validated_data["period"], "type": params.validated_data["type"]}
+        return accepted(request, "evaluations.launch_cycle", payload, company_id)
+
+    # ---- report export (streamed zip) ------------------------
+    @action(detail=False, methods=["get"], throttle_scope="reports")
+    def reports(self, request):
+        """
+        One report per evaluation in the (filtered) list, streamed as a zip.
+        `?period=` / `?type=` narrow it; `?output=pdf` when WeasyPrint is installed.
+        Rendered inside the request, so at most REPORT_SYNC_MAX reports;
+        larger exports are refused (400) rather than tying up the worker.
+        """
+        output = request.query_params.get("output", "html")
+        if output not in reports.FORMATS:
+            raise ValidationError({"output": f"One of: {', '.join(reports.FORMATS)}."})
+        qs = self.filter_queryset(self.get_queryset())
+        for field in ("period", "type"):
+            if request.query_params.get(field):
+                qs = qs.filter(**{field: request.query_params[field]})
+        limit = settings.REPORT_SYNC_MAX
+        ids = list(qs.order_by("period", "employee__user__name", "pk").values_list("pk", flat=True)[:limit + 1])
+        if len(ids) > limit:
+            raise ValidationError({"detail": f"More than {limit} evaluations match; narrow the export "
+                                             "(?period=, ?type=, ?search=) or ask an administrator to run "
+                                             "generate_reports."})
+
+        # rendered in this process: web workers don't start report pools
+        response = StreamingHttpResponse(reports.zip_stream(ids, output, parallel=False),
+                                         content_type="application/zip")
+        response["Content-Disposition"] = 'attachment; filename="evaluation-reports.zip"'
+        return response
+
+
+
+# ── archived evaluations ───────────────────────────────────────────────
+def archived_stub(request, pk):
+    """The caller's visible ArchivedEvaluation for `pk`, or None."""
+    try:
+        pk = uuid.UUID(str(pk))
+    except ValueError:
+        return None
+    qs = ArchivedEvaluation.objects.for_tenant(resolve_tenant(request))
+    return capabilities.scope(request.user, qs, "evaluation").filter(pk=pk).first()
+
+
+def archived_detail(stub):
+    return {**archive.read_snapshot(stub), "archived": True}
+
+
+class ArchivedEvaluationViewSet(TenantScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Evaluations moved to the archive (services/archive.py).
+    • list      → the stubs, filterable by period range.
+    • retrieve  → the full snapshot, read from its archive segment.
+    Same visibility as evaluations (all / managed / self).
+    """
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    serializer_class = ArchivedEvaluationSerializer
+    filter_backends = [PeriodRangeFilter]
+    required_capabilities = {
+        "*": (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_READ_SELF),
+    }
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return ArchivedEvaluation.objects.none()
+        qs = ArchivedEvaluation.objects.order_by("-period_start", "employee_id")
+        return capabilities.scope(self.request.user, qs, "evaluation")
 
-   
-    # ----------------------------------------------------------       
\ No newline at end of file
+    def retrieve(self, request, *args, **kwargs):
+        return Response(archived_detail(self.get_object()))
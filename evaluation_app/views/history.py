@@ -0,0 +1,50 @@
+# evaluation_app/views/history.py
+import uuid
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from evaluation_app import capabilities
+from evaluation_app.models import EmployeeEvaluationHistory
+from evaluation_app.serializers.evaluation_serilizer import EmployeeEvaluationHistorySerializer
+from evaluation_app.views.mixins import resolve_tenant
+
+MAX_EMPLOYEES = 500
+
+
+def _employee_ids(raw):
+    if isinstance(raw, str):
+        raw = [part for part in raw.split(",") if part.strip()]
+    if not isinstance(raw, list) or not raw:
+        raise ValidationError({"employee_ids": "A list (or comma-separated string) of employee ids."})
+    if len(raw) > MAX_EMPLOYEES:
+        raise ValidationError({"employee_ids": f"At most {MAX_EMPLOYEES} per call."})
+    try:
+        return {uuid.UUID(str(value).strip()) for value in raw}
+    except ValueError:
+        raise ValidationError({"employee_ids": "Must be UUIDs."})
+
+
+class EvaluationHistoryView(APIView):
+    """
+    GET  /api/evaluation-history/?employee_ids=<id>,<id>,…
+    POST /api/evaluation-history/  {"employee_ids": [...]}   (long lists)
+        Precomputed history of up to 500 employees in one read: latest
+        score, trend vs the previous score, total count and the newest
+        evaluations (type / period / status / score).  Employees the
+        caller may not see, or without evaluations, are left out.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return self._histories(request, request.query_params.get("employee_ids", ""))
+
+    def post(self, request):
+        return self._histories(request, request.data.get("employee_ids"))
+
+    def _histories(self, request, raw):
+        qs = EmployeeEvaluationHistory.objects.for_tenant(resolve_tenant(request))
+        qs = capabilities.scope(request.user, qs, "evaluation").filter(pk__in=_employee_ids(raw))
+        return Response({"results": EmployeeEvaluationHistorySerializer(qs, many=True).data})
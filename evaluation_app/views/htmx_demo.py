@@ -1,16 +1,138 @@
-from django.shortcuts import render, redirect
-from django.views.decorators.http import require_http_methods
-from evaluation_app.models import Employee
+"""
+HTMX employee table (demo; mount with include("evaluation_app.urls.demo")).
 
+• GET employees/ renders the page.  HTMX requests (search box, pager) get
+  just the table partial back; a history restore (HX-History-Restore-Request,
+  back button after a cache miss) gets the full page.  Vary: HX-Request
+  keeps browsers and proxies from serving one in place of the other.
+  One paginated query, with user/company joined in (select_related),
+  tenant-scoped like the API.
+• POST employees/create/ creates the User + Employee and returns only the
+  new <tr>, which HTMX prepends to the table body.  Validation errors
+  re-render just the form.
+• POST employees/<id>/status/ returns only the changed row.
+"""
+from functools import wraps
+
+from django import forms
+from django.contrib.auth import get_user_model
+from django.contrib.auth.views import redirect_to_login
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseForbidden
+from django.shortcuts import get_object_or_404
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_GET, require_POST
+
+from evaluation_app import capabilities
+from evaluation_app.capabilities import Cap
+from evaluation_app.models import Company, EmpStatus, Employee, ManagerialLevel, SearchKind
+from evaluation_app.services import search
+from evaluation_app.views.mixins import resolve_tenant
+
+PAGE_SIZE = 25
+
+
+def _render(request, name, context, **headers):
+    response = HttpResponse(get_template(name).render(context, request))
+    for header, value in headers.items():
+        response[header.replace("_", "-")] = value
+    return response
+
+
+def _requires(cap=None):
+    """Session login (+ capability, like the API's CapabilityPermission)."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not request.user.is_authenticated:
+                return redirect_to_login(request.get_full_path())
+            if cap is not None and cap not in capabilities.resolve(request.user):
+                return HttpResponseForbidden("Your role does not allow this action.")
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _employees(request, verb="read"):
+    """Tenant + row scoped, like EmployeeViewSet; user/company in the same query."""
+    qs = Employee.objects.for_tenant(resolve_tenant(request)).select_related("user", "company")
+    return capabilities.scope(request.user, qs, "employee", verb)
+
+
+class EmployeeCreateForm(forms.Form):
+    name             = forms.CharField(max_length=120)
+    email            = forms.EmailField()
+    managerial_level = forms.ChoiceField(choices=ManagerialLevel.choices)
+    status           = forms.ChoiceField(choices=EmpStatus.choices, initial=EmpStatus.ACTIVE)
+    join_date        = forms.DateField(initial=timezone.localdate)
+    company          = forms.ModelChoiceField(queryset=Company.objects.order_by("name"), required=False)
+
+    def __init__(self, *args, tenant=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tenant = tenant
+        if tenant is not None:
+            del self.fields["company"]  # always the caller's company
+
+    def clean_email(self):
+        email = self.cleaned_data["email"].lower()
+        if get_user_model().objects.filter(email__iexact=email).exists():
+            raise forms.ValidationError("A user with this e-mail already exists.")
+        return email
+
+    def save(self):
+        data = self.cleaned_data
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(
+                username=data["email"], email=data["email"], name=data["name"], role="EMP",
+            )  # no usable password until HR sets one
+            employee = Employee.objects.create(
+                user=user, company_id=self.tenant or getattr(data.get("company"), "pk", None),
+                managerial_level=data["managerial_level"], status=data["status"], join_date=data["join_date"],
+            )
+        return employee
+
+
+# ── views ──────────────────────────────────────────────────────────────
+@require_GET
+@_requires()
 def employee_list(request):
-    qs = Employee.objects.all().order_by("id")
-    return render(request, "employee_list.html", {"employees": qs})
+    query = request.GET.get("q", "").strip()
+    qs = _employees(request).order_by("user__name", "pk")
+    if query:
+        qs = qs.filter(pk__in=search.matching(SearchKind.EMPLOYEE, query).values("object_id"))
+    page = Paginator(qs, PAGE_SIZE).get_page(request.GET.get("page"))
+    context = {"page": page, "q": query, "statuses": EmpStatus.choices}
+
+    if request.headers.get("HX-Request") and not request.headers.get("HX-History-Restore-Request"):
+        response = _render(request, "partials/employee_rows.html", context)
+    else:
+        context["form"] = EmployeeCreateForm(tenant=resolve_tenant(request))
+        response = _render(request, "employee_list.html", context)
+    patch_vary_headers(response, ["HX-Request"])
+    return response
+
 
-@require_http_methods(["POST"])
+@require_POST
+@_requires(Cap.EMPLOYEE_CREATE)
 def employee_create(request):
-    name  = request.POST["name"]
-    email = request.POST["email"]
-    Employee.objects.create(name=name, email=email)
-    # Return only the refreshed table HTML (partial) ─ HTMX swaps it in.
-    qs = Employee.objects.all().order_by("id")
-    return render(request, "partials/employee_rows.html", {"employees": qs})
+    form = EmployeeCreateForm(request.POST, tenant=resolve_tenant(request))
+    if not form.is_valid():
+        # swap the form (with errors) instead of touching the table
+        return _render(request, "partials/employee_form.html", {"form": form},
+                       HX_Retarget="#emp-form", HX_Reswap="outerHTML")
+    employee = _employees(request).get(pk=form.save().pk)
+    return _render(request, "partials/employee_row.html",
+                   {"emp": employee, "statuses": EmpStatus.choices, "new": True})
+
+
+@require_POST
+@_requires()
+def employee_status(request, employee_id):
+    employee = get_object_or_404(_employees(request, "update"), pk=employee_id)
+    if request.POST.get("status") in EmpStatus.values:
+        employee.status = request.POST["status"]
+        employee.save(update_fields=["status", "updated_at"])
+    return _render(request, "partials/employee_row.html", {"emp": employee, "statuses": EmpStatus.choices})
@@ -0,0 +1,41 @@
+# evaluation_app/views/jobs.py
+from django.urls import reverse
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from evaluation_app import capabilities
+from evaluation_app.capabilities import Cap
+from evaluation_app.models import Job
+from evaluation_app.serializers.job_serializers import JobSerializer
+from evaluation_app.services import jobs
+from evaluation_app.views.mixins import TenantScopedMixin
+
+
+def accepted(request, kind, payload, company_id):
+    """Enqueue `kind` and answer 202 with the job id + its status URL."""
+    job = jobs.enqueue(kind, payload, user=request.user, company_id=company_id)
+    url = request.build_absolute_uri(reverse("job-detail", args=[job.pk]))
+    return Response(
+        {"job_id": job.pk, "status": job.status, "status_url": url},
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": url},
+    )
+
+
+class JobViewSet(TenantScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Status of background jobs (poll GET /api/jobs/{id}/).
+    • ADMIN / HR: every job of their company.
+    • Others: the jobs they started.
+    """
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return Job.objects.none()
+        qs = Job.objects.order_by("-created_at")
+        if Cap.JOBS_READ_ALL in capabilities.resolve(self.request.user):
+            return qs
+        return qs.filter(created_by=self.request.user)
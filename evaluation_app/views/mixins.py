@@ -0,0 +1,71 @@
+# evaluation_app/views/mixins.py
+import uuid
+
+from django.core.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError
+
+from evaluation_app import capabilities
+from evaluation_app.models import Company
+
+
+def uuid_param(value, field):
+    """`value` (query parameter / body field) as a UUID; 400 naming `field` otherwise."""
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise ValidationError({field: "Must be a UUID."})
+
+
+def resolve_tenant(request):
+    """
+    company_id a request is scoped to, or None for cross-company access.
+    • ADMIN: every company, unless narrowed with an `X-Company-ID` header.
+    • Others: the company of their employee profile.  Without one (or
+      without a login) the request is refused: only ADMIN is ever
+      cross-company.
+    """
+    if hasattr(request, "_tenant"):
+        return request._tenant
+
+    user, tenant = request.user, None
+    if not user.is_authenticated:
+        raise PermissionDenied("Authentication required.")
+    if user.role == "ADMIN":
+        requested = request.headers.get("X-Company-ID")
+        if requested:
+            try:
+                tenant = uuid.UUID(requested)
+            except ValueError:
+                raise ValidationError({"X-Company-ID": "Must be a company UUID."})
+    else:
+        tenant = capabilities.resolve(user).company_id  # cached with the capability set
+        if tenant is None:
+            raise PermissionDenied("Your account is not assigned to a company.")
+
+    request._tenant = tenant
+    return tenant
+
+
+def tenant_company_id(request, company):
+    """
+    company_id a new row is written to: the caller's tenant, whatever the
+    body says.  The client's `company` only counts for ADMIN without
+    `X-Company-ID` (None if they sent none).
+    """
+    tenant = resolve_tenant(request)
+    if tenant is None:
+        return company.pk if company is not None else None
+    if not Company.objects.filter(pk=tenant).exists():  # ADMIN's X-Company-ID
+        raise ValidationError({"company": "Unknown company."})
+    return tenant
+
+
+class TenantScopedMixin:
+    """
+    Narrows every list / retrieve / update / delete to the caller's company
+    through the model's `TenantQuerySet.for_tenant()`.  Lives in
+    `filter_queryset` so it also applies to `get_object()`.
+    """
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return queryset.for_tenant(resolve_tenant(self.request))
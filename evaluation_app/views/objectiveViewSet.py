@@ -1,15 +1,45 @@
 # evaluation_app/views/objective_viewset.py
 from rest_framework import viewsets
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
+
+from evaluation_app import capabilities
+from evaluation_app.capabilities import Cap
 from evaluation_app.serializers.evaluation_serilizer import ObjectiveSerializer
-from evaluation_app.models import Objective
-from evaluation_app.permissions import IsAdmin, IsHR, IsHOD, IsLineManager
+from evaluation_app.models import Evaluation, Objective
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.views.mixins import TenantScopedMixin, resolve_tenant
 
-class ObjectiveViewSet(viewsets.ModelViewSet):
-    queryset = Objective.objects.select_related("evaluation")
+class ObjectiveViewSet(TenantScopedMixin, viewsets.ModelViewSet):
+    """Objectives of the evaluations the caller may read / update."""
+    queryset = Objective.objects.select_related("evaluation", "template")
     serializer_class = ObjectiveSerializer
+    permission_classes = [IsAuthenticated, CapabilityPermission]  # see required_capabilities
+    required_capabilities = {
+        "list":     (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_READ_SELF),
+        "retrieve": (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED, Cap.EVALUATION_READ_SELF),
+        "*":        (Cap.EVALUATION_UPDATE_ALL, Cap.EVALUATION_UPDATE_MANAGED),
+    }
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return Objective.objects.none()
+        verb = "read" if self.request.method in SAFE_METHODS else "update"
+        return capabilities.scope(self.request.user, super().get_queryset(), "evaluation", verb,
+                                  field="evaluation__employee_id")
+
+
+    def _check_evaluation(self, evaluation):
+        evaluations = Evaluation.objects.for_tenant(resolve_tenant(self.request))
+        editable = capabilities.scope(self.request.user, evaluations, "evaluation", "update")
+        if not editable.filter(pk=evaluation.pk).exists():
+            raise PermissionDenied("You can't add objectives to this evaluation.")
+
+    def perform_create(self, serializer):
+        self._check_evaluation(serializer.validated_data["evaluation"])
+        serializer.save()
 
-    def get_permissions(self):
-        if self.action in ("list", "retrieve"):
-            return []  # anyone who can access the evaluation already sees objectives
-        # create/update/delete
-        return [IsAdmin() | IsHR() | IsHOD() | IsLineManager()]
+    def perform_update(self, serializer):
+        if "evaluation" in serializer.validated_data:  # moving it to another evaluation
+            self._check_evaluation(serializer.validated_data["evaluation"])
+        serializer.save()
@@ -1,19 +1,21 @@
 from evaluation_app.serializers.org_serializers import(
     CompanySerializer, DepartmentSerializer
 )
-from evaluation_app.permissions import IsAdmin, IsHR, IsHOD, IsLineManager, IsSelfOrAdminHR, ReadOnlyOrAdminHR,IsAdminOrHR
-from evaluation_app.models import Company, Department
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission, ReadOnlyOrAdminHR, IsAdminOrHR
+from evaluation_app.models import Company, Department, Employee
+from evaluation_app.views.mixins import TenantScopedMixin, tenant_company_id
 from rest_framework import viewsets, filters, permissions, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(TenantScopedMixin, viewsets.ModelViewSet):
     queryset = Company.objects.all().order_by("name")
     serializer_class = CompanySerializer
     permission_classes = [ReadOnlyOrAdminHR] # read-only for authenticated users, full access for Admin/HR
-    print("CompanyViewSet permissions:", permission_classes)
 
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "industry"]
@@ -38,10 +40,15 @@ class CompanyViewSet(viewsets.ModelViewSet):
 
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(TenantScopedMixin, viewsets.ModelViewSet):
     queryset = Department.objects.select_related("company", "manager")
     serializer_class = DepartmentSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [IsAuthenticated, CapabilityPermission]  # see required_capabilities
+    required_capabilities = {
+        "list":     (Cap.DEPARTMENTS_READ,),   # rows narrowed by role in get_queryset
+        "retrieve": (Cap.DEPARTMENTS_READ,),
+        "*":        (Cap.DEPARTMENTS_MANAGE,),  # create / update / destroy / create_department
+    }
 
     filter_backends = [filters.SearchFilter, filters.SearchFilter]
     filterset_fields = ["company"]
@@ -50,8 +57,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     @action(
         detail=False,  # collection-level
         methods=["post"],
-        url_path="create",  # → /departments/create/
-        permission_classes=[permissions.IsAuthenticated, IsAdminOrHR])
+        url_path="create")  # → /departments/create/
     
     def create_department(self, request, *args, **kwargs):
         """
@@ -60,18 +66,33 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        #self.perform_create(serializer)
-        #headers = self.get_success_headers(serializer.data)
-         # this will pass through company & name & employee_count,
-        # and manager=None if not in request.data
-        dept = serializer.save()
+        # company comes from the caller's tenant; manager=None if not in request.data
+        self.perform_create(serializer)
 
         return Response(
-            DepartmentSerializer(dept).data,
+            DepartmentSerializer(serializer.instance).data,
             status=status.HTTP_201_CREATED
         )
- 
+
+    def _check_manager(self, manager, company_id):
+        if manager is not None and not Employee.objects.filter(user=manager, company_id=company_id).exists():
+            raise ValidationError({"manager": "Not an employee of this company."})
+
+    def perform_create(self, serializer):
+        company_id = tenant_company_id(self.request, serializer.validated_data.pop("company", None))
+        if company_id is None:
+            raise ValidationError({"company": "Required (or send X-Company-ID)."})
+        self._check_manager(serializer.validated_data.get("manager"), company_id)
+        serializer.save(company_id=company_id)
+
+    def perform_update(self, serializer):
+        serializer.validated_data.pop("company", None)  # departments don't move between companies
+        self._check_manager(serializer.validated_data.get("manager"), serializer.instance.company_id)
+        serializer.save()
+
     def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return Department.objects.none()
         qs =  super().get_queryset()
         u = self.request.user
         if u.role in ("Admin", "HR", "ADMIN"):
@@ -79,9 +100,4 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         if u.role in ("HOD", "LM"):
             return qs.filter(manager=u)
         return qs.none() # regular employees cannot access departments
-    
-    def get_permissions(self):
-        if self.action in ("list","retrieve"):
-            return [IsAuthenticated()] # read-only for all authenticated users
-        return [(IsAdmin | IsHR)()]  # write permissions for Admin & HR only
     
\ No newline at end of file
@@ -0,0 +1,98 @@
+# evaluation_app/views/profiling.py
+import re
+
+from django.http import HttpResponse
+from rest_framework import serializers, status
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from evaluation_app.capabilities import Cap
+from evaluation_app.permissions import CapabilityPermission
+from hr_evaluation import profiling
+
+
+class ArmSerializer(serializers.Serializer):
+    path        = serializers.CharField(help_text="Regex searched in the request path, e.g. ^/api/evaluations/")
+    method      = serializers.ChoiceField(choices=["GET", "POST", "PUT", "PATCH", "DELETE"], required=False)
+    requests    = serializers.IntegerField(min_value=1, max_value=profiling.MAX_REQUESTS, default=10)
+    interval_ms = serializers.IntegerField(min_value=1, max_value=1000, default=5)
+
+    def validate_path(self, value):
+        try:
+            re.compile(value)
+        except re.error as exc:
+            raise serializers.ValidationError(f"Invalid regex: {exc}")
+        return value
+
+
+def _session():
+    session = profiling.current()
+    if session is None:
+        raise NotFound("Nothing is being profiled; POST /api/profiling/ first.")
+    return session
+
+
+def _summary(slot, result):
+    return {"slot": slot, **{k: v for k, v in result.items() if k not in ("stacks", "queries")}}
+
+
+class _ProfilingAPIView(APIView):
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    required_capabilities = {"*": (Cap.PROFILING,)}
+
+
+class ProfilingView(_ProfilingAPIView):
+    """
+    POST   /api/profiling/   {path, method?, requests=10, interval_ms=5}
+        Profile the next `requests` requests whose path matches `path`.
+    GET    /api/profiling/   the session and a summary of each captured request.
+    DELETE /api/profiling/   stop; results expire an hour after arming.
+    Then: flamegraph/ (collapsed stacks) and requests/<slot>/ (SQL timeline).
+    ADMIN only.
+    """
+
+    def get(self, request):
+        session = _session()
+        results = profiling.captured(session)
+        return Response({
+            "session": session,
+            "requests": [_summary(slot, results[slot]) for slot in sorted(results)],
+        })
+
+    def post(self, request):
+        data = ArmSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        v = data.validated_data
+        session = profiling.arm(v["path"], v["requests"], v.get("method"), v["interval_ms"])
+        return Response({"session": session}, status=status.HTTP_201_CREATED)
+
+    def delete(self, request):
+        profiling.disarm()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ProfilingFlameGraphView(_ProfilingAPIView):
+    """
+    GET /api/profiling/flamegraph/[?slot=<n>]
+        Collapsed stacks of every captured request (or one), as text for
+        flamegraph.pl / speedscope.  Counts are samples of `interval_ms`.
+    """
+
+    def get(self, request):
+        results = profiling.captured(_session())
+        slot = request.query_params.get("slot")
+        if slot is not None:
+            results = {int(slot): results[int(slot)]} if slot.isdigit() and int(slot) in results else {}
+        return HttpResponse(profiling.collapsed(results.values()), content_type="text/plain; charset=utf-8")
+
+
+class ProfiledRequestView(_ProfilingAPIView):
+    """GET /api/profiling/requests/<slot>/ → one request's summary and SQL timeline."""
+
+    def get(self, request, slot):
+        result = profiling.captured(_session()).get(slot)
+        if result is None:
+            raise NotFound("No request captured in this slot (yet).")
+        return Response({**_summary(slot, result), "queries": result["queries"]})
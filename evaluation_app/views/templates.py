@@ -0,0 +1,85 @@
+# evaluation_app/views/templates.py
+from rest_framework import filters, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from evaluation_app.capabilities import Cap
+from evaluation_app.models import Company, CompetencyTemplate, ObjectiveTemplate
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.serializers.evaluation_serilizer import (
+    CompetencyTemplateSerializer, ObjectiveTemplateSerializer,
+)
+from evaluation_app.views.mixins import TenantScopedMixin, resolve_tenant, uuid_param
+
+_READ = (Cap.EVALUATION_READ_ALL, Cap.EVALUATION_READ_MANAGED)
+
+
+class _TemplateViewSet(TenantScopedMixin, viewsets.ModelViewSet):
+    """
+    Objective / competency template library of the caller's company
+    (services/templates.py).
+    • Managers read it; ADMIN / HR maintain it.
+    • `launch-cycle` instantiates the active templates that match each
+      employee's departments and managerial level (empty = all).
+    • Edits show up in every evaluation that inherits the field, without
+      rewriting those rows.  A template that is still referenced can't be
+      deleted: set `is_active` to false to stop using it.
+    • ?department=<id>, ?managerial_level=, ?is_active=true|false
+    """
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    required_capabilities = {
+        "list":     _READ,
+        "retrieve": _READ,
+        "*":        (Cap.TEMPLATES_MANAGE,),
+    }
+    filter_backends = [filters.SearchFilter]
+    model = None
+
+    def get_queryset(self):
+        qs = self.model.objects.order_by("created_at")
+        params = self.request.query_params
+        if params.get("department"):
+            qs = qs.filter(department_id=uuid_param(params["department"], "department"))
+        if "managerial_level" in params:
+            qs = qs.filter(managerial_level=params["managerial_level"])
+        if params.get("is_active") in ("true", "false"):
+            qs = qs.filter(is_active=params["is_active"] == "true")
+        return qs
+
+    def _check_department(self, department, company_id):
+        if department is not None and department.company_id != company_id:
+            raise ValidationError({"department": "Belongs to another company."})
+
+    def perform_create(self, serializer):
+        company_id = resolve_tenant(self.request) or serializer.validated_data.pop("company_id", None)
+        if company_id is None:
+            raise ValidationError({"company_id": "Required (or send X-Company-ID)."})
+        if not Company.objects.filter(pk=company_id).exists():
+            raise ValidationError({"company_id": "Unknown company."})
+        serializer.validated_data.pop("company_id", None)
+        self._check_department(serializer.validated_data.get("department"), company_id)
+        serializer.save(company_id=company_id)
+
+    def perform_update(self, serializer):
+        serializer.validated_data.pop("company_id", None)  # templates don't move between companies
+        department = serializer.validated_data.get("department", serializer.instance.department)
+        self._check_department(department, serializer.instance.company_id)
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        in_use = instance.objectives.count() if self.model is ObjectiveTemplate else instance.competencies.count()
+        if in_use:
+            raise ValidationError({"detail": f"Used by {in_use} rows; set is_active to false instead."})
+        instance.delete()
+
+
+class ObjectiveTemplateViewSet(_TemplateViewSet):
+    model = ObjectiveTemplate
+    serializer_class = ObjectiveTemplateSerializer
+    search_fields = ["title"]
+
+
+class CompetencyTemplateViewSet(_TemplateViewSet):
+    model = CompetencyTemplate
+    serializer_class = CompetencyTemplateSerializer
+    search_fields = ["name"]
@@ -0,0 +1,54 @@
+# evaluation_app/views/webhooks.py
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from evaluation_app.capabilities import Cap
+from evaluation_app.models import Company, WebhookSubscription
+from evaluation_app.permissions import CapabilityPermission
+from evaluation_app.serializers.webhook_serializers import (
+    WebhookDeadLetterSerializer, WebhookSubscriptionSerializer,
+)
+from evaluation_app.services import webhooks
+from evaluation_app.views.mixins import TenantScopedMixin, resolve_tenant
+
+
+class WebhookSubscriptionViewSet(TenantScopedMixin, viewsets.ModelViewSet):
+    """
+    Outbound webhook subscriptions of the caller's company (ADMIN / HR).
+    • dead-letters  → GET  deliveries that ran out of attempts.
+    • requeue       → POST give them a fresh set of attempts.
+    Delivery itself runs in `manage.py run_webhooks`.
+    """
+    permission_classes = [IsAuthenticated, CapabilityPermission]
+    required_capabilities = {"*": (Cap.WEBHOOKS_MANAGE,)}
+    serializer_class = WebhookSubscriptionSerializer
+
+    def get_queryset(self):
+        return WebhookSubscription.objects.order_by("created_at")
+
+    def perform_create(self, serializer):
+        company_id = resolve_tenant(self.request) or serializer.validated_data.pop("company_id", None)
+        if company_id is None:
+            raise ValidationError({"company_id": "Required (or send X-Company-ID)."})
+        if not Company.objects.filter(pk=company_id).exists():
+            raise ValidationError({"company_id": "Unknown company."})
+        serializer.validated_data.pop("company_id", None)
+        serializer.save(company_id=company_id, secret=webhooks.new_secret())
+
+    def perform_update(self, serializer):
+        serializer.validated_data.pop("company_id", None)  # subscriptions don't move between companies
+        serializer.save()
+
+    @action(detail=True, methods=["get"], url_path="dead-letters")
+    def dead_letters(self, request, pk=None):
+        letters = self.get_object().dead_letters.order_by("-failed_at")[:200]
+        return Response(WebhookDeadLetterSerializer(letters, many=True).data)
+
+    @action(detail=True, methods=["post"])
+    def requeue(self, request, pk=None):
+        letters = list(self.get_object().dead_letters.select_related("subscription"))
+        webhooks.requeue(letters)
+        return Response({"requeued": len(letters)})
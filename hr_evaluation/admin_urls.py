@@ -0,0 +1,12 @@
+"""
+Admin URLconf used in lazy-loading mode.
+
+``lazy_include()`` only imports this module once a request path matches
+``admin/``, so the ``admin.py`` modules of every app are discovered on the
+first admin hit rather than during the cold start.
+"""
+from django.contrib import admin
+
+admin.autodiscover()
+
+urlpatterns = admin.site.get_urls()
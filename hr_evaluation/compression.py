@@ -0,0 +1,159 @@
+"""
+Response compression.
+
+• ``CompressionMiddleware`` picks the best encoding the client accepts:
+  zstd (``zstandard`` installed), then br (``brotli`` installed), then
+  gzip.  ``q=0`` in Accept-Encoding opts out of a coding.
+• Only compressible types (JSON, MessagePack, text, XML, CSV, NDJSON) at or
+  above ``COMPRESSION_MIN_SIZE`` bytes.  Small bodies gain nothing and
+  cost CPU.  Already-encoded responses and zips are left alone.
+• HTML is never compressed (BREACH).  Its pages (admin, HTMX views) carry
+  a CSRF token next to reflected request input, and the compressed length
+  would leak the token byte by byte.  API responses need a JWT in the
+  Authorization header, which a cross-site page can't make the browser
+  send, so they can't be probed that way.
+• Streaming responses (exports) are compressed chunk by chunk.  Each chunk
+  is flushed, so the client keeps receiving data as it is produced and
+  the body is never buffered.
+"""
+import gzip
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+COMPRESSIBLE = re.compile(
+    r"^(text/(?!html)|application/(json|.+\+json|x-ndjson|msgpack|x-msgpack|xml|javascript))", re.I,
+)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5   # ~gzip speed, smaller output
+ZSTD_LEVEL = 3
+
+
+# ── codings ────────────────────────────────────────────────────────────
+# compress(data) → bytes; compressor() → (feed(chunk) → bytes, finish() → bytes),
+# where every feed() output is flushed so it can be sent right away.
+class Gzip:
+    name = "gzip"
+
+    def compress(self, data):
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+    def compressor(self):
+        c = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return (lambda chunk: c.compress(chunk) + c.flush(zlib.Z_SYNC_FLUSH)), c.flush
+
+
+class Brotli:
+    name = "br"
+
+    def compress(self, data):
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+
+    def compressor(self):
+        c = brotli.Compressor(quality=BROTLI_QUALITY)
+        return (lambda chunk: c.process(chunk) + c.flush()), c.finish
+
+
+class Zstd:
+    name = "zstd"
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    def compressor(self):
+        c = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        return (lambda chunk: c.compress(chunk) + c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)), c.flush
+
+
+CODINGS = [coding() for coding, available in ((Zstd, zstandard), (Brotli, brotli), (Gzip, True)) if available]
+
+
+def accepted_codings(header):
+    """{coding: q} from an Accept-Encoding header."""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        match = re.search(r"q\s*=\s*([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match[1])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    return accepted
+
+
+def choose(header):
+    """Best available coding for an Accept-Encoding header, or None."""
+    accepted = accepted_codings(header)
+    best = None
+    for coding in CODINGS:  # in server preference order
+        q = accepted.get(coding.name, accepted.get("*", 0.0))
+        if q > 0 and (best is None or q > best[0]):
+            best = (q, coding)
+    return best[1] if best else None
+
+
+# ── middleware ─────────────────────────────────────────────────────────
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (response.has_header("Content-Encoding")
+                or not COMPRESSIBLE.match(response.get("Content-Type", ""))
+                or (not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE)):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = choose(request.headers.get("Accept-Encoding", ""))
+        if coding is None:
+            return response
+
+        if response.streaming:
+            stream = _astream if response.is_async else _stream
+            response.streaming_content = stream(coding, response.streaming_content)
+            del response["Content-Length"]
+        else:
+            compressed = coding.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # the representation changed: a strong ETag no longer matches its bytes
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = coding.name
+        return response
+
+
+def _stream(coding, chunks):
+    feed, finish = coding.compressor()
+    for chunk in chunks:
+        if chunk:
+            yield feed(chunk)
+    yield finish()
+
+
+async def _astream(coding, chunks):
+    feed, finish = coding.compressor()
+    async for chunk in chunks:
+        if chunk:
+            yield feed(chunk)
+    yield finish()
@@ -0,0 +1,125 @@
+"""
+Read-replica routing.
+
+Enabled when ``DATABASE_REPLICA_URL`` is set (see settings):
+
+• ``ReplicaRoutingMiddleware`` marks safe-method requests under
+  ``REPLICA_READ_PATHS`` (the API viewsets) as replica-eligible.
+• ``ReplicaRouter`` sends their reads to ``REPLICA_DB_ALIAS``; every write,
+  reads inside a transaction and all other traffic stay on ``default``.
+• Read-your-writes: a request that wrote pins its user to the primary for
+  ``REPLICA_STICKY_SECONDS``.  The pin lives in the shared cache
+  (``CACHE_URL``; settings refuse a per-process one with a replica).  A
+  DatabaseCache always reads the primary, or a lagging replica would hide
+  fresh pins.  Its writes (pins, throttle buckets, cached reports) are not
+  the request's data, so they don't pin.
+• ``read_from_replica()`` opts code outside a request (exports, analytics,
+  management commands) into replica reads explicitly.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import SimpleLazyObject
+
+REPLICA_DB_ALIAS = "replica"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class _RoutingState:
+    __slots__ = ("use_replica", "request", "wrote", "pinned")
+
+    def __init__(self, use_replica, request=None):
+        self.use_replica = use_replica
+        self.request = request
+        self.wrote = False       # a write happened in this request/block
+        self.pinned = None       # cached sticky-to-primary lookup
+
+
+_state = contextvars.ContextVar("db_routing", default=None)
+
+
+def _pin_key(user_pk):
+    return f"db-pin:{user_pk}"
+
+
+def pin_to_primary(user):
+    """Route this user's reads to the primary for the sticky window."""
+    cache.set(_pin_key(user.pk), time.time(), timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def _is_pinned(state):
+    if state.pinned is not None:
+        return state.pinned
+    user = getattr(state.request, "user", None)
+    # AuthenticationMiddleware's lazy user would hit the session table (and
+    # this router) to resolve; DRF swaps in the real user once authenticated.
+    if user is None or isinstance(user, SimpleLazyObject) or not user.is_authenticated:
+        return False
+    state.pinned = cache.get(_pin_key(user.pk)) is not None
+    return state.pinned
+
+
+@contextmanager
+def read_from_replica():
+    """Send reads in this block to the replica (no-op when none is configured)."""
+    token = _state.set(_RoutingState(use_replica=True))
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == "django_cache":  # DatabaseCache, which holds the pins
+            return DEFAULT_DB_ALIAS
+        state = _state.get()
+        if (
+            state is None
+            or not state.use_replica
+            or state.wrote
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+            or _is_pinned(state)
+        ):
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # explicit alias: Django would otherwise reuse the instance's source db
+        if model._meta.app_label == "django_cache":
+            return DEFAULT_DB_ALIAS
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # same data on both aliases
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return False if db == REPLICA_DB_ALIAS else None
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.paths = tuple(settings.REPLICA_READ_PATHS)
+
+    def __call__(self, request):
+        use_replica = request.method in SAFE_METHODS and request.path.startswith(self.paths)
+        state = _RoutingState(use_replica, request)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+
+        if state.wrote and response.status_code < 400:
+            user = getattr(request, "user", None)  # DRF has set the real user by now
+            if user is not None and user.is_authenticated:
+                pin_to_primary(user)
+        return response
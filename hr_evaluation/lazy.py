@@ -0,0 +1,42 @@
+"""
+Helpers for the serverless lazy-loading mode (``LAZY_IMPORTS=true``).
+
+Heavy, rarely-hit views (OpenAPI schema, swagger) are referenced by dotted
+path and only imported on their first request, so a cold start that serves
+``/api/...`` never pays for them.
+"""
+from django.urls.resolvers import RoutePattern, URLResolver
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    Return a view function that imports ``dotted_path`` and calls
+    ``.as_view(**initkwargs)`` on first use; later calls reuse that view.
+    """
+    view = None
+
+    @csrf_exempt
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    wrapper.__name__ = dotted_path.rsplit(".", 1)[-1]
+    return wrapper
+
+
+def lazy_include(route, urlconf_name, namespace=None):
+    """
+    Like ``path(route, include(urlconf_name))`` but without importing the
+    URLconf up front: ``URLResolver`` only imports a string ``urlconf_name``
+    when a request path (or a ``reverse()``) first needs its patterns.
+    """
+    return URLResolver(
+        RoutePattern(route),
+        urlconf_name,
+        app_name=namespace,
+        namespace=namespace,
+    )
@@ -0,0 +1,158 @@
+"""
+Structured logging (wired up by ``LOGGING`` in settings).
+
+• ``QueueHandler`` is the only handler on the request path.  It puts the
+  record on an in-memory queue and returns.  A ``QueueListener`` thread
+  formats the records and writes them to stderr.  If the queue is full
+  (the sink is stuck), records are dropped and counted rather than
+  blocking the request.
+• ``JsonFormatter`` writes one JSON object per line.  It holds the standard
+  fields, the ``request_id`` and any ``extra={...}`` the caller passed:
+  ``logger.info("token issued", extra={"user_id": ...})``.
+• ``RequestIdMiddleware`` gives every request a correlation id.  It reuses
+  a well-formed incoming ``X-Request-ID`` and echoes the id back in the
+  response header.  ``RequestIdFilter`` stamps the id on every record
+  logged while the request runs.
+• ``SamplingFilter`` keeps a ``rate`` fraction of DEBUG records, decided
+  per request so a sampled request keeps all of its debug lines.  Records
+  at INFO and above always pass.
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+_INCOMING_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+# attributes every LogRecord has; anything else came in through `extra`
+_STANDARD = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+
+def request_id():
+    return _request_id.get()
+
+
+# ── filters ────────────────────────────────────────────────────────────
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        rid = _request_id.get()
+        if rid is None:  # django.request logs the response after the middleware returned
+            rid = getattr(getattr(record, "request", None), "request_id", None)
+        record.request_id = rid
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = float(rate)
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        rid = _request_id.get()
+        if rid is None:
+            return random.random() < self.rate
+        return zlib.crc32(rid.encode()) % 10_000 < self.rate * 10_000
+
+
+# ── formatting ─────────────────────────────────────────────────────────
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _STANDARD and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+# ── non-blocking handler ───────────────────────────────────────────────
+class QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue only; a listener thread does the formatting and the I/O.  The
+    formatter set on this handler (LOGGING "formatter") is used by that
+    thread.  The listener is (re)started lazily in each process, so forked
+    workers get their own.
+    """
+
+    def __init__(self, maxsize=10_000, stream=None):
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self.listener = None
+        self.pid = None
+        self.dropped = 0
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # resolve the message now (args may change later), keep exc_info for the formatter
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+    def enqueue(self, record):
+        if self.pid != os.getpid():
+            self._start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                        "%d log records dropped (queue full)", (dropped,), None)
+            warning.request_id = None  # bypassed the handler's filters; the text format needs it
+            try:
+                self.queue.put_nowait(self.prepare(warning))
+            except queue.Full:
+                self.dropped += dropped
+
+    def _start(self):
+        with self.lock:  # Handler's own lock
+            if self.pid == os.getpid():
+                return
+            if self.pid is not None:  # forked: the parent's queue and thread are not ours
+                self.queue = queue.Queue(self.queue.maxsize)
+            self.pid = os.getpid()
+            self.listener = logging.handlers.QueueListener(self.queue, self.target)
+            self.listener.start()
+            atexit.register(self.listener.stop)  # flush what is queued on shutdown
+
+
+# ── middleware ─────────────────────────────────────────────────────────
+class RequestIdMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        incoming = request.headers.get("X-Request-ID", "")
+        rid = incoming if _INCOMING_ID.match(incoming) else uuid.uuid4().hex
+        request.request_id = rid
+        token = _request_id.set(rid)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_id.reset(token)
+        response["X-Request-ID"] = rid
+        return response
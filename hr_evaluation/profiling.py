@@ -0,0 +1,251 @@
+"""
+On-demand request profiling (admin-only API: /api/profiling/).
+
+• ``arm()`` stores a capture session in the cache: profile the next
+  ``count`` requests whose path matches ``path`` (a regex) and, optionally,
+  ``method``.  Workers pick it up through the default cache, which must be
+  shared (``CACHE_URL``: redis:// or db://) when several of them run; with
+  locmem:// only the worker that armed it would capture.
+• ``ProfilingMiddleware`` reads the session at most once every
+  ``PROFILING_POLL_SECONDS`` per process.  Between reads a request costs one
+  clock read, plus a regex match while a session is armed.
+• A profiled request runs next to a sampler thread.  Every ``interval_ms``
+  it snapshots the request thread's stack (``sys._current_frames``).  The
+  cost is per sample, not per call like cProfile, so timings stay close
+  to real ones, including time spent waiting on the database.  Every query
+  is timed through ``connection.execute_wrapper``, which gives the SQL
+  timeline.
+• A request claims a slot number with ``cache.add`` on the slot's key,
+  which is atomic on every backend (unlike ``incr`` on the database
+  cache), so concurrent workers never capture more than ``count``
+  requests.  Its result is cached under that number.  ``collapsed()``
+  merges the stacks of all captured requests into "frame;frame;… count"
+  lines, the input format of flamegraph.pl and speedscope.
+• Only the view and middleware run is covered.  The body of a streaming
+  response is produced after the capture ends.
+"""
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+SESSION_KEY = "profiling:session"
+RESULT_TIMEOUT = 60 * 60
+MAX_REQUESTS = 100
+MAX_QUERIES = 2000      # per request; later ones are only counted
+MAX_SQL_CHARS = 2000
+MAX_DEPTH = 200
+
+
+def _key(session_id, name):
+    return f"profiling:{session_id}:{name}"
+
+
+# ── sessions ───────────────────────────────────────────────────────────
+def arm(path, count, method=None, interval_ms=5):
+    """Start a capture session (replacing any current one)."""
+    re.compile(path)  # re.error → the caller's validation error
+    session = {
+        "id": uuid.uuid4().hex,
+        "path": path,
+        "method": method.upper() if method else None,
+        "count": count,
+        "interval_ms": interval_ms,
+        "armed_at": time.time(),
+        "stopped": False,
+    }
+    cache.set(SESSION_KEY, session, RESULT_TIMEOUT)
+    return session
+
+
+def disarm():
+    """Stop capturing; what was captured stays readable until it expires."""
+    session = cache.get(SESSION_KEY)
+    if session is not None and not session["stopped"]:
+        session["stopped"] = True
+        # take the free slots: workers that haven't polled yet can't claim them
+        cache.set_many({key: False for key in _slot_keys(session)}, RESULT_TIMEOUT)
+        cache.set(SESSION_KEY, session, max(1, int(session["armed_at"] + RESULT_TIMEOUT - time.time())))
+    return session
+
+
+def current():
+    return cache.get(SESSION_KEY)
+
+
+def _slot_keys(session):
+    return [_key(session["id"], f"slot:{slot}") for slot in range(1, session["count"] + 1)]
+
+
+def _claim(session):
+    """The first free slot (1-based) of `session`, or None once all are taken."""
+    keys = _slot_keys(session)
+    taken = cache.get_many(keys)
+    for slot, key in enumerate(keys, 1):
+        if key not in taken and cache.add(key, True, RESULT_TIMEOUT):  # lost a race → try the next
+            return slot
+    return None
+
+
+def captured(session):
+    """{slot: result} of the requests captured so far."""
+    keys = {_key(session["id"], f"request:{slot}"): slot for slot in range(1, session["count"] + 1)}
+    return {keys[key]: result for key, result in cache.get_many(list(keys)).items()}
+
+
+def collapsed(results):
+    """Stacks of all `results` merged, as collapsed-stack text."""
+    total = Counter()
+    for result in results:
+        total.update(result["stacks"])
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(total.items()))
+
+
+# ── capture ────────────────────────────────────────────────────────────
+_labels = {}
+
+
+def _label(code):
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label
+
+
+def _collapse(frame):
+    frames = []
+    while frame is not None and len(frames) < MAX_DEPTH:
+        frames.append(_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+class Sampler(threading.Thread):
+    """Counts the stacks of one thread, sampled every `interval` seconds."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name="profiling-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def stop(self):
+        self.done.set()
+        self.join()
+
+
+class QueryTimeline:
+    """`execute_wrapper` recording when each query ran and for how long."""
+
+    def __init__(self, started):
+        self.started = started
+        self.queries = []
+        self.count = 0
+        self.total = 0.0
+
+    def wrapper(self, alias):
+        def execute(run, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return run(sql, params, many, context)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.count += 1
+                self.total += elapsed
+                if len(self.queries) < MAX_QUERIES:
+                    self.queries.append({
+                        "at_ms": round((start - self.started) * 1000, 3),
+                        "ms": round(elapsed * 1000, 3),
+                        "alias": alias,
+                        "many": many,
+                        "sql": sql[:MAX_SQL_CHARS],
+                    })
+        return execute
+
+
+def capture(session, get_response, request):
+    """Run the request under the sampler and query timeline → (response, result)."""
+    started, wall = time.perf_counter(), time.time()
+    sampler = Sampler(threading.get_ident(), session["interval_ms"] / 1000)
+    timeline = QueryTimeline(started)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timeline.wrapper(connection.alias)))
+        sampler.start()
+        try:
+            response = get_response(request)
+        finally:
+            sampler.stop()
+    duration = time.perf_counter() - started
+    return response, {
+        "method": request.method,
+        "path": request.get_full_path(),
+        "status": response.status_code,
+        "started_at": wall,
+        "duration_ms": round(duration * 1000, 3),
+        "interval_ms": session["interval_ms"],
+        "samples": sum(sampler.stacks.values()),
+        "stacks": dict(sampler.stacks),
+        "query_count": timeline.count,
+        "query_ms": round(timeline.total * 1000, 3),
+        "queries": timeline.queries,
+    }
+
+
+# ── middleware ─────────────────────────────────────────────────────────
+@lru_cache(maxsize=32)
+def _pattern(path):
+    return re.compile(path)
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.next_check = 0.0
+        # (session, compiled path) or None, replaced as a whole: request
+        # threads never see a session paired with another session's pattern
+        self.armed = None
+
+    def _refresh(self):
+        self.next_check = time.monotonic() + settings.PROFILING_POLL_SECONDS
+        session = cache.get(SESSION_KEY)
+        if session is None or session["stopped"]:
+            self.armed = None
+        else:
+            self.armed = (session, _pattern(session["path"]))
+
+    def __call__(self, request):
+        if time.monotonic() >= self.next_check:
+            self._refresh()
+        armed = self.armed
+        if armed is None:
+            return self.get_response(request)
+        session, pattern = armed
+        if ((session["method"] and request.method != session["method"])
+                or not pattern.search(request.path_info)
+                or request.path_info.startswith("/api/profiling/")):
+            return self.get_response(request)
+
+        slot = _claim(session)
+        if slot is None:
+            self.armed = None  # used up; the next poll sees any new session
+            return self.get_response(request)
+        response, result = capture(session, self.get_response, request)
+        cache.set(_key(session["id"], f"request:{slot}"), result, RESULT_TIMEOUT)
+        return response
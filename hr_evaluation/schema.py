@@ -0,0 +1,129 @@
+"""
+Precomputed OpenAPI schema.
+
+``manage.py build_schema`` renders the drf-spectacular schema once at build
+time into ``SCHEMA_ARTIFACT_DIR/schema-<hash>.json.gz``.  The hash covers the
+URLconfs, views, serializers, models, filters, permissions and renderers,
+plus the effective ``REST_FRAMEWORK`` / ``SPECTACULAR_SETTINGS``.  Any change
+to them yields a new artifact name, so a stale file is never served.
+
+``cached_schema_view`` serves that artifact from memory (gzip bytes as-is when
+content negotiation picks gzip, see ``compression.choose``).  If no artifact matches the running code it renders
+the schema once per process and keeps it in memory instead.
+"""
+import gzip
+import hashlib
+import threading
+from importlib.metadata import version
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_safe
+
+from hr_evaluation import compression
+
+# files whose changes can alter the schema (relative to BASE_DIR)
+SCHEMA_SOURCES = (
+    "hr_evaluation/urls.py",
+    "accounts/urls.py",
+    "accounts/views.py",
+    "accounts/models.py",
+    "accounts/serializers/*.py",
+    "evaluation_app/urls/*.py",
+    "evaluation_app/views/*.py",
+    "evaluation_app/serializers/*.py",
+    "evaluation_app/models.py",
+    "evaluation_app/filters.py",       # query parameters (FullTextSearchFilter, PeriodRangeFilter)
+    "evaluation_app/permissions.py",   # security requirements / 403 responses
+    "evaluation_app/renderers.py",     # response media types
+)
+
+_lock = threading.Lock()
+_cached = None  # {"hash": str, "gz": bytes, "raw": bytes}, set once per process
+
+
+def source_hash():
+    """Short sha256 over the schema sources + drf-spectacular version."""
+    digest = hashlib.sha256(version("drf-spectacular").encode())
+    # renderer / auth / pagination classes are picked in settings, some by environment
+    for name in ("REST_FRAMEWORK", "SPECTACULAR_SETTINGS"):
+        digest.update(repr(sorted(getattr(settings, name, {}).items())).encode())
+    base = settings.BASE_DIR
+    for pattern in SCHEMA_SOURCES:
+        for path in sorted(base.glob(pattern)):
+            digest.update(str(path.relative_to(base)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def artifact_path(schema_hash):
+    return settings.SCHEMA_ARTIFACT_DIR / f"schema-{schema_hash}.json.gz"
+
+
+def render_schema():
+    """Run drf-spectacular's generator once and return the JSON bytes."""
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+def build_artifact():
+    """Write the gzip artifact for the current sources; drop stale ones."""
+    schema_hash = source_hash()
+    target = artifact_path(schema_hash)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(gzip.compress(render_schema(), compresslevel=9, mtime=0))
+    for stale in target.parent.glob("schema-*.json.gz"):
+        if stale != target:
+            stale.unlink()
+    return target
+
+
+def _load():
+    global _cached
+    if _cached is not None:
+        return _cached
+    with _lock:
+        if _cached is None:
+            schema_hash = source_hash()
+            path = artifact_path(schema_hash)
+            if path.exists():
+                gz = path.read_bytes()
+                raw = gzip.decompress(gz)
+            else:
+                # no build step ran (or code changed since): render once per process
+                raw = render_schema()
+                gz = gzip.compress(raw, compresslevel=6, mtime=0)
+            _cached = {"hash": schema_hash, "gz": gz, "raw": raw}
+    return _cached
+
+
+@require_safe
+def cached_schema_view(request):
+    """
+    Serve the OpenAPI schema as JSON (valid YAML too) from memory.
+    • ETag = source hash → swagger reloads get a 304.
+    • gzip artifact is sent untouched when negotiation picks gzip
+      (``gzip;q=0`` opts out); otherwise CompressionMiddleware encodes
+      the raw bytes with whatever it picks, if anything.
+    """
+    cached = _load()
+    etag = f'"{cached["hash"]}"'
+    if request.headers.get("If-None-Match") == etag:
+        return HttpResponseNotModified()
+
+    coding = compression.choose(request.headers.get("Accept-Encoding", ""))
+    if coding is not None and coding.name == "gzip":
+        response = HttpResponse(cached["gz"], content_type="application/vnd.oai.openapi+json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(cached["raw"], content_type="application/vnd.oai.openapi+json")
+    response["ETag"] = etag
+    response["Cache-Control"] = "public, max-age=300"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
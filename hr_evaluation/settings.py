@@ -13,9 +13,10 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
  
 from datetime import timedelta
+from importlib.util import find_spec
 import os
 import dj_database_url 
-from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
  
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -24,6 +25,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Load environment variables from .env file (for local development)
 env_file = BASE_DIR / ".env"
 if env_file.exists():
+    from dotenv import load_dotenv  # only needed locally; keeps cold starts lean
     load_dotenv(env_file)
 
 
@@ -42,7 +44,6 @@ DEBUG = os.environ.get("DEBUG", "false").lower() == "true"
  
 #ALLOWED_HOSTS = ['688463552f41.ngrok-free.app', 'localhost', '127.0.0.1']
 ALLOWED_HOSTS = ["*"]
-print("🔒 ALLOWED_HOSTS =", ALLOWED_HOSTS)
  
 # Application definition
 
@@ -50,8 +51,17 @@ raw = os.environ.get("CSRF_TRUSTED_ORIGINS", "")
 # split on commas, strip any whitespace
 CSRF_TRUSTED_ORIGINS = [url.strip() for url in raw.split(",") if url.strip()]
 
+# Lazy-loading mode (serverless): admin autodiscovery, the OpenAPI schema
+# and swagger are imported on their first hit instead of at cold start.
+LAZY_IMPORTS = os.environ.get("LAZY_IMPORTS", "false").lower() == "true"
+
+# Budget (ms) for importing the WSGI app + serving the first API request,
+# checked by `manage.py profile_startup`.
+COLD_START_TARGET_MS = int(os.environ.get("COLD_START_TARGET_MS", "800"))
+
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    # SimpleAdminConfig skips autodiscover(); hr_evaluation.admin_urls runs it on demand
+    'django.contrib.admin.apps.SimpleAdminConfig' if LAZY_IMPORTS else 'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -75,7 +85,53 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_THROTTLE_CLASSES": (
+        "evaluation_app.throttling.RoleRateThrottle",
+    ),
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
+# MessagePack (Accept: application/msgpack) when the optional package is installed
+if find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append("evaluation_app.renderers.MessagePackRenderer")
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append("evaluation_app.renderers.MessagePackParser")
+
+# Token-bucket throttles (evaluation_app.throttling): "<count>/<period>[:<burst>]".
+# THROTTLE_RATES[view.throttle_scope][role]; "*" is the fallback for both.
+THROTTLE_ENABLED = os.environ.get("THROTTLE_ENABLED", "true").lower() == "true"
+# Reverse proxies in front of the app (Vercel's edge = 1).  Client IPs are read
+# from that many X-Forwarded-For hops; 0 uses REMOTE_ADDR and ignores the header.
+REST_FRAMEWORK["NUM_PROXIES"] = int(os.environ.get("NUM_PROXIES", "1"))
+THROTTLE_STORE = os.environ.get("THROTTLE_STORE", "local")   # local | cache (shared)
+THROTTLE_RATES = {
+    "*": {
+        "*":    "600/min:120",
+        "EMP":  "240/min:60",
+        "ANON": "60/min:20",
+    },
+    "evaluations": {
+        "*":    "300/min:60",
+        "EMP":  "120/min:30",
+    },
+    "reports": {
+        "*":    "6/hour:2",
+    },
+}
+LOGIN_THROTTLE_RATES = {
+    "email": "10/hour:5",   # per submitted account
+    "ip":    "60/hour:20",
+}
+
+# Build-time OpenAPI artifact (manage.py build_schema), served by hr_evaluation.schema
+SCHEMA_ARTIFACT_DIR = BASE_DIR / "openapi"
 
 SIMPLE_JWT = {
     # use the actual primary‐key field name on your User model
@@ -91,7 +147,10 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    "hr_evaluation.profiling.ProfilingMiddleware",  # first, so a capture covers everything below
+    "hr_evaluation.log.RequestIdMiddleware",        # correlation id for every log line of the request
     "corsheaders.middleware.CorsMiddleware",
+    "hr_evaluation.compression.CompressionMiddleware",  # gzip / br / zstd; before anything touching the body
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",# for serving static files in production
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -149,10 +208,15 @@ WSGI_APPLICATION = 'hr_evaluation.wsgi.application'
 # Default to SQLite for development if no DATABASE_URL is provided
 default_db_url = "sqlite:///" + str(BASE_DIR / "db.sqlite3")
 
+# DB_POOL=true → psycopg_pool connection pool per worker (Django 5.1+ "pool"
+# option). Pooling replaces persistent connections, so CONN_MAX_AGE must be 0.
+DB_POOL = os.environ.get("DB_POOL", "false").lower() == "true"
+
 DATABASES = {
     'default': dj_database_url.config(
         default=os.environ.get("DATABASE_URL", default_db_url),
-        conn_max_age=600,
+        conn_max_age=0 if DB_POOL else int(os.environ.get("DB_CONN_MAX_AGE", "600")),
+        conn_health_checks=True,  # persistent conns: ping before reuse; pool: check on checkout
         ssl_require=True if not DEBUG else None
     )
 }
@@ -162,6 +226,107 @@ if 'postgresql' in DATABASES['default']['ENGINE']:
     DATABASES['default']['OPTIONS'] = {
         'sslmode': 'require',
     }
+    if DB_POOL:
+        DATABASES['default']['OPTIONS']['pool'] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "1")),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),        # wait for a free conn (s)
+            "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", "300")),     # close idle conns after (s)
+            "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", "1800")),
+        }
+
+# Cache shared by every worker: replica pins, capability sets, the analytics
+# version, throttle buckets and profiling sessions live here.
+#   redis://host:6379/0 → Redis (recommended; `pip install redis`)
+#   db://<table>        → DatabaseCache (the table is created by `migrate`)
+#   locmem://           → per process: a single dev server only
+CACHE_URL = os.environ.get("CACHE_URL") or ("locmem://" if DEBUG else "db://django_cache")
+if CACHE_URL.startswith(("redis://", "rediss://")):
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": CACHE_URL}}
+elif CACHE_URL.startswith("db://"):
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                          "LOCATION": CACHE_URL[len("db://"):] or "django_cache"}}
+elif CACHE_URL.startswith("locmem://"):
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+else:
+    raise ImproperlyConfigured(f"CACHE_URL must start with redis://, db:// or locmem:// (got {CACHE_URL!r}).")
+SHARED_CACHE = not CACHE_URL.startswith("locmem://")
+
+# Optional read replica: safe-method API reads go to it (hr_evaluation.db_router),
+# users who just wrote stay on the primary for REPLICA_STICKY_SECONDS.
+REPLICA_READ_PATHS = ("/api/",)
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", "5"))
+
+if os.environ.get("DATABASE_REPLICA_URL"):
+    if not SHARED_CACHE:  # a pin set by one worker must be seen by all of them
+        raise ImproperlyConfigured("DATABASE_REPLICA_URL needs a shared cache: set CACHE_URL to redis:// or db://.")
+    DATABASES['replica'] = dj_database_url.parse(
+        os.environ["DATABASE_REPLICA_URL"],
+        conn_max_age=DATABASES['default']['CONN_MAX_AGE'],
+        conn_health_checks=True,
+        ssl_require=True if not DEBUG else None
+    )
+    DATABASES['replica']['OPTIONS'] = dict(DATABASES['default'].get('OPTIONS', {}))
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ["hr_evaluation.db_router.ReplicaRouter"]
+    MIDDLEWARE.append("hr_evaluation.db_router.ReplicaRoutingMiddleware")
+
+# Cached analytics reports (evaluation_app.services.analytics); competency
+# changes invalidate them immediately, this bounds everything else.
+ANALYTICS_CACHE_SECONDS = int(os.environ.get("ANALYTICS_CACHE_SECONDS", "900"))
+
+# Archived evaluation snapshots (manage.py archive_evaluations); keep this on
+# persistent storage — stub rows point into these files.
+ARCHIVE_DIR = Path(os.environ.get("ARCHIVE_DIR") or BASE_DIR / "archive")
+
+# Logging (hr_evaluation.log): records are queued on the request path and
+# written to stderr by a background thread.  LOG_FORMAT=json → one JSON
+# object per line; LOG_DEBUG_SAMPLE_RATE keeps that fraction of requests'
+# DEBUG lines.
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "0.01"))
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "filters": {
+        "request_id": {"()": "hr_evaluation.log.RequestIdFilter"},
+        "sample_debug": {"()": "hr_evaluation.log.SamplingFilter", "rate": LOG_DEBUG_SAMPLE_RATE},
+    },
+    "formatters": {
+        "json": {"()": "hr_evaluation.log.JsonFormatter"},
+        "text": {"format": "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"},
+    },
+    "handlers": {
+        "queue": {
+            "class": "hr_evaluation.log.QueueHandler",
+            "filters": ["request_id", "sample_debug"],
+            "formatter": LOG_FORMAT,
+        },
+    },
+    "root": {"handlers": ["queue"], "level": LOG_LEVEL},
+    "loggers": {
+        # Django's own handlers would write synchronously; route through the queue instead
+        "django": {"handlers": ["queue"], "level": LOG_LEVEL, "propagate": False},
+    },
+}
+
+# How often each process checks for an armed profiling session (hr_evaluation.profiling).
+PROFILING_POLL_SECONDS = float(os.environ.get("PROFILING_POLL_SECONDS", "2"))
+
+# Responses smaller than this are sent uncompressed (hr_evaluation.compression).
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+
+# Processes rendering evaluation reports offline (`generate_reports`;
+# evaluation_app.services.reports).  Web requests render in-process.
+REPORT_WORKERS = int(os.environ.get("REPORT_WORKERS") or min(os.cpu_count() or 1, 4))
+# Most reports one /api/evaluations/reports/ request may render (in-process);
+# larger exports get a 400 and are narrowed or run through `generate_reports`.
+REPORT_SYNC_MAX = int(os.environ.get("REPORT_SYNC_MAX", "200"))
+
+# Webhook URLs must resolve to public addresses (evaluation_app.services.webhooks);
+# true lets a local receiver (localhost, 10.x, …) subscribe during development.
+WEBHOOK_ALLOW_PRIVATE_URLS = os.environ.get("WEBHOOK_ALLOW_PRIVATE_URLS", "false").lower() == "true"
 
 
  
@@ -14,16 +14,32 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
-from django.urls import path
+from django.conf import settings
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from django.views.generic import TemplateView
+from hr_evaluation.schema import cached_schema_view
+
+if settings.LAZY_IMPORTS:
+    # swagger / admin are imported on their first hit only
+    from hr_evaluation.lazy import lazy_include, lazy_view
+
+    docs_and_admin = [
+        path("swagger/", lazy_view("drf_spectacular.views.SpectacularSwaggerView", url_name="schema")),
+        lazy_include("admin/", "hr_evaluation.admin_urls", namespace="admin"),
+    ]
+else:
+    from django.contrib import admin
+    from drf_spectacular.views import SpectacularSwaggerView
+
+    docs_and_admin = [
+        path("swagger/", SpectacularSwaggerView.as_view(url_name="schema")),
+        path('admin/', admin.site.urls),
+    ]
 
 urlpatterns = [
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("swagger/", SpectacularSwaggerView.as_view(url_name="schema")),
-    path('admin/', admin.site.urls),
+    # precomputed + in-memory; see manage.py build_schema
+    path("api/schema/", cached_schema_view, name="schema"),
+    *docs_and_admin,
     path("api/", include("evaluation_app.urls.api")),
     path("", TemplateView.as_view(template_name="welcome.html"), name="home"),
     path("api/org/", include("evaluation_app.urls.org_apis")),